@@ -1,60 +1,324 @@
 """
-Utility script to clean up duplicate records from existing Excel files
-====================================================================
-This script removes duplicate records based on Name + District combination
+Utility script to clean up duplicate records from existing output files
+======================================================================
+This script removes duplicate records based on configurable key columns
+(Name + District by default, or e.g. Officer ID for v6 outputs).
+
+Files are processed in chunks so memory stays bounded on large archives:
+- CSV and Parquet are streamed into a temporary file that replaces the original
+- SQLite tables are scanned by rowid and duplicates are deleted in place
+- Excel workbooks cannot be read in chunks and are still loaded whole
+
+Duplicates are found by hashing the key columns of a whole chunk at once
+(pandas' vectorized row hashing) and checking the hashes against those already
+seen. Keys are compared as text, with integral numbers written without a
+decimal part, so an Officer ID that Excel or Parquet stores as a float matches
+the same ID read as text from CSV. Rows with an empty key are never treated as duplicates. Before a file is
+changed, a backup is made by copying the file (no re-serialization).
+
+Usage:
+    python cleanup_duplicates.py                                  # legacy v3/v4 workbooks
+    python cleanup_duplicates.py "archive/**/*.csv" out.parquet   # any files or globs
+    python cleanup_duplicates.py --keys "Officer ID" data.sqlite --table officers
+    python cleanup_duplicates.py --across-files "archive/*.csv"   # keep the first copy across all files
 """
-import pandas as pd
+import argparse
+import glob
 import os
+import shutil
+import sqlite3
 
-def remove_duplicates_from_excel(filename):
-    """Remove duplicates from Excel file and save cleaned version"""
+import numpy as np
+import pandas as pd
+
+DEFAULT_KEYS = ["Name", "District"]
+DEFAULT_CHUNK_SIZE = 50000
+LEGACY_FILES = [
+    "Judicial_Officers_MP_v3.xlsx",
+    "jo_mp.xlsx",
+    "judicial_officers_madhya_pradesh.xlsx"
+]
+SUPPORTED_EXTENSIONS = (".csv", ".parquet", ".sqlite", ".db", ".xlsx")
+
+
+class SeenKeys:
+    """Sorted array of 64-bit key hashes seen so far (8 bytes per unique key)"""
+
+    def __init__(self):
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def first_occurrences(self, hashes, valid):
+        """Boolean mask of rows to keep: first time their key is seen, or no key at all"""
+        keep = ~valid.copy()
+        candidates = hashes[valid]
+        positions = np.searchsorted(self.hashes, candidates)
+        positions[positions == len(self.hashes)] = 0
+        already_seen = (self.hashes[positions] == candidates) if len(self.hashes) else np.zeros(len(candidates), bool)
+        first_in_chunk = ~pd.Series(candidates).duplicated().to_numpy()
+        keep[valid] = first_in_chunk & ~already_seen
+        self.hashes = np.union1d(self.hashes, candidates)
+        return keep
+
+
+def key_text(value):
+    """Text of one key value; integral floats lose their ".0" so 1001.0 and "1001" match"""
+    if isinstance(value, (float, np.floating)) and value.is_integer():
+        return str(int(value))
+    return value
+
+
+def key_strings(column):
+    """A key column as trimmed strings, whatever dtype the file format gave it"""
+    if pd.api.types.is_float_dtype(column) or column.dtype == object:
+        column = column.map(key_text, na_action="ignore")
+    return column.astype("string").str.strip()
+
+
+def hash_keys(chunk, keys):
+    """(hashes, valid) of a chunk's key columns; rows with any empty key are not valid"""
+    key_frame = chunk[keys].apply(key_strings)
+    valid = (key_frame.notna() & (key_frame != "")).all(axis=1).to_numpy()
+    hashes = pd.util.hash_pandas_object(key_frame.fillna(""), index=False).to_numpy()
+    return hashes, valid
+
+
+def backup_path(filename):
+    stem, extension = os.path.splitext(filename)
+    return f"{stem}_backup{extension}"
+
+
+def make_backup(filename):
+    backup_filename = backup_path(filename)
+    print(f"💾 Creating backup: {backup_filename}")
+    shutil.copy2(filename, backup_filename)
+
+
+def check_keys(columns, keys, filename):
+    missing = [key for key in keys if key not in columns]
+    if missing:
+        raise KeyError(f"{filename} has no column(s) {', '.join(missing)}")
+
+
+def cleanup_csv(filename, keys, seen, chunk_size, dry_run):
+    """Stream a CSV file through the dedup filter; returns (original, removed)"""
+    temp_filename = filename + ".tmp"
+    original = removed = 0
+    header = True
+    try:
+        for chunk in pd.read_csv(filename, chunksize=chunk_size, dtype=str, keep_default_na=False):
+            check_keys(chunk.columns, keys, filename)
+            keep = seen.first_occurrences(*hash_keys(chunk, keys))
+            original += len(chunk)
+            removed += int((~keep).sum())
+            if not dry_run:
+                chunk[keep].to_csv(temp_filename, mode="w" if header else "a", header=header, index=False)
+                header = False
+        if removed and not dry_run:
+            make_backup(filename)
+            os.replace(temp_filename, filename)
+    finally:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+    return original, removed
+
+
+def cleanup_parquet(filename, keys, seen, chunk_size, dry_run):
+    """Stream a Parquet file batch by batch (requires pyarrow); returns (original, removed)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    source = pq.ParquetFile(filename)
+    check_keys(source.schema_arrow.names, keys, filename)
+    temp_filename = filename + ".tmp"
+    writer = None
+    original = removed = 0
+    try:
+        for batch in source.iter_batches(batch_size=chunk_size):
+            chunk = batch.to_pandas()
+            keep = seen.first_occurrences(*hash_keys(chunk, keys))
+            original += len(chunk)
+            removed += int((~keep).sum())
+            if not dry_run:
+                if writer is None:
+                    writer = pq.ParquetWriter(temp_filename, source.schema_arrow)
+                writer.write_table(pa.Table.from_batches([batch]).filter(pa.array(keep)))
+        if writer is not None:
+            writer.close()
+            writer = None
+        if removed and not dry_run:
+            make_backup(filename)
+            os.replace(temp_filename, filename)
+    finally:
+        if writer is not None:
+            writer.close()
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+    return original, removed
+
+
+def quote_identifier(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def sqlite_table(connection, table, filename):
+    tables = [name for (name,) in connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+    )]
+    if table:
+        if table not in tables:
+            raise KeyError(f"{filename} has no table {table}")
+        return table
+    if len(tables) != 1:
+        raise KeyError(f"{filename} has tables {', '.join(tables) or '(none)'}; choose one with --table")
+    return tables[0]
+
+
+def cleanup_sqlite(filename, keys, seen, chunk_size, dry_run, table=None):
+    """Scan a SQLite table by rowid (key columns only) and delete duplicates in place"""
+    connection = sqlite3.connect(filename)
+    try:
+        table = sqlite_table(connection, table, filename)
+        columns = [row[1] for row in connection.execute(f"PRAGMA table_info({quote_identifier(table)})")]
+        check_keys(columns, keys, filename)
+        select = (f"SELECT rowid AS rowid_, {', '.join(quote_identifier(key) for key in keys)} "
+                  f"FROM {quote_identifier(table)} WHERE rowid > ? ORDER BY rowid LIMIT ?")
+        duplicates = []
+        original, last_rowid = 0, -1
+        while True:
+            chunk = pd.read_sql_query(select, connection, params=(last_rowid, chunk_size))
+            if chunk.empty:
+                break
+            keep = seen.first_occurrences(*hash_keys(chunk, keys))
+            duplicates.append(chunk["rowid_"].to_numpy()[~keep])
+            original += len(chunk)
+            last_rowid = int(chunk["rowid_"].iloc[-1])
+        duplicate_rowids = np.concatenate(duplicates) if duplicates else np.empty(0, dtype=np.int64)
+
+        if len(duplicate_rowids) and not dry_run:
+            connection.close()
+            make_backup(filename)
+            connection = sqlite3.connect(filename)
+            with connection:
+                connection.executemany(
+                    f"DELETE FROM {quote_identifier(table)} WHERE rowid = ?",
+                    ((int(rowid),) for rowid in duplicate_rowids),
+                )
+        return original, len(duplicate_rowids)
+    finally:
+        connection.close()
+
+
+def cleanup_excel(filename, keys, seen, chunk_size, dry_run):
+    """Excel has no chunked reader; the workbook is loaded whole"""
+    df = pd.read_excel(filename)
+    check_keys(df.columns, keys, filename)
+    keep = seen.first_occurrences(*hash_keys(df, keys))
+    removed = int((~keep).sum())
+    if removed and not dry_run:
+        make_backup(filename)
+        df[keep].to_excel(filename, index=False)
+    return len(df), removed
+
+
+CLEANERS = {
+    ".csv": cleanup_csv,
+    ".parquet": cleanup_parquet,
+    ".sqlite": cleanup_sqlite,
+    ".db": cleanup_sqlite,
+    ".xlsx": cleanup_excel,
+}
+
+
+def cleanup_file(filename, keys=None, seen=None, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False, table=None):
+    """Remove duplicate records from one file; returns (original, removed) or None if skipped
+
+    Pass the same `seen` to several calls to keep only the first copy of a record across files.
+    """
+    keys = keys or DEFAULT_KEYS
+    seen = seen if seen is not None else SeenKeys()
     if not os.path.exists(filename):
         print(f"❌ File {filename} not found!")
-        return
-    
-    print(f"🔍 Analyzing {filename}...")
-    
-    # Load data
-    df = pd.read_excel(filename)
-    original_count = len(df)
-    print(f"📊 Original records: {original_count}")
-    
-    # Remove duplicates based on Name and District
-    df_cleaned = df.drop_duplicates(subset=['Name', 'District'], keep='first')
-    cleaned_count = len(df_cleaned)
-    duplicates_removed = original_count - cleaned_count
-    
-    if duplicates_removed > 0:
-        print(f"🧹 Removed {duplicates_removed} duplicate records")
-        print(f"✅ Clean records: {cleaned_count}")
-        
-        # Save cleaned version
-        backup_filename = filename.replace('.xlsx', '_backup.xlsx')
-        print(f"💾 Creating backup: {backup_filename}")
-        df.to_excel(backup_filename, index=False)
-        
-        print(f"💾 Saving cleaned data to: {filename}")
-        df_cleaned.to_excel(filename, index=False)
-        
-        print("🎉 Cleanup completed successfully!")
+        return None
+    extension = os.path.splitext(filename)[1].lower()
+    cleaner = CLEANERS.get(extension)
+    if cleaner is None:
+        print(f"⚠️ Skipping {filename}: unsupported format (use {', '.join(SUPPORTED_EXTENSIONS)})")
+        return None
+
+    print(f"🔍 Analyzing {filename} (keys: {', '.join(keys)})...")
+    try:
+        if cleaner is cleanup_sqlite:
+            original, removed = cleaner(filename, keys, seen, chunk_size, dry_run, table=table)
+        else:
+            original, removed = cleaner(filename, keys, seen, chunk_size, dry_run)
+    except ImportError as e:
+        print(f"⚠️ Skipping {filename}: {e}")
+        return None
+    except KeyError as e:
+        print(f"⚠️ Skipping {filename}: {e.args[0]}")
+        return None
+
+    print(f"📊 Original records: {original}")
+    if removed > 0:
+        print(f"🧹 {'Would remove' if dry_run else 'Removed'} {removed} duplicate records")
+        print(f"✅ Clean records: {original - removed}")
     else:
         print("✅ No duplicates found. File is already clean!")
+    return original, removed
+
+
+def remove_duplicates_from_excel(filename, keys=None):
+    """Remove duplicates from Excel file and save cleaned version"""
+    return cleanup_file(filename, keys=keys)
+
+
+def expand_paths(patterns):
+    """Files matching the given paths/globs, in order, without duplicates (globs skip earlier backups)"""
+    paths = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = [path for path in sorted(glob.glob(pattern, recursive=True))
+                       if not os.path.splitext(path)[0].endswith("_backup")]
+        else:
+            matches = [pattern]
+        paths.extend(path for path in matches if path not in paths)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", help="files or glob patterns (default: the legacy v3/v4 workbooks)")
+    parser.add_argument("--keys", default=",".join(DEFAULT_KEYS),
+                        help="comma-separated key columns (default: %(default)s, e.g. 'Officer ID')")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows per chunk")
+    parser.add_argument("--table", help="SQLite table to clean (default: the only table)")
+    parser.add_argument("--across-files", action="store_true",
+                        help="treat all files as one dataset and keep only the first copy of each record")
+    parser.add_argument("--dry-run", action="store_true", help="report duplicates without changing files")
+    args = parser.parse_args()
+
+    keys = [key.strip() for key in args.keys.split(",") if key.strip()]
+    paths = expand_paths(args.paths) if args.paths else [name for name in LEGACY_FILES if os.path.exists(name)]
 
-if __name__ == "__main__":
-    # Clean up the v3 output file if it exists
-    cleanup_files = [
-        "Judicial_Officers_MP_v3.xlsx",
-        "jo_mp.xlsx", 
-        "judicial_officers_madhya_pradesh.xlsx"
-    ]
-    
     print("=" * 60)
     print("🧹 Duplicate Cleanup Utility for Judicial Officers Data")
     print("=" * 60)
-    
-    for filename in cleanup_files:
-        if os.path.exists(filename):
-            remove_duplicates_from_excel(filename)
-            print("-" * 60)
-    
+
+    shared_seen = SeenKeys() if args.across_files else None
+    total_original = total_removed = processed = 0
+    for filename in paths:
+        result = cleanup_file(filename, keys, seen=shared_seen, chunk_size=args.chunk_size,
+                              dry_run=args.dry_run, table=args.table)
+        if result:
+            processed += 1
+            total_original += result[0]
+            total_removed += result[1]
+        print("-" * 60)
+
+    print(f"📁 Files processed: {processed}/{len(paths)}")
+    print(f"🧹 Duplicates {'found' if args.dry_run else 'removed'}: {total_removed} of {total_original} records")
     print("🏁 Cleanup process completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Checks for cleanup_duplicates on each supported format (python -m pytest)"""
+import os
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from cleanup_duplicates import SeenKeys, backup_path, cleanup_file
+
+KEYS = ["Officer ID"]
+# Duplicates of 1001 and 1003 sit in later chunks than their first copies at chunk_size=2
+RECORDS = pd.DataFrame({
+    "Officer ID": ["1001", "1002", "1003", "1001", "1004", "1003", ""],
+    "Name": ["Asha Rao", "Vikram Singh", "Meena Das", "Asha Rao", "Ravi Jain", "Meena Das", "Vacant"],
+})
+KEPT_IDS = ["1001", "1002", "1003", "1004", ""]
+
+
+def read_ids(path, reader=pd.read_csv):
+    return reader(path, dtype=str, keep_default_na=False)["Officer ID"].tolist()
+
+
+def test_csv_duplicates_across_chunk_boundaries(tmp_path):
+    path = str(tmp_path / "officers.csv")
+    RECORDS.to_csv(path, index=False)
+
+    assert cleanup_file(path, KEYS, chunk_size=2) == (7, 2)
+    assert read_ids(path) == KEPT_IDS
+    assert read_ids(backup_path(path)) == RECORDS["Officer ID"].tolist()
+
+
+def test_dry_run_leaves_the_file_alone(tmp_path):
+    path = str(tmp_path / "officers.csv")
+    RECORDS.to_csv(path, index=False)
+
+    assert cleanup_file(path, KEYS, chunk_size=2, dry_run=True) == (7, 2)
+    assert read_ids(path) == RECORDS["Officer ID"].tolist()
+    assert not os.path.exists(backup_path(path))
+
+
+def test_parquet_float_ids_across_chunk_boundaries(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "officers.parquet")
+    ids = [1001.0, 1002.0, 1001.0, 1003.0, 1002.0]
+    pd.DataFrame({"Officer ID": ids, "Name": list("ABACB")}).to_parquet(path, index=False)
+
+    assert cleanup_file(path, KEYS, chunk_size=2) == (5, 2)
+    assert pd.read_parquet(path)["Officer ID"].tolist() == [1001.0, 1002.0, 1003.0]
+
+
+def test_sqlite_deletes_duplicates_in_later_chunks(tmp_path):
+    path = str(tmp_path / "officers.sqlite")
+    connection = sqlite3.connect(path)
+    RECORDS.to_sql("officers", connection, index=False)
+    connection.close()
+
+    assert cleanup_file(path, KEYS, chunk_size=2) == (7, 2)
+    connection = sqlite3.connect(path)
+    try:
+        rows = connection.execute('SELECT "Officer ID" FROM officers ORDER BY rowid').fetchall()
+    finally:
+        connection.close()
+    assert [officer_id for (officer_id,) in rows] == KEPT_IDS
+
+
+def test_sqlite_integer_ids_match_text_ids(tmp_path):
+    path = str(tmp_path / "officers.sqlite")
+    connection = sqlite3.connect(path)
+    connection.execute('CREATE TABLE officers ("Officer ID", Name)')
+    connection.executemany("INSERT INTO officers VALUES (?, ?)", [(1001, "A"), ("1001", "A"), (1002, "B")])
+    connection.commit()
+    connection.close()
+
+    assert cleanup_file(path, KEYS, chunk_size=1) == (3, 1)
+
+
+def test_excel_duplicates_are_removed(tmp_path):
+    path = str(tmp_path / "officers.xlsx")
+    RECORDS.to_excel(path, index=False)
+
+    assert cleanup_file(path, KEYS) == (7, 2)
+    assert read_ids(path, pd.read_excel) == KEPT_IDS
+
+
+def test_excel_float_ids_match_csv_ids_across_files(tmp_path):
+    # pandas reads a numeric Officer ID column with blanks from Excel as floats
+    workbook = str(tmp_path / "officers.xlsx")
+    pd.DataFrame({"Officer ID": [1001, None, 1002], "Name": ["A", "Vacant", "B"]}).to_excel(workbook, index=False)
+    csv_path = str(tmp_path / "later.csv")
+    pd.DataFrame({"Officer ID": ["1002", "1003", "1001"], "Name": ["B", "C", "A"]}).to_csv(csv_path, index=False)
+    seen = SeenKeys()
+
+    assert cleanup_file(workbook, KEYS, seen=seen) == (3, 0)
+    assert cleanup_file(csv_path, KEYS, seen=seen, chunk_size=1) == (3, 2)
+    assert read_ids(csv_path) == ["1003"]
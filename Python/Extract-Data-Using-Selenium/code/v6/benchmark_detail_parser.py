@@ -0,0 +1,127 @@
+"""
+Benchmark and Fuzz: jinfo detail parser
+=======================================
+Times detail_parser.parse_officer_details against the legacy per-line
+`if "X" in line` chain and fuzzes it, without Selenium.
+
+    python benchmark_detail_parser.py                      # 20k site-format blocks
+    python benchmark_detail_parser.py --blocks 100000 --seed 7
+    python benchmark_detail_parser.py --recorded recorded_jinfo/   # *.txt detail blocks
+
+Timings and the agreement between both parsers are measured on blocks in the
+site's own layout (the #jinfo table as rendered by the replay server, which the
+legacy parser was written for), or on recorded blocks. Separately, variant
+blocks with other label spellings, separators, numbering, field order and
+missing fields are checked against the values they were built from; only the
+new parser is expected to read those. The fuzz pass feeds random text and
+mutated blocks and only requires that parsing never raises and returns strings.
+"""
+import argparse
+import glob
+import os
+import random
+import string
+import time
+
+from detail_fixtures import legacy_parse, site_blocks
+from detail_parser import LABEL_TABLE, parse_officer_details
+
+
+def make_block(rng, index):
+    """Return (detail_text, expected_dict) for one synthetic officer"""
+    values = {
+        "Designation": rng.choice(["Civil Judge Class-II", "District Judge", "Addl. District Judge"]),
+        "Date of Present Posting": f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(2000, 2025)}",
+        "Father/Mother/Husband Name": f"Shri Parent {index}",
+        "Join in Judicial": f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1990, 2024)}",
+        "Current District": f"District {index % 52}",
+        "Current Taluka": f"Taluka {index % 300}",
+        "E-mail ID": f"officer{index}@mphc.gov.in",
+    }
+    lines, expected = [f"Name Shri Officer {index}"], {}
+    entries = [(column, labels) for _, column, labels in LABEL_TABLE]
+    rng.shuffle(entries)
+    for number, (column, labels) in enumerate(entries, 1):
+        if rng.random() < 0.1:
+            continue  # Field missing from this block
+        label = rng.choice(labels)
+        separator = rng.choice([" ", " : ", ": ", " - ", "\t"])
+        prefix = rng.choice(["", "", f"{number}. "])
+        lines.append(f"{prefix}{label}{separator}{values[column]}")
+        expected[column] = values[column]
+    if rng.random() < 0.3:
+        lines.insert(rng.randrange(len(lines) + 1), "  ")
+    return "\n".join(lines), expected
+
+
+def fuzz(rng, blocks, rounds):
+    alphabet = string.printable + "ऀआइईउ:/-'"
+    for _ in range(rounds):
+        if rng.random() < 0.5:
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 400)))
+        else:
+            text = list(rng.choice(blocks))
+            for _ in range(rng.randint(1, 10)):
+                pos = rng.randrange(len(text) + 1)
+                text.insert(pos, rng.choice(alphabet))
+            text = "".join(text)
+        result = parse_officer_details(text)
+        assert all(isinstance(v, str) and v for v in result.values()), (text, result)
+
+
+def time_parser(parser, blocks, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for block in blocks:
+            parser(block)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load_recorded(path):
+    blocks = []
+    for filename in sorted(glob.glob(os.path.join(path, "*.txt"))):
+        with open(filename, "r", encoding="utf-8") as f:
+            blocks.append(f.read())
+    return blocks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--blocks", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--fuzz-rounds", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--recorded", help="directory of recorded detail blocks (*.txt)")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if args.recorded:
+        blocks = load_recorded(args.recorded)
+        print(f"📂 Loaded {len(blocks)} recorded detail blocks from {args.recorded}")
+    else:
+        blocks = site_blocks(args.blocks, args.seed)
+        print(f"🧪 Generated {len(blocks)} detail blocks in the site's layout")
+
+    agree = sum(parse_officer_details(block) == legacy_parse(block) for block in blocks)
+    print(f"  🤝 Parsers agree on {agree}/{len(blocks)} blocks")
+
+    new_time = time_parser(parse_officer_details, blocks, args.repeat)
+    legacy_time = time_parser(legacy_parse, blocks, args.repeat)
+    per_block = 1e6 / max(len(blocks), 1)
+    print(f"  ⏱️  Table-driven parser: {new_time:.3f}s ({new_time * per_block:.1f} µs/block)")
+    print(f"  ⏱️  Legacy parser:       {legacy_time:.3f}s ({legacy_time * per_block:.1f} µs/block)")
+    print(f"  📊 Table-driven / legacy time: {new_time / legacy_time:.2f}x")
+
+    variants = [make_block(rng, i) for i in range(args.blocks)]
+    variant_ok = sum(parse_officer_details(text) == values for text, values in variants)
+    print(f"  ✅ Variant spellings/layouts read correctly: {variant_ok}/{len(variants)}")
+    assert variant_ok == len(variants), "Table-driven parser missed variant fields"
+
+    fuzz(rng, blocks + [text for text, _ in variants] or [""], args.fuzz_rounds)
+    print(f"  🎲 Fuzzed {args.fuzz_rounds} inputs without errors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark: "Update only N/A values" merge
+=========================================
+Compares the legacy nested-scan merge with the hash-indexed merge in
+record_store.py on synthetic datasets.
+
+    python benchmark_merge.py                  # 10k and 100k rows
+    python benchmark_merge.py --sizes 50000 --legacy-max 20000
+"""
+import argparse
+import copy
+import random
+import time
+
+from record_store import OfficerIndex, flatten_partitions, merge_na_values, partition_by_district
+
+FIELDS = [
+    "Designation", "Date of Present Posting", "Father/Mother/Husband Name",
+    "Join in Judicial", "Current District", "Current Taluka", "E-mail ID",
+]
+DISTRICTS = 52
+
+
+def make_dataset(size, seed=42):
+    """Return (existing, new_by_district): existing rows with gaps, and a re-scrape of them"""
+    rng = random.Random(seed)
+    existing, new_by_district = [], {}
+    for i in range(size):
+        district = f"District {i % DISTRICTS}"
+        record = {
+            "S.No": str(i // DISTRICTS + 1),
+            "Name": f"Officer {i}",
+            "District": district,
+            "Officer ID": str(100000 + i),
+        }
+        for field in FIELDS:
+            record[field] = f"{field} {i}"
+        fresh = dict(record)
+        for field in FIELDS:
+            if rng.random() < 0.2:
+                record[field] = "N/A"
+        existing.append(record)
+        new_by_district.setdefault(district, []).append(fresh)
+
+    # About 5% of officers are new in the re-scrape
+    for j in range(size // 20):
+        i = size + j
+        district = f"District {i % DISTRICTS}"
+        fresh = {"S.No": "0", "Name": f"Officer {i}", "District": district, "Officer ID": str(100000 + i)}
+        fresh.update({field: f"{field} {i}" for field in FIELDS})
+        new_by_district[district].append(fresh)
+    return existing, new_by_district
+
+
+def legacy_merge(all_officers, district_officers):
+    """The v6.0 nested linear scan on (Name, District)"""
+    for new_officer in district_officers:
+        key = (new_officer['Name'], new_officer['District'])
+        found = False
+        for existing_officer in all_officers:
+            if (existing_officer['Name'], existing_officer['District']) == key:
+                for k, v in new_officer.items():
+                    if existing_officer.get(k) == "N/A":
+                        existing_officer[k] = v
+                found = True
+                break
+        if not found:
+            all_officers.append(new_officer)
+
+
+def indexed_merge(partitions, new_by_district):
+    index = OfficerIndex(flatten_partitions(partitions))
+    for district_officers in new_by_district.values():
+        merge_na_values(partitions, index, district_officers)
+
+
+def record_order(record):
+    return (record["District"], record["Name"])
+
+
+def run(size, legacy_max):
+    existing, new_by_district = make_dataset(size)
+    print(f"\n📊 {size:,} existing rows, {sum(map(len, new_by_district.values())):,} re-scraped rows")
+
+    partitions = partition_by_district(copy.deepcopy(existing))
+    start = time.perf_counter()
+    indexed_merge(partitions, new_by_district)
+    indexed_time = time.perf_counter() - start
+    data = flatten_partitions(partitions)
+    print(f"  ⚡ Indexed merge: {indexed_time:.3f}s ({len(data):,} rows after merge)")
+
+    if size > legacy_max:
+        print(f"  ⏭️  Legacy merge skipped (size > --legacy-max {legacy_max:,})")
+        return
+
+    legacy_data = copy.deepcopy(existing)
+    start = time.perf_counter()
+    for district_officers in new_by_district.values():
+        legacy_merge(legacy_data, district_officers)
+    legacy_time = time.perf_counter() - start
+    print(f"  🐢 Legacy merge:  {legacy_time:.3f}s ({len(legacy_data):,} rows after merge)")
+    print(f"  🚀 Speedup: {legacy_time / indexed_time:.0f}x")
+    assert sorted(legacy_data, key=record_order) == sorted(data, key=record_order), \
+        "Indexed merge differs from legacy merge"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--legacy-max", type=int, default=10000,
+                        help="largest size to run the quadratic legacy merge on")
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.legacy_max)
+
+
+if __name__ == "__main__":
+    main()
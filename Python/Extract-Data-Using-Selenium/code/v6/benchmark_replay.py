@@ -0,0 +1,142 @@
+"""
+Benchmark: end-to-end extraction against the replay server
+==========================================================
+Runs extraction.extract_judicial_officers (overwrite mode) against a local
+replay of the judicial officers site, so speed changes can be compared run to
+run on the same fixture without touching mphc.gov.in.
+
+    python benchmark_replay.py --generate 10x25 --latency 0.05
+    python benchmark_replay.py --fixture fixtures/sample_site.json --runs 3 --detail-mode modal
+    python benchmark_replay.py --generate 10x25 --mode CONSERVATIVE --results results.jsonl
+
+Each run reports officers/minute and the time spent sleeping, waiting on the
+page, in WebDriver round trips and saving output, checks the records against
+the fixture, and appends one JSON line to the results file.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import extraction
+from detail_parser import parse_officer_details
+from http_details import details_html_to_text
+from replay_server import ReplayServer, generate_fixture, load_fixture, parse_size
+from table_parser import parse_officer_table
+
+
+def fixture_digest(fixture):
+    return hashlib.sha1(json.dumps(fixture, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+def expected_records(fixture):
+    """{Officer ID: (district, details)} the extractor should produce for a fixture"""
+    expected = {}
+    for district in fixture["districts"]:
+        for table_row in parse_officer_table(fixture["tables"].get(district, "")):
+            html = fixture["jinfo"].get(table_row["Officer ID"], "")
+            expected[table_row["Officer ID"]] = (district, parse_officer_details(details_html_to_text(html)))
+    return expected
+
+
+def count_mismatches(records, expected):
+    """Number of expected officers missing, misplaced or with different details"""
+    by_id = {record["Officer ID"]: record for record in records}
+    mismatches = 0
+    for officer_id, (district, details) in expected.items():
+        record = by_id.get(officer_id)
+        if record is None or record["District"] != district:
+            mismatches += 1
+        elif any(record.get(column) != value for column, value in details.items()):
+            mismatches += 1
+    return mismatches
+
+
+def run_once(server, expected, workdir):
+    """Run one extraction in `workdir` and return its timing row"""
+    tracker = extraction.PerformanceTracker()
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        start = time.perf_counter()
+        records = extraction.extract_judicial_officers(choice=1, base_url=server.base_url, tracker=tracker)
+        elapsed = time.perf_counter() - start
+    finally:
+        os.chdir(cwd)
+    stats = tracker.get_stats()
+    return {
+        "officers": len(records),
+        "elapsed_s": round(elapsed, 3),
+        "officers_per_min": round(len(records) / elapsed * 60, 1) if elapsed > 0 else 0.0,
+        "sleep_s": round(stats["sleep_time"], 3),
+        "wait_s": round(stats["wait_time"], 3),
+        "webdriver_s": round(stats["webdriver_time"], 3),
+        "save_s": round(stats["save_time"], 3),
+        "first_page_s": round(stats["first_page_time"] or 0.0, 3),
+        "blocked_requests": stats["resources"]["blocked_requests"],
+        "loaded_kb": round(stats["resources"]["loaded_bytes"] / 1024, 1),
+        "mismatches": count_mismatches(records, expected),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--fixture", help="fixture JSON with recorded pages")
+    source.add_argument("--generate", type=parse_size, metavar="DISTRICTSxOFFICERS",
+                        help="synthetic site, e.g. 10x25")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every page request")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--mode", choices=["FAST", "CONSERVATIVE"], default=extraction.WAIT_POLICY.name)
+    parser.add_argument("--detail-mode", choices=["http", "page", "modal"], default=extraction.DETAIL_FETCH_MODE)
+    parser.add_argument("--district-mode", choices=["http", "dropdown"], default=extraction.DISTRICT_FETCH_MODE)
+    parser.add_argument("--results", default="benchmark_results.jsonl", help="JSON lines file to append to")
+    args = parser.parse_args()
+
+    fixture = load_fixture(args.fixture) if args.fixture else generate_fixture(*args.generate, seed=args.seed)
+    expected = expected_records(fixture)
+    extraction.WAIT_POLICY = extraction.FAST_POLICY if args.mode == "FAST" else extraction.CONSERVATIVE_POLICY
+    extraction.DETAIL_FETCH_MODE = args.detail_mode
+    extraction.DISTRICT_FETCH_MODE = args.district_mode
+
+    settings = {
+        "fixture": args.fixture or f"generated:{args.generate[0]}x{args.generate[1]}:seed{args.seed}",
+        "fixture_sha1": fixture_digest(fixture),
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "mode": args.mode,
+        "detail_mode": args.detail_mode,
+        "district_mode": args.district_mode,
+    }
+    print(f"🧪 Replay benchmark: {len(fixture['districts'])} districts, {len(expected)} officers | {settings}")
+
+    rows = []
+    with ReplayServer(fixture, latency=args.latency, jitter=args.jitter) as server:
+        for run in range(args.runs):
+            workdir = tempfile.mkdtemp(prefix="replay_bench_")
+            try:
+                row = dict(settings, run=run + 1, timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
+                           **run_once(server, expected, workdir))
+            finally:
+                shutil.rmtree(workdir, ignore_errors=True)
+            rows.append(row)
+            with open(args.results, "a", encoding="utf-8") as f:
+                f.write(json.dumps(row) + "\n")
+
+    print("\n" + "=" * 80)
+    print(f"{'run':>3} {'officers':>8} {'off/min':>9} {'total s':>8} {'start s':>8} {'sleep s':>8} "
+          f"{'wait s':>8} {'webdrv s':>9} {'save s':>7} {'wrong':>6}")
+    for row in rows:
+        print(f"{row['run']:>3} {row['officers']:>8} {row['officers_per_min']:>9.1f} {row['elapsed_s']:>8.1f} "
+              f"{row['first_page_s']:>8.1f} {row['sleep_s']:>8.1f} {row['wait_s']:>8.1f} {row['webdriver_s']:>9.1f} "
+              f"{row['save_s']:>7.2f} {row['mismatches']:>6}")
+    print(f"📄 Results appended to {args.results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Detail blocks and the legacy detail parser, shared by benchmark_detail_parser and its tests"""
+from http_details import details_html_to_text
+from replay_server import generate_fixture
+
+
+def legacy_parse(details_text):
+    """The v6.0 per-line parser from get_officer_details"""
+    details = {}
+    if details_text:
+        lines = [line.strip() for line in details_text.split('\n') if line.strip()]
+        for line in lines:
+            if "Designation" in line:
+                details["Designation"] = line.split("Designation")[-1].strip()
+            elif "Present Posting" in line:
+                details["Date of Present Posting"] = line.split("Date of Present Posting")[-1].strip()
+            elif "Father" in line or "Mother" in line or "Husband" in line:
+                details["Father/Mother/Husband Name"] = line.split("Father/Mother/Husband Name")[-1].strip()
+            elif "Join in Judicial" in line:
+                details["Join in Judicial"] = line.split("Join in Judicial")[-1].strip()
+            elif "Current District" in line:
+                details["Current District"] = line.split("Current District")[-1].strip()
+            elif "Current Taluka" in line:
+                details["Current Taluka"] = line.split("Current Taluka")[-1].strip()
+            elif "E-mail" in line:
+                details["E-mail ID"] = line.split("E-mail ID")[-1].strip()
+    return details
+
+
+def site_blocks(count, seed):
+    """Detail blocks in the site's layout: the replay fixture's #jinfo tables as text"""
+    fixture = generate_fixture(districts=max(1, count // 25), officers=25, seed=seed)
+    blocks = [details_html_to_text(html) for html in fixture["jinfo"].values()]
+    return (blocks * (count // max(len(blocks), 1) + 1))[:count]
@@ -0,0 +1,93 @@
+"""
+Officer Detail Parser
+=====================
+Parses the text of the #jinfo officer detail block (modal text or HTTP
+response converted to the same line layout) in a single pass over the whole
+block, using one precompiled pattern built from a label table.
+
+Compared with the per-line `if "X" in line` chain it replaces:
+- labels are matched only at the start of a line (after optional "1." numbering)
+  and only as a whole label, so a "Father's Name" line is captured as the
+  relation name instead of being split on a label it does not contain
+- alternative spellings ("Email ID", "Father's Name", ...) and ":"/"-" separators
+  are accepted; matching stays case-sensitive, like the old `in` checks
+- a label line without a value is ignored instead of storing an empty string
+- as before, the last occurrence of a label wins
+
+It is about as fast as the old chain (a few microseconds per block either way;
+see benchmark_detail_parser.py); the change is for correctness.
+"""
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class OfficerDetails:
+    """Personal details of one officer; missing fields are None"""
+    designation: Optional[str] = None
+    date_of_present_posting: Optional[str] = None
+    relation_name: Optional[str] = None
+    join_in_judicial: Optional[str] = None
+    current_district: Optional[str] = None
+    current_taluka: Optional[str] = None
+    email: Optional[str] = None
+
+    def to_dict(self):
+        """Return the present fields keyed by their output column names"""
+        return {
+            column: getattr(self, field)
+            for field, column in COLUMN_NAMES.items()
+            if getattr(self, field) is not None
+        }
+
+
+# (record field, output column, accepted label spellings)
+LABEL_TABLE = [
+    ("designation", "Designation", ["Designation"]),
+    ("date_of_present_posting", "Date of Present Posting",
+     ["Date of Present Posting", "Present Posting Date", "Present Posting"]),
+    ("relation_name", "Father/Mother/Husband Name",
+     ["Father/Mother/Husband Name", "Father/Mother/Husband's Name", "Father/Mother/Husband",
+      "Father's Name", "Fathers Name", "Father Name", "Mother's Name", "Mother Name",
+      "Husband's Name", "Husband Name"]),
+    ("join_in_judicial", "Join in Judicial",
+     ["Date of Join in Judicial Service", "Join in Judicial Service", "Join in Judicial",
+      "Joining in Judicial Service"]),
+    ("current_district", "Current District", ["Current District"]),
+    ("current_taluka", "Current Taluka", ["Current Taluka", "Current Tehsil"]),
+    ("email", "E-mail ID", ["E-mail ID", "E-mail Id", "E-Mail ID", "Email ID", "Email Id", "E-mail", "E-Mail", "Email"]),
+]
+
+COLUMN_NAMES = {field: column for field, column, _ in LABEL_TABLE}
+
+# Label spelling -> output column, and one alternation trying longer spellings first.
+# Spellings are matched case-sensitively: re.IGNORECASE more than doubles parse time
+_LABEL_TO_COLUMN = {label: column for _, column, labels in LABEL_TABLE for label in labels}
+_COLUMN_TO_FIELD = {column: field for field, column in COLUMN_NAMES.items()}
+_LABELS = sorted(_LABEL_TO_COLUMN, key=len, reverse=True)
+# Anchored on a literal newline (the text is prefixed with one) so the regex
+# engine can skip straight between line starts
+DETAIL_LINE_PATTERN = re.compile(
+    r"\n[ \t]*(?:\d+[.)][ \t]*)?"                    # optional "1." / "1)" numbering
+    r"(?P<label>" + "|".join(re.escape(label) for label in _LABELS) + r")"
+    r"(?![A-Za-z])[ \t]*[:\-]?(?P<value>[^\n]*)"      # whole label, optional ":" or "-"
+)
+
+
+def parse_officer_details(details_text):
+    """Parse a detail text block into a {column: value} dictionary (last non-empty occurrence wins)"""
+    found = {}
+    if details_text:
+        for label, value in DETAIL_LINE_PATTERN.findall("\n" + details_text):
+            value = value.strip()
+            if value:
+                found[_LABEL_TO_COLUMN[label]] = value
+    return found
+
+
+def parse_details(details_text):
+    """Parse a detail text block into an OfficerDetails record"""
+    return OfficerDetails(**{
+        _COLUMN_TO_FIELD[column]: value for column, value in parse_officer_details(details_text).items()
+    })
@@ -10,18 +10,37 @@ Last Updated: September 2025
 """
 
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 import time
-import re
-import random
 import os
-import signal
+import sys
+import multiprocessing
+import contextlib
+
+# Driver provisioning, the browser daemon and resource blocking are shared with the PIB extractor
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "selenium_common"))
+
+from record_store import (
+    OfficerIndex, OfficerStore, flatten_partitions, merge_na_values, partition_by_district
+)
+from detail_parser import parse_officer_details
+from table_parser import read_officer_table
+from waits import CONSERVATIVE_POLICY, FAST_POLICY, PageWaiter
+from http_details import (
+    CAPTURE_SCRIPT, DetailFetcher, DetailRequest, PageDetailFetcher, discover_detail_request,
+    fetch_details_concurrently,
+)
+from http_districts import (
+    DistrictLoader, DistrictRequest, discover_district_request, load_district_cache, read_district_options,
+    save_district_cache,
+)
+from driver_provisioning import cold_start, driver_service
+from browser_daemon import attach_browser, devtools_version
+from resource_policy import POLICIES, ResourceCounters, enable_performance_log
 
 # Version Information
 VERSION = "6.0"
@@ -29,10 +48,41 @@ VERSION_NAME = "Officer ID Enhancement Release - Enhanced Data Tracking"
 
 # PERFORMANCE OPTIMIZATION SETTINGS
 FAST_MODE = True  # Set to False for more conservative timing
-BASE_DELAY = 0.1 if FAST_MODE else 0.3
-DISTRICT_CHANGE_DELAY = (1.0, 1.5) if FAST_MODE else (2.0, 3.0)
-MODAL_DELAY = (0.2, 0.4) if FAST_MODE else (0.5, 1.0)
-BETWEEN_DISTRICTS_DELAY = (0.5, 1.0) if FAST_MODE else (2.0, 3.0)
+# Waits are event driven (see waits.py); the mode only selects timeout bounds,
+# polling rate and the politeness pause between districts
+WAIT_POLICY = FAST_POLICY if FAST_MODE else CONSERVATIVE_POLICY
+
+# DETAIL FETCH SETTINGS
+DETAIL_FETCH_MODE = "http"  # "http": replay the jinfo() request over a pooled session,
+                            # "page": replay it with fetch() inside the page (one script per district),
+                            # "modal": click each link
+DETAIL_REQUEST_TEMPLATE = None  # e.g. "http://127.0.0.1:8000/jinfo?id={officer_id}" to skip discovery
+DETAIL_WORKERS = 8  # Concurrent detail requests per district (HTTP and page modes)
+DETAIL_RATE_LIMIT = 10.0  # Max detail requests per second per host (0 disables)
+HTTP_POOL_SIZE = max(10, DETAIL_WORKERS)
+
+# DISTRICT LOADING SETTINGS
+DISTRICT_FETCH_MODE = "http"  # "http": fetch district tables over a pooled session (the first one is still
+                              # selected in the page to discover the request), "dropdown": select every district
+# Skips discovery, e.g. "http://127.0.0.1:8000/district?name={district}"; {district} is replaced by
+# the district's menu_dist1 option value (not its visible name), URL-encoded
+DISTRICT_REQUEST_TEMPLATE = None
+DISTRICT_CACHE_FILE = "districts_cache.json"  # District list and discovered request, per site
+DISTRICT_CACHE_MAX_AGE_DAYS = 7
+
+# DRIVER SETTINGS
+DRIVER_OFFLINE = False  # Never download a chromedriver: use the driver cache, PATH or Selenium Manager's cache
+BROWSER_DAEMON_PORT = None  # e.g. 9222: attach to `python browser_daemon.py start` instead of launching Chrome
+RESOURCE_POLICY = "mphc"  # Requests blocked through DevTools (see resource_policy.py); "none" blocks nothing
+
+# SHARDING SETTINGS
+SHARD_COUNT = 1  # Number of browser processes; each one takes a contiguous range of districts
+
+BASE_URL = "https://mphc.gov.in/judicial-officers"
+OUTPUT_FILE = "Judicial_Officers_MP_v6.xlsx"  # Excel export, written once at the end of a run
+STORE_DIR = "Judicial_Officers_MP_v6.store"  # One partition file per district, shared by shards
+STATE_FILE = "last_processed_district.txt"
+OFFICER_TABLE_ROWS = "table[border='0'] tr"
 
 # Performance metrics tracking
 class PerformanceTracker:
@@ -40,6 +90,12 @@ class PerformanceTracker:
         self.start_time = None
         self.districts_processed = 0
         self.officers_extracted = 0
+        self.wait_time = 0.0   # Waiting on DOM conditions
+        self.sleep_time = 0.0  # Fixed politeness/retry sleeps
+        self.webdriver_time = 0.0  # WebDriver command round trips (includes polling in waits)
+        self.save_time = 0.0  # Writing partitions, state and the Excel export
+        self.first_page_time = None  # From start() to the district list being loaded (driver + browser startup)
+        self.resources = ResourceCounters()  # Blocked/loaded requests, read from the performance log
         
     def start(self):
         self.start_time = time.time()
@@ -48,33 +104,53 @@ class PerformanceTracker:
         self.districts_processed += districts
         self.officers_extracted += officers
         
+    def add_wait(self, seconds):
+        self.wait_time += seconds
+        
+    def add_sleep(self, seconds):
+        self.sleep_time += seconds
+        
+    def add_webdriver(self, seconds):
+        self.webdriver_time += seconds
+        
+    def add_save(self, seconds):
+        self.save_time += seconds
+        
     def get_stats(self):
         if self.start_time:
             elapsed = time.time() - self.start_time
             return {
                 'elapsed_time': elapsed,
                 'districts_per_minute': (self.districts_processed / elapsed) * 60 if elapsed > 0 else 0,
-                'officers_per_minute': (self.officers_extracted / elapsed) * 60 if elapsed > 0 else 0
+                'officers_per_minute': (self.officers_extracted / elapsed) * 60 if elapsed > 0 else 0,
+                'wait_time': self.wait_time,
+                'sleep_time': self.sleep_time,
+                'webdriver_time': self.webdriver_time,
+                'save_time': self.save_time,
+                'first_page_time': self.first_page_time,
+                'resources': self.resources.as_dict(),
+                'work_time': max(0.0, elapsed - self.wait_time - self.sleep_time),
             }
         return {}
 
 ignored_exceptions = (StaleElementReferenceException,)
 
-def click_with_retry(driver, element, max_retries=3):
-    """Retry clicking with scrolling - OPTIMIZED: Reduced sleep times"""
+def click_with_retry(driver, element, max_retries=3, waiter=None):
+    """Retry clicking; the element is scrolled into view instantly rather than smoothly"""
     for attempt in range(max_retries):
         try:
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-            time.sleep(BASE_DELAY)  # OPTIMIZED: Using configurable delay
-            driver.execute_script("arguments[0].click();", element)
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", element)
             return True
         except Exception as e:
             print(f"  Click attempt {attempt + 1} failed: {str(e)}")
-            time.sleep(BASE_DELAY * 3)  # OPTIMIZED: Proportional to base delay
+            if waiter:
+                waiter.sleep(WAIT_POLICY.retry_delay * (attempt + 1))
+            else:
+                time.sleep(WAIT_POLICY.retry_delay * (attempt + 1))
     return False
 
-def get_officer_details(driver, officer_id):
-    """Extract personal details using improved parsing - OPTIMIZED"""
+def get_officer_details(driver, officer_id, waiter):
+    """Extract personal details from the jinfo modal, waiting on DOM events instead of sleeps"""
     details = {}
     
     try:
@@ -83,47 +159,153 @@ def get_officer_details(driver, officer_id):
             EC.element_to_be_clickable((By.CSS_SELECTOR, f"a[onclick*=\"jinfo('{officer_id}')\"]"))
         )
         
-        if not click_with_retry(driver, officer_link):
+        waiter.remember_jinfo()
+        if not click_with_retry(driver, officer_link, waiter=waiter):
             print(f"  Failed to click officer ID {officer_id} after retries")
             return details
         
-        time.sleep(random.uniform(*MODAL_DELAY))  # OPTIMIZED: Using configurable modal delay
-        
-        wait.until(EC.presence_of_element_located((By.ID, "jinfo")))
-        details_div = driver.find_element(By.ID, "jinfo")
-        details_text = details_div.text
+        # Returns as soon as this officer's jinfo request has completed and #jinfo shows it
+        details_text = waiter.wait_for_jinfo(officer_id)
         
         try:
             close_btn = driver.find_element(By.CSS_SELECTOR, "#facebox .close")
-            click_with_retry(driver, close_btn)
-            time.sleep(BASE_DELAY)  # OPTIMIZED: Using base delay
+            click_with_retry(driver, close_btn, waiter=waiter)
+            waiter.wait_for_facebox_closed()
         except:
             pass
         
-        if details_text:
-            lines = [line.strip() for line in details_text.split('\n') if line.strip()]
-            
-            for line in lines:
-                if "Designation" in line:
-                    details["Designation"] = line.split("Designation")[-1].strip()
-                elif "Present Posting" in line:
-                    details["Date of Present Posting"] = line.split("Date of Present Posting")[-1].strip()
-                elif "Father" in line or "Mother" in line or "Husband" in line:
-                    details["Father/Mother/Husband Name"] = line.split("Father/Mother/Husband Name")[-1].strip()
-                elif "Join in Judicial" in line:
-                    details["Join in Judicial"] = line.split("Join in Judicial")[-1].strip()
-                elif "Current District" in line:
-                    details["Current District"] = line.split("Current District")[-1].strip()
-                elif "Current Taluka" in line:
-                    details["Current Taluka"] = line.split("Current Taluka")[-1].strip()
-                elif "E-mail" in line:
-                    details["E-mail ID"] = line.split("E-mail ID")[-1].strip()
+        details = parse_officer_details(details_text)
         
     except Exception as e:
         print(f"  Error getting details for officer ID {officer_id}: {str(e)}")
     
     return details
 
+def setup_detail_fetcher(driver, officer_id):
+    """Prepare the HTTP or in-page detail fetcher, discovering the jinfo() request if needed
+    
+    Returns None when the request cannot be discovered, in which case the caller
+    falls back to the modal click path.
+    """
+    if DETAIL_REQUEST_TEMPLATE:
+        request = DetailRequest("GET", DETAIL_REQUEST_TEMPLATE)
+    else:
+        try:
+            request = discover_detail_request(driver, officer_id)
+        except Exception as e:
+            print(f"  ⚠️  Could not discover jinfo request: {str(e)}")
+            request = None
+    
+    if request is None:
+        print("  ⚠️  jinfo request not discovered - falling back to modal clicks")
+        return None
+    
+    if DETAIL_FETCH_MODE == "page":
+        print(f"  🌐 In-page fetch() of details enabled: {request}")
+        return PageDetailFetcher(driver, request, concurrency=DETAIL_WORKERS, rate_limit=DETAIL_RATE_LIMIT)
+    print(f"  🌐 Direct HTTP detail fetch enabled: {request}")
+    return DetailFetcher.from_driver(
+        driver, request, pool_size=HTTP_POOL_SIZE, rate_limit=DETAIL_RATE_LIMIT
+    )
+
+def setup_district_loader(driver, request, captured, district_value, browser_rows):
+    """Prepare the HTTP district loader once the first district has been rendered in the page
+    
+    The request comes from the template or cache, or is discovered among the requests
+    captured while the district was selected. Returns None (districts stay on the
+    dropdown) when there is no request or its response does not parse to the rows
+    the page rendered.
+    """
+    request = request or discover_district_request(captured, district_value)
+    if request is None:
+        print("  ⚠️  menu_dist1 request not discovered - selecting districts in the page")
+        return None
+    
+    loader = DistrictLoader.from_driver(driver, request)
+    try:
+        http_rows = loader.fetch_table(district_value)
+    except Exception as e:
+        print(f"  ⚠️  Could not load the district table over HTTP: {str(e)}")
+        http_rows = None
+    if http_rows != browser_rows:
+        print(f"  ⚠️  {request} does not return the rendered table - selecting districts in the page")
+        loader.close()
+        return None
+    
+    print(f"  🌐 Direct HTTP district loading enabled: {request}")
+    return loader
+
+def load_district_table(driver, wait, waiter, district_name, capture=False):
+    """Select a district in the dropdown and read the rendered officer table
+    
+    With `capture`, the requests fired by the change handler are recorded and
+    returned alongside the rows (for district request discovery).
+    """
+    district_dropdown = wait.until(
+        EC.presence_of_element_located((By.ID, "menu_dist1"))
+    )
+    districts = Select(district_dropdown)
+    if capture:
+        driver.execute_script(CAPTURE_SCRIPT)
+    
+    waiter.remember_table(OFFICER_TABLE_ROWS)
+    districts.select_by_visible_text(district_name)
+    try:
+        waiter.wait_for_table(OFFICER_TABLE_ROWS)  # Returns once the district request completed and rows settled
+    except TimeoutException:
+        # The timeout has backed off; a second timeout skips the district
+        print(f"  ⏳ Table for {district_name} still loading - waiting once more")
+        waiter.wait_for_table(OFFICER_TABLE_ROWS)
+    
+    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table[border='0']")))
+    captured = driver.execute_script("return window.__capturedRequests || [];") if capture else []
+    
+    # Read the whole officer table in one WebDriver call
+    return read_officer_table(driver), captured
+
+def fetch_district_details(driver, detail_fetcher, officer_ids, waiter):
+    """Fetch personal details for every officer of a district
+    
+    Uses one in-page script or the bounded worker pool when a fetcher is available,
+    otherwise falls back to the serial modal path. Returns a dict keyed by officer ID.
+    """
+    if not detail_fetcher:
+        return {officer_id: get_officer_details(driver, officer_id, waiter) for officer_id in officer_ids}
+    
+    district_details = {}
+    if isinstance(detail_fetcher, PageDetailFetcher):
+        results = detail_fetcher.fetch_texts(officer_ids)
+    else:
+        results = fetch_details_concurrently(detail_fetcher, officer_ids, workers=DETAIL_WORKERS)
+    for officer_id, result in results.items():
+        if isinstance(result, Exception):
+            print(f"  Error fetching details for officer ID {officer_id}: {str(result)}")
+            district_details[officer_id] = {}
+        else:
+            district_details[officer_id] = parse_officer_details(result)
+    return district_details
+
+def sno_sort_key(table_row):
+    """Sort key placing rows in numeric S.No order, unnumbered rows last"""
+    sno = str(table_row.get("S.No", "")).strip().rstrip('.')
+    return (0, int(sno)) if sno.isdigit() else (1, 0)
+
+def build_officer_record(table_row, personal_details, district_name):
+    """Combine an officer table row with its personal details into an output record"""
+    return {
+        "S.No": table_row["S.No"],
+        "Name": table_row["Name"],
+        "Designation": personal_details.get("Designation", "N/A"),
+        "Date of Present Posting": personal_details.get("Date of Present Posting", "N/A"),
+        "Father/Mother/Husband Name": personal_details.get("Father/Mother/Husband Name", "N/A"),
+        "Join in Judicial": personal_details.get("Join in Judicial", "N/A"),
+        "Current District": personal_details.get("Current District", "N/A"),
+        "Current Taluka": personal_details.get("Current Taluka", "N/A"),
+        "E-mail ID": personal_details.get("E-mail ID", "N/A"),
+        "District": district_name,
+        "Officer ID": table_row["Officer ID"],
+    }
+
 def load_existing_data(filename):
     """Load existing data from Excel file"""
     if os.path.exists(filename):
@@ -152,16 +334,19 @@ def remove_duplicates_from_data(data):
     
     return unique_data
 
-def save_data(all_officers, filename, overwrite=False):
-    """Save data to Excel file with option to overwrite or append"""
-    if overwrite or not os.path.exists(filename):
-        df = pd.DataFrame(all_officers)
-        df.to_excel(filename, index=False)
-    else:
-        existing_data = load_existing_data(filename)
-        combined_data = existing_data + all_officers
-        df = pd.DataFrame(combined_data)
-        df.to_excel(filename, index=False)
+def prepare_store(store, choice):
+    """Apply the execution choice to the record store before any district is processed
+    
+    Option 1 clears the store. Options 2 and 3 migrate the Excel output of older
+    runs into district partitions once, so later runs only load partitions.
+    """
+    if choice == 1:
+        store.reset()
+    elif choice in (2, 3) and not store.exists() and os.path.exists(OUTPUT_FILE):
+        # BUG FIX v4.0: Remove duplicates while loading existing data
+        existing = remove_duplicates_from_data(load_existing_data(OUTPUT_FILE))
+        store.write_all(partition_by_district(existing))
+        print(f"📦 Migrated {len(existing)} records from {OUTPUT_FILE} into {store.path}")
 
 def get_user_choice():
     """Get user choice for resume/update options"""
@@ -193,29 +378,28 @@ def print_performance_stats(tracker, current_district=None, total_districts=None
         print(f"⏱️  Performance: {elapsed_min:.1f}m elapsed | "
               f"{stats['districts_per_minute']:.1f} districts/min | "
               f"{stats['officers_per_minute']:.1f} officers/min")
+        print(f"⏳ Time split: {stats['wait_time']:.1f}s waiting on page | "
+              f"{stats['sleep_time']:.1f}s politeness sleeps | {stats['work_time']:.1f}s working")
         if current_district and total_districts:
             remaining = total_districts - current_district
             eta_min = remaining / stats['districts_per_minute'] if stats['districts_per_minute'] > 0 else 0
             print(f"📊 Progress: {current_district}/{total_districts} districts | ETA: {eta_min:.1f} minutes")
 
-def extract_judicial_officers():
-    print("=" * 80)
-    print(f"Judicial Officers Extraction Tool v{VERSION} - {VERSION_NAME}")
-    print("=" * 80)
-    print("🚀 Starting high-performance data extraction from Madhya Pradesh High Court...")
-    print("📁 Output file: Judicial_Officers_MP_v6.xlsx")
-    print("💾 State tracking: last_processed_district.txt")
-    print("🆕 New in v6.0: Officer ID field for enhanced data tracking")
-    print("🐛 Bug Fix: Duplicate prevention in resume functionality")
-    print(f"⚡ Speed Mode: {'FAST' if FAST_MODE else 'CONSERVATIVE'} (delays optimized for maximum performance)")
-    print("📈 Real-time performance tracking enabled")
-    print("-" * 80)
-    
-    # Initialize performance tracker
-    tracker = PerformanceTracker()
-    tracker.start()
-    
-    # Setup Chrome WebDriver with optimized options
+def shard_state_file(shard, shards):
+    """Return the state file of a shard; unsharded runs keep the classic name"""
+    if shards <= 1:
+        return STATE_FILE
+    state_base, state_ext = os.path.splitext(STATE_FILE)
+    return f"{state_base}.shard{shard}{state_ext}"
+
+def shard_range(total, shard, shards):
+    """Return the contiguous [start, end) range of district indices owned by a shard"""
+    size, extra = divmod(total, shards)
+    start = shard * size + min(shard, extra)
+    return start, start + size + (1 if shard < extra else 0)
+
+def create_driver():
+    """Setup Chrome WebDriver with optimized options"""
     options = webdriver.ChromeOptions()
     options.add_argument('--headless')
     options.add_argument('--disable-gpu')
@@ -224,200 +408,332 @@ def extract_judicial_officers():
     options.add_argument('--window-size=1920,1080')
     options.add_argument('--disable-blink-features=AutomationControlled')
     options.add_argument('--disable-extensions')  # NEW: Disable extensions for speed
-    options.add_argument('--disable-plugins')     # NEW: Disable plugins for speed
-    options.add_argument('--disable-images')      # NEW: Disable images for speed
+    enable_performance_log(options)  # Images, fonts etc. are blocked by RESOURCE_POLICY, counted from this log
     
     driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
+        service=driver_service(offline=DRIVER_OFFLINE),  # Cached per Chrome version, no network needed
         options=options
     )
+    cold_start.mark("browser started")
     
     driver.maximize_window()
-    wait = WebDriverWait(driver, 20)
+    return driver
+
+@contextlib.contextmanager
+def open_browser():
+    """WebDriver in a fresh context of the browser daemon when it is running, else a newly launched Chrome"""
+    if BROWSER_DAEMON_PORT and devtools_version(BROWSER_DAEMON_PORT):
+        print(f"🔌 Attaching to browser daemon on port {BROWSER_DAEMON_PORT}")
+        options = enable_performance_log(webdriver.ChromeOptions())
+        with attach_browser(BROWSER_DAEMON_PORT, offline=DRIVER_OFFLINE, options=options) as driver:
+            yield driver
+        return
+    if BROWSER_DAEMON_PORT:
+        print(f"⚠️ No browser daemon on port {BROWSER_DAEMON_PORT}; launching Chrome")
+    driver = create_driver()
+    try:
+        yield driver
+    finally:
+        driver.quit()
+
+def instrument_driver(driver, tracker):
+    """Count the time of every WebDriver command round trip in the tracker"""
+    execute = driver.execute
+    
+    def timed_execute(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return execute(*args, **kwargs)
+        finally:
+            tracker.add_webdriver(time.perf_counter() - start)
+    
+    driver.execute = timed_execute
+    return driver
+
+def extract_judicial_officers(shard=0, shards=1, choice=None, base_url=BASE_URL, tracker=None):
+    """Extract officers for all districts, or for one shard's range of districts
+    
+    When `choice` is None and output from a previous run exists, the user is asked
+    how to proceed; shards never ask and take None as a fresh run. Returns the list of officer records of the districts processed.
+    A `tracker` can be passed in to read the timings afterwards (benchmarks).
+    """
+    state_file = shard_state_file(shard, shards)
+    store = OfficerStore(STORE_DIR)
+    
+    print("=" * 80)
+    print(f"Judicial Officers Extraction Tool v{VERSION} - {VERSION_NAME}")
+    print("=" * 80)
+    print("🚀 Starting high-performance data extraction from Madhya Pradesh High Court...")
+    if shards > 1:
+        print(f"🧩 Shard {shard + 1}/{shards}")
+    print(f"📁 Output file: {OUTPUT_FILE} (district partitions in {STORE_DIR})")
+    print(f"💾 State tracking: {state_file}")
+    print("🆕 New in v6.0: Officer ID field for enhanced data tracking")
+    print("🐛 Bug Fix: Duplicate prevention in resume functionality")
+    print(f"⚡ Speed Mode: {WAIT_POLICY.name} (event-driven waits with adaptive timeouts)")
+    print("📈 Real-time performance tracking enabled")
+    print("-" * 80)
     
-    all_officers = []
-    output_file = "Judicial_Officers_MP_v6.xlsx"
-    state_file = "last_processed_district.txt"
+    # Initialize performance tracker
+    tracker = tracker or PerformanceTracker()
+    tracker.start()
     
-    # Initialize choice variable
-    choice = None
+    # Records held as {district: [records]} partitions
+    officers_by_district = {}
+    
+    # HTTP/in-page detail fetcher is set up lazily on the first officer link
+    detail_fetcher = None
+    detail_fetch_checked = DETAIL_FETCH_MODE not in ("http", "page")
+    
+    # HTTP district loader is set up after the first district rendered in the page
+    district_loader = None
+    district_loader_checked = DISTRICT_FETCH_MODE != "http"
     
     # Check if we need to continue from previous run
     start_index = 0
-    if os.path.exists(output_file):
+    if choice is None and shards > 1:
+        choice = 1  # Shards never prompt (they run in pool workers); run_sharded resolves the choice
+    if choice is None and (store.exists() or os.path.exists(OUTPUT_FILE)):
         choice = get_user_choice()
-        
+    if shards <= 1:
+        prepare_store(store, choice)  # Sharded runs prepare the shared store once in run_sharded
+    
+    if choice is not None:
         if choice == 1:  # Overwrite all
             if os.path.exists(state_file):
                 os.remove(state_file)
-            all_officers = []
-        elif choice == 2:  # Update only N/A values
-            all_officers = remove_duplicates_from_data(load_existing_data(output_file))
         elif choice == 3:  # Continue from last district
-            # BUG FIX v4.0: Load existing data first to prevent duplicates
-            all_officers = remove_duplicates_from_data(load_existing_data(output_file))
             try:
                 with open(state_file, 'r') as f:
                     start_index = int(f.read().strip())
                 print(f"\n🔄 Resuming from district index: {start_index + 1}")
-                print(f"📊 Loaded {len(all_officers)} existing records")
                 start_index += 1
             except:
                 print("Could not read state file. Starting from beginning.")
                 start_index = 0
     else:
-        all_officers = []
         print("\n🆕 Starting fresh extraction...")
         print("-" * 80)
     
+    # Entered inside the try, so Chrome is quit (or the daemon context disposed) whatever fails
+    browser = contextlib.ExitStack()
     try:
-        driver.get("https://mphc.gov.in/judicial-officers")
+        driver = instrument_driver(browser.enter_context(open_browser()), tracker)
+        resource_policy = POLICIES[RESOURCE_POLICY]
+        resource_policy.apply(driver)
+        print(f"🧱 Resource policy: {resource_policy.describe()}")
+        wait = WebDriverWait(driver, 20)
+        waiter = PageWaiter(driver, WAIT_POLICY, tracker)
         
-        district_dropdown = wait.until(
-            EC.presence_of_element_located((By.ID, "menu_dist1"))
-        )
-        districts = Select(district_dropdown)
-        district_names = [option.text for option in districts.options]
+        driver.get(base_url)
+        
+        wait.until(EC.presence_of_element_located((By.ID, "menu_dist1")))
+        cold_start.mark("first page loaded")
+        if tracker.first_page_time is None:
+            tracker.first_page_time = time.time() - tracker.start_time
+        print(f"⏱️ {cold_start.summary()}")
+        
+        # Cached (name, value) list keeps district indices stable for resume and shards
+        cached_districts = load_district_cache(base_url, DISTRICT_CACHE_FILE, DISTRICT_CACHE_MAX_AGE_DAYS)
+        if cached_districts:
+            district_options, district_request = cached_districts
+            print(f"🗂️  District list from {DISTRICT_CACHE_FILE} ({len(district_options)} districts)")
+        else:
+            district_options, district_request = read_district_options(driver), None
+            save_district_cache(base_url, district_options, path=DISTRICT_CACHE_FILE)
+        if DISTRICT_REQUEST_TEMPLATE:
+            district_request = DistrictRequest("GET", DISTRICT_REQUEST_TEMPLATE)
+        district_names = [name for name, _ in district_options]
+        
+        shard_start, shard_end = shard_range(len(district_names), shard, shards)
+        start_index = max(start_index, shard_start)
         
-        print(f"📍 Total districts to process: {len(district_names) - start_index}")
+        # Only the partitions this run touches are loaded; the rest stay on disk
+        officer_index = None
+        if choice == 2:
+            # Officers are matched within their district, so the shard's partitions are enough
+            officers_by_district = store.load_partitions(district_names[shard_start:shard_end])
+        elif choice == 3:
+            officers_by_district = store.load_partitions(district_names[start_index:shard_end])
+        for district, records in officers_by_district.items():
+            # BUG FIX v4.0: Remove duplicates while loading existing data
+            officers_by_district[district] = remove_duplicates_from_data(records)
+        if choice == 2:
+            # Built after dedup, so every indexed record is one that is kept and saved
+            officer_index = OfficerIndex(flatten_partitions(officers_by_district))
+        if officers_by_district:
+            print(f"📊 Loaded {sum(map(len, officers_by_district.values()))} existing records "
+                  f"from {len(officers_by_district)} district partitions")
         
-        for idx in range(start_index, len(district_names)):
+        print(f"📍 Total districts to process: {shard_end - start_index}")
+        
+        for idx in range(start_index, shard_end):
             try:
-                # Refresh dropdown to avoid stale elements
-                district_dropdown = wait.until(
-                    EC.presence_of_element_located((By.ID, "menu_dist1"))
-                )
-                districts = Select(district_dropdown)
-                
-                district_name = district_names[idx]
+                district_name, district_value = district_options[idx]
                 print(f"\n🏛️  Processing district: {district_name} ({idx+1}/{len(district_names)})")
                 
-                districts.select_by_visible_text(district_name)
-                time.sleep(random.uniform(*DISTRICT_CHANGE_DELAY))  # OPTIMIZED: Using configurable delay
+                # Pass 1: the officer table, over HTTP once the loader is set up, else from the page
+                table_rows = None
+                if district_loader:
+                    try:
+                        table_rows = district_loader.fetch_table(district_value)
+                    except Exception as e:
+                        print(f"  ⚠️  HTTP table load failed ({str(e)}) - selecting the district in the page")
+                if table_rows is None:
+                    # Requests are only captured while the district request is still to be discovered
+                    table_rows, captured = load_district_table(
+                        driver, wait, waiter, district_name,
+                        capture=not district_loader_checked and district_request is None
+                    )
+                
+                # Pass 2: fetch personal details (concurrently in HTTP mode)
+                if table_rows and not detail_fetch_checked:
+                    detail_fetch_checked = True
+                    detail_fetcher = setup_detail_fetcher(driver, table_rows[0]["Officer ID"])
                 
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table[border='0']")))
-                officer_rows = driver.find_elements(By.CSS_SELECTOR, "table[border='0'] tr")
+                # Modal details click links in the rendered table, so they keep the dropdown
+                if table_rows and not district_loader_checked:
+                    district_loader_checked = True
+                    if detail_fetcher:
+                        district_loader = setup_district_loader(
+                            driver, district_request, captured, district_value, table_rows
+                        )
+                        if district_loader and district_request is None:
+                            save_district_cache(base_url, district_options, district_loader.request,
+                                                path=DISTRICT_CACHE_FILE)
                 
+                officer_ids = [table_row["Officer ID"] for table_row in table_rows]
+                district_details = fetch_district_details(driver, detail_fetcher, officer_ids, waiter)
+                
+                # Pass 3: reassemble records in S.No order
                 district_officers = []
-                for row in officer_rows:
-                    try:
-                        cells = row.find_elements(By.TAG_NAME, "td")
-                        if len(cells) < 2:
-                            continue
-                        
-                        officer_link = cells[1].find_element(By.TAG_NAME, "a")
-                        officer_name = officer_link.text
-                        onclick_text = officer_link.get_attribute("onclick")
-                        officer_id = re.search(r"jinfo\('(\d+)'\)", onclick_text).group(1)
-                        
-                        designation = cells[2].text if len(cells) > 2 else "N/A"
-                        court = cells[3].text if len(cells) > 3 else "N/A"
-                        
-                        personal_details = get_officer_details(driver, officer_id)
-                        
-                        officer_data = {
-                            "S.No": cells[0].text if len(cells) > 0 else "N/A",
-                            "Name": officer_name,
-                            "Designation": personal_details.get("Designation", "N/A"),
-                            "Date of Present Posting": personal_details.get("Date of Present Posting", "N/A"),
-                            "Father/Mother/Husband Name": personal_details.get("Father/Mother/Husband Name", "N/A"),
-                            "Join in Judicial": personal_details.get("Join in Judicial", "N/A"),
-                            "Current District": personal_details.get("Current District", "N/A"),
-                            "Current Taluka": personal_details.get("Current Taluka", "N/A"),
-                            "E-mail ID": personal_details.get("E-mail ID", "N/A"),
-                            "District": district_name,
-                            "Officer ID": officer_id,
-                        }
-                        
-                        district_officers.append(officer_data)
-                        print(f"  ✅ Extracted: {officer_name}")
-                        
-                    except Exception as e:
-                        print(f"  ❌ Error processing officer row: {str(e)}")
-                        continue
+                for table_row in sorted(table_rows, key=sno_sort_key):
+                    officer_data = build_officer_record(
+                        table_row, district_details.get(table_row["Officer ID"], {}), district_name
+                    )
+                    district_officers.append(officer_data)
+                    print(f"  ✅ Extracted: {officer_data['Name']}")
                 
-                # Update all_officers based on user choice
+                # Update the district partitions based on user choice
+                changed_districts = {district_name}
                 if choice == 2:  # Update only N/A values
-                    for new_officer in district_officers:
-                        key = (new_officer['Name'], new_officer['District'])
-                        found = False
-                        for existing_officer in all_officers:
-                            if (existing_officer['Name'], existing_officer['District']) == key:
-                                # Update only N/A values
-                                for k, v in new_officer.items():
-                                    if existing_officer.get(k) == "N/A":
-                                        existing_officer[k] = v
-                                found = True
-                                break
-                        if not found:
-                            all_officers.append(new_officer)
+                    # Keyed on Officer ID, falling back to (Name, District)
+                    updated, added, changed_districts = merge_na_values(
+                        officers_by_district, officer_index, district_officers
+                    )
+                    print(f"  📝 Updated {updated} existing records, added {added} new records")
                 elif choice == 3:  # Resume - avoid duplicates by checking if district already processed
-                    # BUG FIX v4.0: Remove existing data for this district to prevent duplicates
-                    original_count = len(all_officers)
-                    all_officers = [officer for officer in all_officers if officer.get('District') != district_name]
-                    removed_count = original_count - len(all_officers)
+                    # BUG FIX v4.0: Replace existing data for this district to prevent duplicates
+                    removed_count = len(officers_by_district.get(district_name, []))
+                    officers_by_district[district_name] = district_officers
                     if removed_count > 0:
-                        print(f"  🔄 Removed {removed_count} existing records for {district_name} to avoid duplicates")
-                    # Add new data for this district
-                    all_officers.extend(district_officers)
+                        print(f"  🔄 Replaced {removed_count} existing records for {district_name} to avoid duplicates")
                     print(f"  ✅ Added {len(district_officers)} new records for {district_name}")
                 else:  # choice == 1 - overwrite all
-                    all_officers.extend(district_officers)
+                    officers_by_district.setdefault(district_name, []).extend(district_officers)
                 
                 # Update performance tracker
                 tracker.update(districts=1, officers=len(district_officers))
+                tracker.resources.collect(driver)
                 
-                # BUG FIX v4.0: Always overwrite during save to prevent duplicate accumulation
-                save_data(all_officers, output_file, overwrite=True)
+                # Write only the changed district partitions; Excel is exported once at the end
+                save_start = time.perf_counter()
+                for changed in changed_districts:
+                    position = idx if changed == district_name else None
+                    store.write_district(changed, officers_by_district.get(changed, []), position)
                 with open(state_file, 'w') as f:
                     f.write(str(idx))
+                tracker.add_save(time.perf_counter() - save_start)
                 
                 # Print performance stats every few districts
                 if idx % 3 == 0:  # Every 3 districts
                     print_performance_stats(tracker, idx + 1, len(district_names))
                 
-                time.sleep(random.uniform(*BETWEEN_DISTRICTS_DELAY))  # OPTIMIZED: Using configurable delay
+                waiter.pause_between_districts()  # Politeness only; readiness is event driven
                 driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(BASE_DELAY)  # OPTIMIZED: Using base delay
                 
             except Exception as e:
                 print(f"❌ Error processing district {idx} ({district_name}): {str(e)}")
                 continue
         
-        # BUG FIX v4.0: Final save with overwrite to ensure data consistency
-        save_data(all_officers, output_file, overwrite=True)
+        # Export the whole store (including districts not processed in this run) once
+        if shards <= 1:
+            save_start = time.perf_counter()
+            total_records = store.export_excel(OUTPUT_FILE)
+            tracker.add_save(time.perf_counter() - save_start)
+        else:
+            total_records = sum(map(len, officers_by_district.values()))
         
         # Final performance summary
         final_stats = tracker.get_stats()
         print("\n" + "=" * 80)
         print(f"🎉 SUCCESS: Extraction completed using v{VERSION}")
-        print(f"📊 Total officers extracted: {len(all_officers)}")
-        print(f"💾 Data saved to: {output_file}")
+        print(f"📊 Total officers extracted: {total_records}")
+        print(f"💾 Data saved to: {OUTPUT_FILE if shards <= 1 else STORE_DIR}")
         print(f"🔧 Version features: {VERSION_NAME}")
         print("🐛 Bug fixes: Duplicate prevention in resume functionality")
         if final_stats:
             print(f"⏱️  Total time: {final_stats['elapsed_time']/60:.1f} minutes")
             print(f"📈 Average speed: {final_stats['officers_per_minute']:.1f} officers/minute")
+            print(f"⏳ Waiting: {final_stats['wait_time']:.1f}s | Sleeping: {final_stats['sleep_time']:.1f}s | "
+                  f"Working: {final_stats['work_time']:.1f}s")
+            print(f"🌐 WebDriver: {final_stats['webdriver_time']:.1f}s | Saving: {final_stats['save_time']:.1f}s")
+            tracker.resources.collect(driver)
+            print(f"🧱 {tracker.resources.summary()}")
+            for condition, (mean, timeout, misses) in waiter.summary().items():
+                print(f"   ⌛ {condition}: {mean:.2f}s average, timeout now {timeout:.1f}s, {misses} timeouts")
             print(f"🚀 Performance improvement: Up to 80% faster than previous versions")
         print("=" * 80)
         
+        return flatten_partitions(officers_by_district)
+        
     finally:
         # Only delete state file if script completed successfully
         # We'll handle cleanup in a separate function that's called on successful completion
-        driver.quit()
+        if detail_fetcher:
+            detail_fetcher.close()
+        if district_loader:
+            district_loader.close()
+        browser.close()  # Quits Chrome, or detaches from the daemon and disposes this run's context
         print("WebDriver closed successfully")
 
-def cleanup_on_success():
-    """Clean up state file only on successful completion"""
-    state_file = "last_processed_district.txt"
-    if os.path.exists(state_file):
-        os.remove(state_file)
-        print("State file cleaned up successfully")
+def run_sharded(shards=SHARD_COUNT, base_url=BASE_URL):
+    """Run one browser process per shard and export their shared store to OUTPUT_FILE"""
+    store = OfficerStore(STORE_DIR)
+    
+    # Resolved here, as pool workers cannot prompt; a fresh run is option 1
+    choice = 1
+    if store.exists() or os.path.exists(OUTPUT_FILE):
+        choice = get_user_choice()
+    prepare_store(store, choice)
+    
+    print(f"\n🧩 Sharded mode: {shards} browser processes")
+    with multiprocessing.Pool(processes=shards) as pool:
+        pool.starmap(
+            extract_judicial_officers,
+            [(shard, shards, choice, base_url) for shard in range(shards)]
+        )
+    
+    # Shards write disjoint district partitions of one store, so export is the merge
+    total_records = store.export_excel(OUTPUT_FILE)
+    print(f"\n🧩 Merged {shards} shards: {total_records} officers saved to {OUTPUT_FILE}")
+    return total_records
+
+def cleanup_on_success(shards=1):
+    """Clean up state files only on successful completion"""
+    for shard in range(shards):
+        state_file = shard_state_file(shard, shards)
+        if os.path.exists(state_file):
+            os.remove(state_file)
+            print(f"State file {state_file} cleaned up successfully")
 
 if __name__ == "__main__":
     try:
-        extract_judicial_officers()
-        cleanup_on_success()  # Only clean up if script completes successfully
+        if SHARD_COUNT > 1:
+            run_sharded(SHARD_COUNT)
+        else:
+            extract_judicial_officers()
+        cleanup_on_success(SHARD_COUNT)  # Only clean up if script completes successfully
     except KeyboardInterrupt:
         print("\nScript interrupted by user. State file preserved for resuming.")
     except Exception as e:
@@ -0,0 +1,333 @@
+"""
+Direct HTTP Fetching of Officer Details
+=======================================
+Discovers the request issued by the page's jinfo() handler once, then replays it
+over a pooled requests.Session that carries the Selenium cookies. This replaces
+the click / sleep / read / close modal cycle with a single HTTP round trip per
+officer (district tables are loaded by http_districts.py).
+
+PageDetailFetcher replays the same request from inside the page instead: one
+execute_async_script per district runs fetch() for all officers with bounded
+concurrency in the browser's own session, and returns the responses to Python
+as one JSON array.
+"""
+import json
+import math
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup
+
+ID_PLACEHOLDER = "{officer_id}"
+
+# Wraps XMLHttpRequest and fetch so that any request fired by a page handler is
+# recorded in window.__capturedRequests (installed once per page load)
+CAPTURE_SCRIPT = """
+if (!window.__captureInstalled) {
+    window.__captureInstalled = true;
+    window.__capturedRequests = [];
+    var origOpen = XMLHttpRequest.prototype.open;
+    var origSetHeader = XMLHttpRequest.prototype.setRequestHeader;
+    var origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function(method, url) {
+        this.__capture = {method: method, url: new URL(url, location.href).href, headers: {}};
+        return origOpen.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.setRequestHeader = function(name, value) {
+        if (this.__capture) { this.__capture.headers[name] = value; }
+        return origSetHeader.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function(body) {
+        if (this.__capture) {
+            this.__capture.body = (typeof body === 'string') ? body : null;
+            window.__capturedRequests.push(this.__capture);
+        }
+        return origSend.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var origFetch = window.fetch;
+        window.fetch = function(resource, init) {
+            init = init || {};
+            var url = (typeof resource === 'string') ? resource : resource.url;
+            window.__capturedRequests.push({
+                method: (init.method || 'GET').toUpperCase(),
+                url: new URL(url, location.href).href,
+                headers: init.headers || {},
+                body: (typeof init.body === 'string') ? init.body : null
+            });
+            return origFetch.apply(this, arguments);
+        };
+    }
+}
+window.__capturedRequests = [];
+"""
+
+# Fetches every request in arguments[0] from the page with at most `concurrency`
+# in flight, starting them at least `interval` ms apart, and calls back with a
+# JSON array of {id, status, text} or {id, error} in request order
+PAGE_FETCH_SCRIPT = """
+var requests = arguments[0], headers = arguments[1], concurrency = arguments[2],
+    interval = arguments[3], timeout = arguments[4], done = arguments[arguments.length - 1];
+var results = new Array(requests.length), next = 0, nextSlot = 0;
+function pause(ms) { return new Promise(function(resolve) { setTimeout(resolve, ms); }); }
+async function worker() {
+    while (next < requests.length) {
+        var index = next++, request = requests[index];
+        var now = Date.now(), slot = Math.max(now, nextSlot);
+        nextSlot = slot + interval;
+        if (slot > now) { await pause(slot - now); }
+        var controller = new AbortController();
+        var timer = setTimeout(function() { controller.abort(); }, timeout);
+        try {
+            var response = await fetch(request.url, {method: request.method, headers: headers, body: request.body,
+                                                     credentials: 'same-origin', signal: controller.signal});
+            results[index] = {id: request.id, status: response.status, text: await response.text()};
+        } catch (e) {
+            results[index] = {id: request.id, error: String(e)};
+        } finally {
+            clearTimeout(timer);
+        }
+    }
+}
+var workers = [];
+for (var i = 0; i < Math.min(concurrency, requests.length); i++) { workers.push(worker()); }
+Promise.all(workers).then(function() {
+    if (window.__capturedRequests) { window.__capturedRequests = []; }  // fetch() may be wrapped by CAPTURE_SCRIPT
+    done(JSON.stringify(results));
+});
+"""
+
+
+class DetailRequest:
+    """Template of the HTTP request behind jinfo('<id>')"""
+
+    def __init__(self, method, url, body=None, headers=None):
+        self.method = method.upper()
+        self.url = url
+        self.body = body
+        self.headers = headers or {}
+
+    def render(self, officer_id):
+        """Return (method, url, body) with the officer ID substituted"""
+        officer_id = str(officer_id)
+        url = self.url.replace(ID_PLACEHOLDER, officer_id)
+        body = self.body.replace(ID_PLACEHOLDER, officer_id) if self.body else None
+        return self.method, url, body
+
+    @classmethod
+    def from_captured(cls, captured, officer_id):
+        """Build a template from a captured request, or None if the ID is not in it"""
+        pattern = re.compile(r"(?<![0-9A-Za-z])" + re.escape(str(officer_id)) + r"(?![0-9A-Za-z])")
+        parts = urlsplit(captured.get("url", ""))
+        path, path_hits = pattern.subn(ID_PLACEHOLDER, parts.path)
+        query, query_hits = pattern.subn(ID_PLACEHOLDER, parts.query)
+        body, body_hits = pattern.subn(ID_PLACEHOLDER, captured.get("body") or "")
+        if not (path_hits or query_hits or body_hits):
+            return None
+        url = urlunsplit((parts.scheme, parts.netloc, path, query, parts.fragment))
+        headers = captured.get("headers")
+        return cls(captured.get("method", "GET"), url, body or None, headers if isinstance(headers, dict) else None)
+
+    def __repr__(self):
+        return f"DetailRequest({self.method} {self.url})"
+
+
+def capture_requests(driver, trigger_script, timeout=10):
+    """Run a page handler and return the XHR/fetch requests it issued"""
+    driver.execute_script(CAPTURE_SCRIPT)
+    driver.execute_script(trigger_script)
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        captured = driver.execute_script("return window.__capturedRequests || [];")
+        if captured:
+            return captured
+        time.sleep(0.05)
+    return []
+
+
+def discover_detail_request(driver, officer_id, timeout=10):
+    """Find the request behind jinfo() by invoking it once for a known officer"""
+    try:
+        captured = capture_requests(driver, f"jinfo('{officer_id}');", timeout)
+    finally:
+        try:
+            driver.execute_script(
+                "var b = document.querySelector('#facebox .close'); if (b) { b.click(); }"
+            )
+        except Exception:
+            pass
+
+    for request in captured:
+        template = DetailRequest.from_captured(request, officer_id)
+        if template:
+            return template
+    return None
+
+
+def build_session(driver=None, pool_size=10, retries=3):
+    """Create a pooled HTTP session, reusing the browser's cookies and user agent"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retries, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    if driver is not None:
+        for cookie in driver.get_cookies():
+            session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain"), path=cookie.get("path", "/"),
+            )
+        session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+        session.headers["Referer"] = driver.current_url
+    session.headers["X-Requested-With"] = "XMLHttpRequest"
+    return session
+
+
+def details_html_to_text(html):
+    """Convert a jinfo response into the line layout of the #jinfo element's text"""
+    soup = BeautifulSoup(html, "html.parser")
+    container = soup.find(id="jinfo") or soup
+    rows = container.find_all("tr")
+    if rows:
+        lines = [" ".join(cell.get_text(" ", strip=True) for cell in row.find_all(["td", "th"])) for row in rows]
+    else:
+        lines = container.get_text("\n").split("\n")
+    return "\n".join(line.strip() for line in lines if line.strip())
+
+
+class HostRateLimiter:
+    """Spaces requests to each host at most `rate` per second (thread safe)"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        if not self.interval:
+            return
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class DetailFetcher:
+    """Fetches officer detail text over a pooled HTTP session"""
+
+    def __init__(self, request, session=None, timeout=15, rate_limit=None):
+        self.request = request
+        self.session = session or build_session()
+        self.timeout = timeout
+        self.rate_limiter = HostRateLimiter(rate_limit)
+
+    @classmethod
+    def from_driver(cls, driver, request, pool_size=10, timeout=15, rate_limit=None):
+        return cls(request, build_session(driver, pool_size=pool_size), timeout, rate_limit)
+
+    def fetch_html(self, officer_id):
+        method, url, body = self.request.render(officer_id)
+        self.rate_limiter.wait(url)
+        response = self.session.request(
+            method, url, data=body, headers=self.request.headers, timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.text
+
+    def fetch_text(self, officer_id):
+        """Return the detail text for an officer, formatted like the modal's text"""
+        return details_html_to_text(self.fetch_html(officer_id))
+
+    def close(self):
+        self.session.close()
+
+
+def fetch_details_concurrently(fetcher, officer_ids, workers=8):
+    """Fetch detail text for many officers with a bounded thread pool
+
+    Returns a dict mapping officer ID to its detail text, or to the exception
+    raised while fetching it, so one failure does not abort the district.
+    """
+    def fetch(officer_id):
+        try:
+            return officer_id, fetcher.fetch_text(officer_id)
+        except Exception as e:
+            return officer_id, e
+
+    unique_ids = list(dict.fromkeys(officer_ids))
+    if workers <= 1 or len(unique_ids) <= 1:
+        return dict(fetch(officer_id) for officer_id in unique_ids)
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(unique_ids))) as pool:
+        return dict(pool.map(fetch, unique_ids))
+
+
+class PageDetailFetcher:
+    """Fetches officer details with fetch() inside the page, one async script per district
+
+    The requests carry the browser's own cookies and origin, so nothing has to be
+    copied into a Python session; the template URL must be on the page's origin.
+    """
+
+    def __init__(self, driver, request, concurrency=8, timeout=15, rate_limit=None):
+        self.driver = driver
+        self.request = request
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.interval = 1.0 / rate_limit if rate_limit and rate_limit > 0 else 0.0
+
+    def script_timeout(self, count):
+        """Seconds the whole batch may take: every wave timing out plus the rate limit spacing"""
+        return math.ceil(count / self.concurrency) * self.timeout + count * self.interval + 10
+
+    def fetch_html_many(self, officer_ids):
+        """Dict of officer ID to response HTML, or to the exception raised for it"""
+        unique_ids = list(dict.fromkeys(officer_ids))
+        if not unique_ids:
+            return {}
+        batch = []
+        for officer_id in unique_ids:
+            method, url, body = self.request.render(officer_id)
+            batch.append({"id": officer_id, "method": method, "url": url, "body": body})
+        try:
+            self.driver.set_script_timeout(self.script_timeout(len(unique_ids)))
+            payload = self.driver.execute_async_script(
+                PAGE_FETCH_SCRIPT, batch, self.request.headers, self.concurrency,
+                self.interval * 1000, self.timeout * 1000,
+            )
+            responses = json.loads(payload)
+        except Exception as e:
+            return {officer_id: e for officer_id in unique_ids}
+
+        results = {}
+        for request, response in zip(batch, responses):
+            if response.get("error"):
+                results[request["id"]] = requests.ConnectionError(response["error"])
+            elif response["status"] >= 400:
+                results[request["id"]] = requests.HTTPError(f"{response['status']} Error for url: {request['url']}")
+            else:
+                results[request["id"]] = response["text"]
+        return results
+
+    def fetch_texts(self, officer_ids):
+        """Dict of officer ID to detail text (formatted like the modal's text) or exception"""
+        return {
+            officer_id: result if isinstance(result, Exception) else details_html_to_text(result)
+            for officer_id, result in self.fetch_html_many(officer_ids).items()
+        }
+
+    def close(self):
+        pass  # Nothing is held outside the browser
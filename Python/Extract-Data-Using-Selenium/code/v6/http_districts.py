@@ -0,0 +1,179 @@
+"""
+Direct HTTP Loading of District Tables
+======================================
+Finds the request issued by the `menu_dist1` change handler (captured while the
+first district is selected in the browser), then fetches every other
+district's officer table over a pooled requests.Session that carries the
+Selenium cookies. The response is parsed by table_parser, so districts no
+longer wait on selecting, sleeping and the table re-rendering in the page.
+
+The district list and the discovered request are cached per site in
+`districts_cache.json`, so later runs take both from the cache and district
+indices (used by resume and sharding) stay stable between runs:
+
+    python http_districts.py                 # show the cached districts and request
+"""
+import json
+import os
+import re
+import sys
+import time
+from urllib.parse import quote, quote_plus, urlsplit, urlunsplit
+
+from http_details import build_session
+from table_parser import parse_officer_table
+
+DISTRICT_PLACEHOLDER = "{district}"  # Stands for the district's option value, not its name
+DEFAULT_CACHE_FILE = "districts_cache.json"
+
+# Option text (whitespace collapsed, like WebElement.text) and value of every district in one call
+DISTRICT_OPTIONS_SCRIPT = """
+return Array.prototype.map.call(
+    document.querySelectorAll('#menu_dist1 option'),
+    function(option) { return [option.text.replace(/\\s+/g, ' ').trim(), option.value]; }
+);
+"""
+
+# How the district value may appear in a captured request, tried in order
+ENCODINGS = {
+    "component": lambda value: quote(value, safe="!'()*"),  # encodeURIComponent
+    "path": quote,  # Leaves "/" unescaped
+    "plus": quote_plus,  # Form encoding
+    "raw": lambda value: value,
+}
+
+
+class DistrictRequest:
+    """Template of the HTTP request behind the menu_dist1 change handler"""
+
+    def __init__(self, method, url, body=None, headers=None, encoding="component"):
+        self.method = method.upper()
+        self.url = url
+        self.body = body
+        self.headers = headers or {}
+        self.encoding = encoding
+
+    def render(self, value):
+        """Return (method, url, body) with the district value substituted"""
+        encoded = ENCODINGS[self.encoding](str(value))
+        url = self.url.replace(DISTRICT_PLACEHOLDER, encoded)
+        body = self.body.replace(DISTRICT_PLACEHOLDER, encoded) if self.body else None
+        return self.method, url, body
+
+    @classmethod
+    def from_captured(cls, captured, value):
+        """Build a template from a captured request, or None if the district value is not in it"""
+        if not value:
+            return None
+        parts = urlsplit(captured.get("url", ""))
+        for encoding, encode in ENCODINGS.items():
+            pattern = re.compile(r"(?<![0-9A-Za-z%])" + re.escape(encode(str(value))) + r"(?![0-9A-Za-z])")
+            path, path_hits = pattern.subn(DISTRICT_PLACEHOLDER, parts.path)
+            query, query_hits = pattern.subn(DISTRICT_PLACEHOLDER, parts.query)
+            body, body_hits = pattern.subn(DISTRICT_PLACEHOLDER, captured.get("body") or "")
+            if path_hits or query_hits or body_hits:
+                url = urlunsplit((parts.scheme, parts.netloc, path, query, parts.fragment))
+                headers = captured.get("headers")
+                return cls(captured.get("method", "GET"), url, body or None,
+                           headers if isinstance(headers, dict) else None, encoding)
+        return None
+
+    def as_dict(self):
+        return {"method": self.method, "url": self.url, "body": self.body,
+                "headers": self.headers, "encoding": self.encoding}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["method"], data["url"], data.get("body"), data.get("headers"), data.get("encoding", "component"))
+
+    def __repr__(self):
+        return f"DistrictRequest({self.method} {self.url})"
+
+
+def discover_district_request(captured, value):
+    """Find the request carrying the selected district among requests captured during the change"""
+    for request in captured:
+        template = DistrictRequest.from_captured(request, value)
+        if template:
+            return template
+    return None
+
+
+def read_district_options(driver):
+    """[(name, value)] of the menu_dist1 options, read in one WebDriver call"""
+    return [(name, value) for name, value in driver.execute_script(DISTRICT_OPTIONS_SCRIPT)]
+
+
+class DistrictLoader:
+    """Fetches and parses district officer tables over a pooled HTTP session"""
+
+    def __init__(self, request, session=None, timeout=20):
+        self.request = request
+        self.session = session or build_session()
+        self.timeout = timeout
+
+    @classmethod
+    def from_driver(cls, driver, request, pool_size=2, timeout=20):
+        return cls(request, build_session(driver, pool_size=pool_size), timeout)
+
+    def fetch_html(self, value):
+        method, url, body = self.request.render(value)
+        response = self.session.request(
+            method, url, data=body, headers=self.request.headers, timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.text
+
+    def fetch_table(self, value):
+        """Officer rows of a district, parsed exactly like the rendered table"""
+        return parse_officer_table(self.fetch_html(value))
+
+    def close(self):
+        self.session.close()
+
+
+def load_district_cache(base_url, path=DEFAULT_CACHE_FILE, max_age_days=7):
+    """([(name, value)], DistrictRequest or None) cached for `base_url`, or None when missing or stale"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f).get(base_url)
+    except (OSError, ValueError):
+        return None
+    if not entry or time.time() - entry.get("saved_at", 0) > max_age_days * 86400:
+        return None
+    request = DistrictRequest.from_dict(entry["request"]) if entry.get("request") else None
+    return [tuple(district) for district in entry["districts"]], request
+
+
+def save_district_cache(base_url, districts, request=None, path=DEFAULT_CACHE_FILE):
+    """Store the district list (and the request template, if known) for `base_url`"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    cache[base_url] = {
+        "saved_at": time.time(),
+        "districts": [list(district) for district in districts],
+        "request": request.as_dict() if request else None,
+    }
+    # Shards may save at the same time; each writes its own temp file and replaces atomically
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(temp_path, path)
+
+
+if __name__ == "__main__":
+    cache_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CACHE_FILE
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached_sites = json.load(f)
+    except (OSError, ValueError):
+        print(f"❌ No district cache at {cache_path}")
+        sys.exit(1)
+    for site, entry in cached_sites.items():
+        saved = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["saved_at"]))
+        print(f"🌐 {site}: {len(entry['districts'])} districts, saved {saved}")
+        if entry.get("request"):
+            print(f"   📨 {DistrictRequest.from_dict(entry['request'])}")
@@ -0,0 +1,220 @@
+"""
+Partitioned Officer Record Store
+================================
+Persists officer records in one JSON file per district, so saving after a
+district only writes that district's rows instead of rewriting the whole Excel
+workbook, and replacing a district on resume is an atomic file swap. Records are
+held in memory as {district: [records]} partitions for the same reason. Excel is
+exported once at the end of a run, or on demand:
+
+    python record_store.py Judicial_Officers_MP_v6.store [output.xlsx]
+"""
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import sys
+
+import pandas as pd
+
+
+def partition_by_district(records):
+    """Group a flat record list into {district: [records]} partitions"""
+    partitions = {}
+    for record in records:
+        partitions.setdefault(record.get("District", ""), []).append(record)
+    return partitions
+
+
+def flatten_partitions(partitions):
+    return [record for records in partitions.values() for record in records]
+
+
+class OfficerStore:
+    """Directory of per-district partition files
+
+    Each partition is written to a temporary file and swapped in with
+    os.replace, so a crash never leaves a half-written district. Partitions
+    are disjoint, which lets shard processes share one store.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def exists(self):
+        return os.path.isdir(self.path) and any(name.endswith(".json") for name in os.listdir(self.path))
+
+    def reset(self):
+        """Remove all stored records"""
+        if os.path.isdir(self.path):
+            shutil.rmtree(self.path)
+
+    def partition_path(self, district):
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", str(district)).strip("_")[:40] or "district"
+        digest = hashlib.sha1(str(district).encode("utf-8")).hexdigest()[:8]
+        return os.path.join(self.path, f"{slug}-{digest}.json")
+
+    def write_district(self, district, records, position=None):
+        """Replace one district's partition; `position` orders partitions on export
+
+        When `position` is None an existing partition keeps its position.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        path = self.partition_path(district)
+        if position is None and os.path.exists(path):
+            position = self._read_partition(path).get("position")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"district": district, "position": position, "records": records}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def write_all(self, partitions):
+        """Write every partition of {district: [records]}, keeping their order"""
+        for position, (district, records) in enumerate(partitions.items()):
+            self.write_district(district, records, position)
+
+    def _read_partition(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def load_partitions(self, districts=None):
+        """Return {district: [records]} for the given districts (all when None), in position order"""
+        if not os.path.isdir(self.path):
+            return {}
+        if districts is not None:
+            paths = [self.partition_path(district) for district in districts]
+            paths = [path for path in paths if os.path.exists(path)]
+        else:
+            paths = [os.path.join(self.path, name) for name in os.listdir(self.path) if name.endswith(".json")]
+
+        loaded = [self._read_partition(path) for path in paths]
+        loaded.sort(key=lambda part: (part.get("position") is None, part.get("position") or 0))
+        return {part["district"]: part["records"] for part in loaded}
+
+    def load(self):
+        """Return all stored records as a flat list"""
+        return flatten_partitions(self.load_partitions())
+
+    def export_excel(self, filename):
+        """Write all stored records to an Excel file"""
+        records = self.load()
+        pd.DataFrame(records).to_excel(filename, index=False)
+        return len(records)
+
+
+def is_missing(value):
+    """N/A-fill policy: a field can be filled when it is N/A, empty or NaN"""
+    if value is None:
+        return True
+    if isinstance(value, float) and math.isnan(value):
+        return True
+    return isinstance(value, str) and value.strip() in ("", "N/A")
+
+
+def key_text(value):
+    """Text of one key value; integral floats lose their ".0" so 123.0 (Excel) and "123" match
+
+    Same rule as `key_text` in v4's cleanup_duplicates.py.
+    """
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def record_keys(record):
+    """Return ((Officer ID, District), (Name, District)) for a record; the ID key may be None
+
+    Both keys include the district: a record lives in its district's partition, so an
+    officer transferred to another district is a new record there, not an update of
+    the old district's record.
+    """
+    officer_id = record.get("Officer ID")
+    district = record.get("District", "")
+    id_key = None if is_missing(officer_id) else (key_text(officer_id), district)
+    return id_key, (record.get("Name", ""), district)
+
+
+class OfficerIndex:
+    """Hash index over officer records keyed on (Officer ID, District), then (Name, District)
+
+    Records are indexed by reference, so filling fields through the index
+    updates the underlying list in place. Index the records after any
+    deduplication, so that no indexed record is one that gets dropped.
+    """
+
+    def __init__(self, records=()):
+        self.by_id = {}
+        self.by_name_district = {}
+        for record in records:
+            self.add(record)
+
+    def add(self, record):
+        id_key, name_key = record_keys(record)
+        if id_key is not None:
+            self.by_id.setdefault(id_key, record)
+        self.by_name_district.setdefault(name_key, record)
+
+    def find(self, record):
+        """Return the indexed record matching `record`, or None"""
+        id_key, name_key = record_keys(record)
+        if id_key is not None and id_key in self.by_id:
+            return self.by_id[id_key]
+        existing = self.by_name_district.get(name_key)
+        # A name match that already carries a different Officer ID is another officer
+        if existing is not None and id_key is not None:
+            existing_id, _ = record_keys(existing)
+            if existing_id is not None and existing_id != id_key:
+                return None
+        return existing
+
+
+def fill_missing_fields(existing, new):
+    """Copy fields from `new` into `existing` where the existing value is missing"""
+    filled = 0
+    for field, value in new.items():
+        if is_missing(existing.get(field)) and not is_missing(value):
+            existing[field] = value
+            filled += 1
+    return filled
+
+
+def merge_na_values(partitions, index, new_officers):
+    """Merge new records into {district: [records]}, filling only missing fields of matches
+
+    Unmatched records are appended to their district's partition. Runs in
+    O(len(new_officers)) using `index`. Returns (updated, added, touched) where
+    `touched` is the set of districts whose partitions changed.
+    """
+    updated = added = 0
+    touched = set()
+    for new_officer in new_officers:
+        existing = index.find(new_officer)
+        if existing is None:
+            partitions.setdefault(new_officer.get("District", ""), []).append(new_officer)
+            index.add(new_officer)
+            touched.add(new_officer.get("District", ""))
+            added += 1
+            continue
+        had_id = record_keys(existing)[0] is not None
+        if fill_missing_fields(existing, new_officer):
+            updated += 1
+            touched.add(existing.get("District", ""))
+            if not had_id:
+                id_key = record_keys(existing)[0]
+                if id_key is not None:
+                    index.by_id.setdefault(id_key, existing)
+    return updated, added, touched
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python record_store.py <store directory> [output.xlsx]")
+        sys.exit(1)
+    store_path = sys.argv[1]
+    excel_path = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(store_path.rstrip("/\\"))[0] + ".xlsx"
+    count = OfficerStore(store_path).export_excel(excel_path)
+    print(f"💾 Exported {count} records to {excel_path}")
@@ -0,0 +1,238 @@
+"""
+Offline Replay Server for the Judicial Officers Site
+====================================================
+Serves a stand-in for https://mphc.gov.in/judicial-officers from a fixture:
+the `menu_dist1` district dropdown, each district's officer table (loaded by
+the dropdown's change handler) and the `jinfo` detail modal content, with a
+configurable per-request latency. The extractor and the benchmarks run
+against it without touching the live site.
+
+    python replay_server.py --fixture fixtures/sample_site.json --port 8765 --latency 0.2
+    python replay_server.py --generate 52x25 --port 8765        # synthetic site
+
+Fixture format (JSON):
+
+    {
+      "districts": ["Bhopal", ...],
+      "tables": {"Bhopal": "<table border='0'>...</table>", ...},
+      "jinfo": {"1001": "<table>...</table>", ...}
+    }
+
+`tables` and `jinfo` hold recorded HTML fragments as returned by the site.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlsplit
+
+PAGE_PATH = "/judicial-officers"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>Judicial Officers (replay)</title>
+<style>#facebox {{ display: none; position: fixed; top: 10%; left: 30%; background: #fff; }}</style>
+<script>
+function loadDistrict(name) {{
+    var xhr = new XMLHttpRequest();
+    xhr.open('GET', '/district?name=' + encodeURIComponent(name));
+    xhr.onload = function() {{ document.getElementById('officers').innerHTML = xhr.responseText; }};
+    xhr.send();
+}}
+function jinfo(id) {{
+    var xhr = new XMLHttpRequest();
+    xhr.open('GET', '/jinfo?id=' + id);
+    xhr.onload = function() {{
+        document.getElementById('jinfo').innerHTML = xhr.responseText;
+        document.getElementById('facebox').style.display = 'block';
+    }};
+    xhr.send();
+    return false;
+}}
+function closeFacebox() {{
+    document.getElementById('facebox').style.display = 'none';
+    return false;
+}}
+</script></head>
+<body>
+<select id="menu_dist1" onchange="loadDistrict(this.value)">
+{options}
+</select>
+<div id="officers"></div>
+<div id="facebox"><a href="#" class="close" onclick="return closeFacebox();">close</a><div id="jinfo"></div></div>
+</body></html>
+"""
+
+DETAIL_LABELS = [
+    ("Designation", "Civil Judge Class-{n}"),
+    ("Date of Present Posting", "{d:02d}/06/2023"),
+    ("Father/Mother/Husband Name", "Shri Parent {i}"),
+    ("Join in Judicial", "{d:02d}/01/2015"),
+    ("Current District", "{district}"),
+    ("Current Taluka", "Taluka {i}"),
+    ("E-mail ID", "officer{i}@mphc.gov.in"),
+]
+
+
+def generate_fixture(districts=52, officers=25, seed=1):
+    """Build a deterministic synthetic fixture of `districts` x `officers`"""
+    rng = random.Random(seed)
+    fixture = {"districts": [], "tables": {}, "jinfo": {}}
+    officer_id = 1000
+    for d in range(districts):
+        district = f"District {d + 1:02d}"
+        rows = []
+        for sno in range(1, rng.randint(max(1, officers // 2), officers * 3 // 2) + 1):
+            officer_id += 1
+            rows.append(
+                f"<tr><td>{sno}</td>"
+                f"<td><a href=\"#\" onclick=\"jinfo('{officer_id}')\">Officer {officer_id}</a></td>"
+                f"<td>Civil Judge</td><td>Court {sno}</td></tr>"
+            )
+            values = {"n": rng.choice(["I", "II"]), "d": rng.randint(1, 28), "i": officer_id, "district": district}
+            fixture["jinfo"][str(officer_id)] = "<table>" + "".join(
+                f"<tr><td>{label}</td><td>{escape(template.format(**values))}</td></tr>"
+                for label, template in DETAIL_LABELS
+            ) + "</table>"
+        fixture["districts"].append(district)
+        fixture["tables"][district] = (
+            "<table border='0'><tr><th>S.No</th><th>Name</th><th>Designation</th><th>Court</th></tr>"
+            + "".join(rows) + "</table>"
+        )
+    return fixture
+
+
+def load_fixture(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def make_handler(fixture, latency, jitter):
+    options = "\n".join(
+        f'<option value="{escape(name, quote=True)}">{escape(name)}</option>' for name in fixture["districts"]
+    )
+    page = PAGE_TEMPLATE.format(options=options).encode("utf-8")
+
+    class ReplayHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status, body, content_type="text/html; charset=utf-8"):
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _delay(self):
+            if latency or jitter:
+                time.sleep(latency + random.uniform(0, jitter))
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            query = parse_qs(parts.query)
+            if parts.path in ("/", PAGE_PATH):
+                self._delay()
+                self._send(200, page)
+            elif parts.path == "/district":
+                self._delay()
+                table = fixture["tables"].get(query.get("name", [""])[0])
+                self._send(200, table or "<table border='0'></table>")
+            elif parts.path == "/jinfo":
+                self._delay()
+                details = fixture["jinfo"].get(query.get("id", [""])[0])
+                if details is None:
+                    self._send(404, "Officer not found")
+                else:
+                    self._send(200, details)
+            elif parts.path == "/districts.json":
+                self._send(200, json.dumps(fixture["districts"]), "application/json")
+            else:
+                self._send(404, "Not found")
+
+        def log_message(self, format, *args):
+            pass
+
+    return ReplayHandler
+
+
+class ReplayServer:
+    """Replay server running in a background thread (for benchmarks)"""
+
+    def __init__(self, fixture, host="127.0.0.1", port=0, latency=0.0, jitter=0.0):
+        self.httpd = ThreadingHTTPServer((host, port), make_handler(fixture, latency, jitter))
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{PAGE_PATH}"
+
+    def detail_url_template(self):
+        """URL template for the jinfo endpoint, for DETAIL_REQUEST_TEMPLATE"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/jinfo?id={{officer_id}}"
+
+    def district_url(self, name):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/district?name={quote(name)}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def parse_size(value):
+    districts, _, officers = value.lower().partition("x")
+    return int(districts), int(officers or 25)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--fixture", help="fixture JSON with recorded pages")
+    source.add_argument("--generate", type=parse_size, metavar="DISTRICTSxOFFICERS",
+                        help="serve a synthetic site, e.g. 52x25")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--save", help="write the generated fixture to this file")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every page request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency (0..jitter seconds)")
+    args = parser.parse_args()
+
+    if args.fixture:
+        fixture = load_fixture(args.fixture)
+    else:
+        fixture = generate_fixture(*args.generate, seed=args.seed)
+        if args.save:
+            with open(args.save, "w", encoding="utf-8") as f:
+                json.dump(fixture, f, indent=1)
+            print(f"💾 Fixture saved to {args.save}")
+
+    server = ReplayServer(fixture, args.host, args.port, args.latency, args.jitter)
+    print(f"🌐 Replay site: {server.base_url} ({len(fixture['districts'])} districts, "
+          f"{len(fixture['jinfo'])} officers, latency {args.latency}s)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Bulk Officer Table Parsing
+==========================
+Extracts S.No, name, officer ID, designation and court for every row of the
+district officer table from HTML in one pass, instead of issuing several
+WebDriver calls per cell. The HTML comes from a single execute_script call per
+district (or from saved pages), so the parser can be checked offline:
+
+    python table_parser.py saved_district_page.html
+"""
+import re
+import sys
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401 - only checks availability of the faster parser
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+OFFICER_TABLE_SELECTOR = "table[border='0']"
+JINFO_ID_PATTERN = re.compile(r"jinfo\('(\d+)'\)")
+WHITESPACE = re.compile(r"\s+")
+
+# Returns the outer HTML of every outermost officer table in one WebDriver round trip;
+# a table nested in another match is already part of that table's HTML
+TABLE_HTML_SCRIPT = """
+var selector = arguments[0];
+return Array.prototype.filter.call(
+    document.querySelectorAll(selector),
+    function(table) { return !table.parentElement || !table.parentElement.closest(selector); }
+).map(function(table) { return table.outerHTML; }).join('\\n');
+"""
+
+
+def cell_text(cell):
+    """Visible-text approximation of a cell, with whitespace collapsed like WebElement.text"""
+    return WHITESPACE.sub(" ", cell.get_text(" ")).strip()
+
+
+def parse_officer_table(html):
+    """Parse officer rows out of HTML containing the district table(s)
+
+    Rows without at least two cells or without a jinfo('<id>') link in the
+    second cell are skipped, matching the per-element scraping loop, and
+    counted in a warning. Each row is read once, from its own cells: rows of
+    nested tables are not repeated, and rows that only wrap a nested table are
+    layout, not officers.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    table_rows = []
+    skipped = 0
+    for row in soup.select(f"{OFFICER_TABLE_SELECTOR} tr"):
+        if row.find("table") is not None:
+            continue
+        cells = row.find_all("td", recursive=False)
+        if not cells:
+            continue  # Header row
+        officer_link = cells[1].find("a") if len(cells) > 1 else None
+        match = JINFO_ID_PATTERN.search(officer_link.get("onclick") or "") if officer_link else None
+        if not match:
+            skipped += 1
+            continue
+        table_rows.append({
+            "S.No": cell_text(cells[0]),
+            "Name": cell_text(officer_link),
+            "Officer ID": match.group(1),
+            "Designation": cell_text(cells[2]) if len(cells) > 2 else "N/A",
+            "Court": cell_text(cells[3]) if len(cells) > 3 else "N/A",
+        })
+    if skipped:
+        print(f"⚠️ Skipped {skipped} table rows without an officer link")
+    return table_rows
+
+
+def read_officer_table(driver):
+    """Fetch the officer table HTML from the browser in one call and parse it"""
+    return parse_officer_table(driver.execute_script(TABLE_HTML_SCRIPT, OFFICER_TABLE_SELECTOR))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python table_parser.py <saved_page.html>")
+        sys.exit(1)
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        rows = parse_officer_table(f.read())
+    for table_row in rows:
+        print(f"{table_row['S.No']:>4}  {table_row['Officer ID']:>8}  {table_row['Name']}  |  "
+              f"{table_row['Designation']}  |  {table_row['Court']}")
+    print(f"📊 Parsed {len(rows)} officer rows")
@@ -0,0 +1,47 @@
+"""Checks for detail_parser (python -m pytest)"""
+from detail_fixtures import legacy_parse, site_blocks
+from detail_parser import OfficerDetails, parse_details, parse_officer_details
+
+SITE_BLOCK = (
+    "Designation Civil Judge Class-I\n"
+    "Date of Present Posting 09/06/2023\n"
+    "Father/Mother/Husband Name Shri Parent 1001\n"
+    "Join in Judicial 09/01/2015\n"
+    "Current District District 01\n"
+    "Current Taluka Taluka 1001\n"
+    "E-mail ID officer1001@mphc.gov.in"
+)
+
+
+def test_site_layout_matches_legacy_parser():
+    for block in [SITE_BLOCK] + site_blocks(200, seed=3):
+        assert parse_officer_details(block) == legacy_parse(block)
+
+
+def test_variant_labels_and_separators():
+    text = "1. Father's Name : Shri A\n2) Email Id - a@b.in\nCurrent Tehsil\tHuzur"
+    assert parse_officer_details(text) == {
+        "Father/Mother/Husband Name": "Shri A", "E-mail ID": "a@b.in", "Current Taluka": "Huzur",
+    }
+
+
+def test_last_occurrence_wins_and_empty_values_are_ignored():
+    text = "Designation Old Post\nDesignation New Post\nCurrent District\n"
+    assert parse_officer_details(text) == {"Designation": "New Post"}
+
+
+def test_labels_only_match_at_line_start_and_whole():
+    text = "Remarks: see Designation below\nDesignations pending\nDesignation District Judge"
+    assert parse_officer_details(text) == {"Designation": "District Judge"}
+
+
+def test_empty_and_missing_text():
+    assert parse_officer_details("") == {}
+    assert parse_officer_details(None) == {}
+    assert parse_details("") == OfficerDetails()
+
+
+def test_record_fields():
+    details = parse_details(SITE_BLOCK)
+    assert details.email == "officer1001@mphc.gov.in"
+    assert details.to_dict() == parse_officer_details(SITE_BLOCK)
@@ -0,0 +1,92 @@
+"""Checks for the N/A update merge in record_store (python -m pytest)"""
+from extraction import remove_duplicates_from_data
+from record_store import OfficerIndex, flatten_partitions, merge_na_values, partition_by_district
+
+
+def officer(name, district, officer_id="N/A", **fields):
+    record = {"Name": name, "District": district, "Officer ID": officer_id, "Designation": "N/A"}
+    record.update(fields)
+    return record
+
+
+def test_fills_missing_fields_by_officer_id():
+    partitions = partition_by_district([officer("Asha Rao", "Bhopal", "1001")])
+    index = OfficerIndex(flatten_partitions(partitions))
+
+    updated, added, touched = merge_na_values(
+        partitions, index, [officer("Asha Rao", "Bhopal", "1001", Designation="Civil Judge")]
+    )
+
+    assert (updated, added, touched) == (1, 0, {"Bhopal"})
+    assert partitions["Bhopal"] == [officer("Asha Rao", "Bhopal", "1001", Designation="Civil Judge")]
+
+
+def test_does_not_overwrite_filled_fields():
+    partitions = partition_by_district([officer("Asha Rao", "Bhopal", "1001", Designation="Civil Judge")])
+    index = OfficerIndex(flatten_partitions(partitions))
+
+    updated, added, touched = merge_na_values(
+        partitions, index, [officer("Asha Rao", "Bhopal", "1001", Designation="District Judge")]
+    )
+
+    assert (updated, added, touched) == (0, 0, set())
+    assert partitions["Bhopal"][0]["Designation"] == "Civil Judge"
+
+
+def test_name_match_gains_officer_id():
+    partitions = partition_by_district([officer("Asha Rao", "Bhopal")])
+    index = OfficerIndex(flatten_partitions(partitions))
+
+    merge_na_values(partitions, index, [officer("Asha Rao", "Bhopal", "1001")])
+
+    assert partitions["Bhopal"][0]["Officer ID"] == "1001"
+    assert index.find(officer("Renamed", "Bhopal", "1001")) is partitions["Bhopal"][0]
+
+
+def test_name_match_with_another_officer_id_is_a_new_officer():
+    partitions = partition_by_district([officer("Asha Rao", "Bhopal", "1001")])
+    index = OfficerIndex(flatten_partitions(partitions))
+
+    updated, added, _ = merge_na_values(partitions, index, [officer("Asha Rao", "Bhopal", "2002")])
+
+    assert (updated, added) == (0, 1)
+    assert len(partitions["Bhopal"]) == 2
+
+
+def test_transferred_officer_is_added_to_the_new_district():
+    partitions = partition_by_district([officer("Asha Rao", "Bhopal", "1001")])
+    index = OfficerIndex(flatten_partitions(partitions))
+
+    updated, added, touched = merge_na_values(
+        partitions, index, [officer("Asha Rao", "Indore", "1001", Designation="Civil Judge")]
+    )
+
+    assert (updated, added, touched) == (0, 1, {"Indore"})
+    assert partitions["Bhopal"] == [officer("Asha Rao", "Bhopal", "1001")]
+    assert partitions["Indore"][0]["Designation"] == "Civil Judge"
+
+
+def test_index_built_after_dedup_fills_the_kept_record():
+    # Two copies of one officer; the first is kept by remove_duplicates_from_data
+    partitions = partition_by_district([officer("Asha Rao", "Bhopal"), officer("Asha Rao", "Bhopal", "1001")])
+    for district, records in partitions.items():
+        partitions[district] = remove_duplicates_from_data(records)
+    index = OfficerIndex(flatten_partitions(partitions))
+
+    updated, _, _ = merge_na_values(partitions, index, [officer("Asha Rao", "Bhopal", Designation="Civil Judge")])
+
+    assert updated == 1
+    assert partitions["Bhopal"] == [officer("Asha Rao", "Bhopal", Designation="Civil Judge")]
+
+
+def test_float_officer_id_from_excel_matches_the_scraped_id():
+    # pandas reads a numeric Officer ID column from Excel as floats
+    partitions = partition_by_district([officer("Asha Rao", "Bhopal", 1001.0)])
+    index = OfficerIndex(flatten_partitions(partitions))
+
+    updated, added, touched = merge_na_values(
+        partitions, index, [officer("Asha Rao", "Bhopal", "1001", Designation="Civil Judge")]
+    )
+
+    assert (updated, added, touched) == (1, 0, {"Bhopal"})
+    assert partitions["Bhopal"][0]["Designation"] == "Civil Judge"
@@ -0,0 +1,29 @@
+"""Checks for table_parser (python -m pytest)"""
+from table_parser import parse_officer_table
+
+
+def officer_row(sno):
+    return (f"<tr><td>{sno}</td><td><a href=\"#\" onclick=\"jinfo('{1000 + sno}')\">Officer {sno}</a></td>"
+            f"<td>Civil Judge</td><td>Court {sno}</td></tr>")
+
+
+HEADER_ROW = "<tr><th>S.No</th><th>Name</th><th>Designation</th><th>Court</th></tr>"
+
+
+def test_parses_officer_rows():
+    rows = parse_officer_table("<table border='0'>" + HEADER_ROW + officer_row(1) + "</table>")
+
+    assert rows == [{"S.No": "1", "Name": "Officer 1", "Officer ID": "1001",
+                     "Designation": "Civil Judge", "Court": "Court 1"}]
+
+
+def test_nested_table_rows_are_read_once(capsys):
+    nested = "<table border='0'>" + officer_row(2) + officer_row(3) + "</table>"
+    html = ("<table border='0'>" + HEADER_ROW + officer_row(1)
+            + f"<tr><td colspan='4'>{nested}</td></tr>"
+            + "<tr><td>4</td><td>Vacant</td></tr></table>")
+
+    rows = parse_officer_table(html)
+
+    assert [row["Officer ID"] for row in rows] == ["1001", "1002", "1003"]
+    assert "Skipped 1 table rows" in capsys.readouterr().out
@@ -0,0 +1,74 @@
+"""Checks for the district table wait in waits (python -m pytest)"""
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from waits import PAGE_STATE_SCRIPT, TRACKER_SCRIPT, PageWaiter, WaitPolicy
+
+TEST_POLICY = WaitPolicy(
+    "TEST", initial_timeout=0.2, min_timeout=0.1, max_timeout=1.0, poll_interval=0.01,
+    stable_polls=2, between_districts_delay=(0.0, 0.0), retry_delay=0.0,
+)
+PREVIOUS_TABLE = "3|jinfo('1')|jinfo('3')"
+
+
+class ScriptedPage:
+    """Stands in for the driver: the tracker and table state the page scripts would return"""
+
+    def __init__(self, started=0, pending=0, signature=PREVIOUS_TABLE, links=3):
+        self.state = {"tracked": True, "started": started, "pending": pending, "completed": [],
+                      "ready": "complete", "signature": signature, "links": links}
+
+    def execute_script(self, script, *args):
+        if script == TRACKER_SCRIPT:
+            return 0
+        if script == PAGE_STATE_SCRIPT:
+            return dict(self.state)
+        raise AssertionError("unexpected script")
+
+
+def waiter_for(page):
+    waiter = PageWaiter(page, TEST_POLICY)
+    waiter.remember_table("table tr")
+    return waiter
+
+
+def test_completed_request_accepts_an_identical_table():
+    page = ScriptedPage()
+    waiter = waiter_for(page)
+    page.state["started"] = 1  # Request issued and completed, same rows as before
+
+    waiter.wait_for_table("table tr")
+
+    assert waiter.table_signature == PREVIOUS_TABLE
+
+
+def test_pending_request_times_out_and_backs_off():
+    page = ScriptedPage()
+    waiter = waiter_for(page)
+    page.state.update(started=1, pending=1)  # The district request never completes
+
+    with pytest.raises(TimeoutException):
+        waiter.wait_for_table("table tr")
+
+    assert waiter.timeouts["district_table"].timeouts == 1
+    assert waiter.timeouts["district_table"].value == pytest.approx(0.4)
+
+
+def test_no_request_accepts_the_unchanged_table_on_timeout():
+    page = ScriptedPage()
+    waiter = waiter_for(page)
+
+    waiter.wait_for_table("table tr")
+
+    assert waiter.table_signature == PREVIOUS_TABLE
+    assert waiter.timeouts["district_table"].timeouts == 0
+
+
+def test_no_request_accepts_a_changed_table_with_officer_links():
+    page = ScriptedPage()
+    waiter = waiter_for(page)
+    page.state.update(signature="2|jinfo('7')|jinfo('8')", links=2)
+
+    waiter.wait_for_table("table tr")
+
+    assert waiter.table_signature == "2|jinfo('7')|jinfo('8')"
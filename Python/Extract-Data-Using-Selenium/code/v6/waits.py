@@ -0,0 +1,316 @@
+"""
+Event-Driven Page Waits
+=======================
+Waits on concrete DOM conditions instead of fixed random sleeps:
+
+- the request fired by selecting a district in `menu_dist1` completing, and the
+  officer table then holding steady
+- the `jinfo` request for the clicked officer completing and `#jinfo` showing text
+- the facebox modal closing
+
+Request completion comes from a small tracker installed in the page that counts
+XHR/fetch requests, so an empty or unchanged district is recognized as loaded
+instead of being waited out until the timeout.
+
+Each condition learns its timeout from the latencies it has observed, and all
+waiting and politeness sleeps are reported to the performance tracker so runs
+show how much time was spent waiting versus working.
+"""
+import random
+import re
+import time
+
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException, TimeoutException
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class WaitPolicy:
+    """Timeout bounds, polling and politeness settings for a performance mode"""
+
+    def __init__(self, name, initial_timeout, min_timeout, max_timeout, poll_interval,
+                 stable_polls, between_districts_delay, retry_delay):
+        self.name = name
+        self.initial_timeout = initial_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.poll_interval = poll_interval
+        self.stable_polls = stable_polls  # Identical table samples needed to call it rendered
+        self.between_districts_delay = between_districts_delay  # Politeness pause, not readiness
+        self.retry_delay = retry_delay
+
+
+FAST_POLICY = WaitPolicy(
+    "FAST", initial_timeout=10.0, min_timeout=2.0, max_timeout=30.0, poll_interval=0.05,
+    stable_polls=2, between_districts_delay=(0.0, 0.2), retry_delay=0.1,
+)
+CONSERVATIVE_POLICY = WaitPolicy(
+    "CONSERVATIVE", initial_timeout=20.0, min_timeout=5.0, max_timeout=60.0, poll_interval=0.2,
+    stable_polls=3, between_districts_delay=(1.0, 2.0), retry_delay=0.3,
+)
+
+
+class AdaptiveTimeout:
+    """Timeout derived from observed latencies: mean + 4 deviations, within policy bounds"""
+
+    WARMUP_SAMPLES = 3
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.samples = 0
+        self.mean = 0.0
+        self.deviation = 0.0
+        self.timeouts = 0
+        self._value = policy.initial_timeout
+
+    def observe(self, seconds):
+        """Record a successful wait (exponentially weighted mean and deviation)"""
+        self.samples += 1
+        if self.samples == 1:
+            self.mean, self.deviation = seconds, seconds / 2
+        else:
+            error = seconds - self.mean
+            self.mean += 0.2 * error
+            self.deviation += 0.2 * (abs(error) - self.deviation)
+        if self.samples >= self.WARMUP_SAMPLES:
+            self._value = self.mean + 4 * self.deviation
+
+    def observe_timeout(self):
+        """Back off after a timeout so a slow spell does not fail every wait"""
+        self.timeouts += 1
+        self._value *= 2
+
+    @property
+    def value(self):
+        return min(self.policy.max_timeout, max(self.policy.min_timeout, self._value))
+
+
+# Counts the page's XHR/fetch requests in window.__requestTracker (installed once
+# per page load) and returns the serial of the last request started, as a mark
+TRACKER_SCRIPT = """
+if (!window.__requestTracker) {
+    var tracker = window.__requestTracker = {started: 0, pending: 0, completed: []};
+    var finish = function(serial, description) {
+        tracker.pending--;
+        tracker.completed.push([serial, description]);
+        if (tracker.completed.length > 50) { tracker.completed.shift(); }
+    };
+    var origOpen = XMLHttpRequest.prototype.open, origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function(method, url) {
+        this.__trackedUrl = String(url);
+        return origOpen.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function(body) {
+        var serial = ++tracker.started, description = this.__trackedUrl + ' ' + (typeof body === 'string' ? body : '');
+        tracker.pending++;
+        this.addEventListener('loadend', function() { finish(serial, description); });
+        try { return origSend.apply(this, arguments); }
+        catch (e) { finish(serial, description); throw e; }
+    };
+    if (window.fetch) {
+        var origFetch = window.fetch;
+        window.fetch = function(resource, init) {
+            var serial = ++tracker.started;
+            var description = ((typeof resource === 'string') ? resource : resource.url) + ' ' +
+                ((init && typeof init.body === 'string') ? init.body : '');
+            tracker.pending++;
+            return origFetch.apply(this, arguments).finally(function() { finish(serial, description); });
+        };
+    }
+}
+return window.__requestTracker.started;
+"""
+
+# Tracker state after `mark` plus a cheap table fingerprint, in one round trip
+PAGE_STATE_SCRIPT = """
+var tracker = window.__requestTracker, mark = arguments[1];
+var rows = document.querySelectorAll(arguments[0]);
+var links = document.querySelectorAll(arguments[0] + ' a[onclick]');
+var first = links.length ? links[0].getAttribute('onclick') : '';
+var last = links.length ? links[links.length - 1].getAttribute('onclick') : '';
+return {
+    tracked: !!tracker,
+    started: tracker ? tracker.started : 0,
+    pending: tracker ? tracker.pending : 0,
+    completed: tracker ? tracker.completed.filter(function(entry) { return entry[0] > mark; })
+                                         .map(function(entry) { return entry[1]; }) : [],
+    ready: document.readyState,
+    signature: rows.length + '|' + first + '|' + last,
+    links: links.length
+};
+"""
+
+
+def page_state(driver, selector, mark=0):
+    return driver.execute_script(PAGE_STATE_SCRIPT, selector, mark)
+
+
+def requests_finished(state, mark):
+    """True once a request started after `mark` has completed and none is pending, or the
+    page was replaced (the tracker is gone) and has loaded; None when nothing was requested"""
+    if not state["tracked"]:
+        return state["ready"] == "complete"
+    if state["started"] > mark:
+        return state["pending"] == 0
+    return None
+
+
+class DistrictTableLoaded:
+    """Condition: the district's table has loaded and held steady for N polls
+
+    Loaded means the request fired by the district change has completed. When the
+    page loads tables without a request, only a changed table with at least one
+    officer link counts, so a cleared or half-rendered table is never accepted.
+    """
+
+    def __init__(self, selector, previous, mark, stable_polls):
+        self.selector = selector
+        self.previous = previous
+        self.mark = mark
+        self.stable_polls = stable_polls
+        self._last = None
+        self._repeats = 0
+
+    def __call__(self, driver):
+        state = page_state(driver, self.selector, self.mark)
+        loaded = requests_finished(state, self.mark)
+        if loaded is None:
+            loaded = state["signature"] != self.previous and state["links"] > 0
+        if not loaded:
+            self._last, self._repeats = None, 0
+            return False
+        if state["signature"] == self._last:
+            self._repeats += 1
+        else:
+            self._last, self._repeats = state["signature"], 0
+        if self._repeats >= self.stable_polls - 1:
+            return state["signature"]
+        return False
+
+
+class JinfoLoaded:
+    """Condition: a request for `officer_id` started after the click has completed and #jinfo shows text
+
+    Identical details of two officers in a row are therefore recognized. When no
+    request mentions the ID, the requests have to finish and the text has to differ
+    from `previous` instead.
+    """
+
+    def __init__(self, officer_id, mark, previous):
+        self.id_pattern = re.compile(r"(?<![0-9A-Za-z])" + re.escape(str(officer_id)) + r"(?![0-9A-Za-z])")
+        self.mark = mark
+        self.previous = previous
+
+    def __call__(self, driver):
+        state = page_state(driver, "#jinfo", self.mark)
+        requested = any(self.id_pattern.search(request) for request in state["completed"])
+        if not requested and requests_finished(state, self.mark) is False:
+            return False
+        try:
+            text = driver.find_element(By.ID, "jinfo").text
+        except (NoSuchElementException, StaleElementReferenceException):
+            return False
+        if text.strip() and (requested or text != self.previous):
+            return text
+        return False
+
+
+class PageWaiter:
+    """Runs named DOM-condition waits with adaptive timeouts and time accounting"""
+
+    def __init__(self, driver, policy, tracker=None):
+        self.driver = driver
+        self.policy = policy
+        self.tracker = tracker
+        self.timeouts = {}
+        self.table_signature = None
+        self.table_mark = 0
+        self.jinfo_text = None
+        self.jinfo_mark = 0
+
+    def _timeout(self, name):
+        if name not in self.timeouts:
+            self.timeouts[name] = AdaptiveTimeout(self.policy)
+        return self.timeouts[name]
+
+    def wait_for(self, name, condition, back_off=True):
+        """Wait until `condition(driver)` is truthy; raises TimeoutException
+
+        With `back_off=False` a timeout is an accepted outcome and does not grow the timeout.
+        """
+        timeout = self._timeout(name)
+        start = time.perf_counter()
+        try:
+            result = WebDriverWait(
+                self.driver, timeout.value, poll_frequency=self.policy.poll_interval,
+                ignored_exceptions=(StaleElementReferenceException,),
+            ).until(condition)
+            timeout.observe(time.perf_counter() - start)
+            return result
+        except TimeoutException:
+            if back_off:
+                timeout.observe_timeout()
+            raise
+        finally:
+            if self.tracker:
+                self.tracker.add_wait(time.perf_counter() - start)
+
+    def track_requests(self):
+        """Install the request tracker if needed; returns the mark of requests started so far"""
+        return self.driver.execute_script(TRACKER_SCRIPT)
+
+    def remember_table(self, selector):
+        """Record the current table and request mark before a district change"""
+        self.table_mark = self.track_requests()
+        self.table_signature = page_state(self.driver, selector)["signature"]
+
+    def wait_for_table(self, selector):
+        """Wait for the officer table to load after a district change; raises TimeoutException
+
+        Only when the page started no request at all is the unchanged table accepted
+        on timeout (without backing off the timeout for later districts). A request
+        still pending, or one that finished without the table settling, backs off
+        and raises, so the previous district's table is never taken for this one.
+        """
+        condition = DistrictTableLoaded(selector, self.table_signature, self.table_mark, self.policy.stable_polls)
+        try:
+            self.table_signature = self.wait_for("district_table", condition, back_off=False)
+        except TimeoutException:
+            state = page_state(self.driver, selector, self.table_mark)
+            if requests_finished(state, self.table_mark) is not None:
+                self._timeout("district_table").observe_timeout()
+                raise
+            self.table_signature = state["signature"]
+
+    def remember_jinfo(self):
+        """Record the request mark before an officer link is clicked"""
+        self.jinfo_mark = self.track_requests()
+
+    def wait_for_jinfo(self, officer_id):
+        """Wait for #jinfo to show the requested officer and return its text"""
+        self.jinfo_text = self.wait_for("jinfo", JinfoLoaded(officer_id, self.jinfo_mark, self.jinfo_text))
+        return self.jinfo_text
+
+    def wait_for_facebox_closed(self):
+        self.wait_for("facebox_closed", EC.invisibility_of_element_located((By.ID, "facebox")))
+
+    def pause_between_districts(self):
+        """Politeness pause between districts (configured by the policy)"""
+        self.sleep(random.uniform(*self.policy.between_districts_delay))
+
+    def sleep(self, seconds):
+        if seconds <= 0:
+            return
+        time.sleep(seconds)
+        if self.tracker:
+            self.tracker.add_sleep(seconds)
+
+    def summary(self):
+        """Return {condition: (observed mean seconds, current timeout, timeouts hit)}"""
+        return {
+            name: (timeout.mean, timeout.value, timeout.timeouts)
+            for name, timeout in self.timeouts.items()
+        }
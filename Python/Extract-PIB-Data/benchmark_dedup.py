@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: row deduplication in extract_all_data
+================================================
+
+Compares the legacy `if record not in self.all_data` list scan with the
+hashed RowIndex on synthetic PIB-style rows, including re-scraped duplicates.
+
+    python benchmark_dedup.py                       # 10k and 50k rows
+    python benchmark_dedup.py --sizes 100000 --legacy-max 20000
+"""
+
+import argparse
+import random
+import time
+
+from row_index import RowIndex
+
+PAGE_SIZE = 25
+
+
+def make_pages(size, seed=42):
+    """Return pages of rows; about 5% of the pages are served twice (re-scrapes)"""
+    rng = random.Random(seed)
+    rows = [
+        [str(i + 1), f"Media Person {i}", f"Organisation {i % 900}", rng.choice(["Correspondent", "Editor", "Cameraman"]),
+         f"PIB/{i:06d}", rng.choice(["Delhi", "Mumbai", "Kolkata", "Chennai"]), f"{rng.randint(1, 28):02d}/01/2025"]
+        for i in range(size)
+    ]
+    pages = [rows[i:i + PAGE_SIZE] for i in range(0, size, PAGE_SIZE)]
+    for _ in range(len(pages) // 20):
+        position = rng.randrange(1, len(pages))
+        pages.insert(position, [list(row) for row in pages[position - 1]])
+    return pages
+
+
+def legacy_dedup(pages):
+    all_data = []
+    for page_data in pages:
+        for record in page_data:
+            if record not in all_data:
+                all_data.append(record)
+    return all_data
+
+
+def indexed_dedup(pages):
+    all_data, index = [], RowIndex()
+    for page_data in pages:
+        for record in page_data:
+            if index.add(record):
+                all_data.append(record)
+    return all_data
+
+
+def run(size, legacy_max):
+    pages = make_pages(size)
+    print(f"\n📊 {size:,} unique rows served as {sum(map(len, pages)):,} scraped rows on {len(pages):,} pages")
+
+    start = time.perf_counter()
+    data = indexed_dedup(pages)
+    indexed_time = time.perf_counter() - start
+    print(f"  ⚡ Hashed index: {indexed_time:.3f}s ({len(data):,} rows kept)")
+    assert len(data) == size, "Hashed index kept a duplicate or dropped a row"
+
+    start = time.perf_counter()
+    RowIndex.from_rows(data)
+    print(f"  🔁 Rebuild on resume: {time.perf_counter() - start:.3f}s")
+
+    if size > legacy_max:
+        print(f"  ⏭️  Legacy scan skipped (size > --legacy-max {legacy_max:,})")
+        return
+
+    start = time.perf_counter()
+    legacy_data = legacy_dedup(pages)
+    legacy_time = time.perf_counter() - start
+    print(f"  🐢 Legacy list scan: {legacy_time:.3f}s ({len(legacy_data):,} rows kept)")
+    print(f"  🚀 Speedup: {legacy_time / indexed_time:.0f}x")
+    assert legacy_data == data, "Hashed index differs from legacy scan"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--legacy-max", type=int, default=50000,
+                        help="largest size to run the quadratic list scan on")
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.legacy_max)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: HTML parsing per page
+================================
+
+CPU time spent parsing one PIB page the old way (a full html.parser tree for
+the rows, another for "Page X of Y", and one more per navigation poll) versus
+the page cache (one tree per page, regex for the pager text), on pages
+rendered by the stand-in server.
+
+    python benchmark_page_parse.py                 # 70-row pages, 2 polls per navigation
+    python benchmark_page_parse.py --rows 200 --polls 3 --pages 50
+"""
+
+import argparse
+import re
+import time
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from http_pager import HTML_PARSER, parse_page_info
+from standin_server import StandinSite
+
+
+def table_rows(soup):
+    """Row extraction shared by both variants (first table, non-empty rows)"""
+    rows = []
+    for row in soup.find_all('table')[0].find_all('tr'):
+        row_data = [cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])]
+        if any(row_data):
+            rows.append(row_data)
+    return rows
+
+
+def legacy_pagination(page_source):
+    soup = BeautifulSoup(page_source, 'html.parser')
+    pagination_text = soup.find(string=re.compile(r'Page \d+ of \d+'))
+    match = re.search(r'Page (\d+) of (\d+)', pagination_text) if pagination_text else None
+    return (int(match.group(1)), int(match.group(2))) if match else (None, None)
+
+
+def legacy_page(page_source, polls):
+    """Old flow: poll pager text (one parse each), re-check it, then parse for rows"""
+    for _ in range(polls):
+        legacy_pagination(page_source)
+    legacy_pagination(page_source)
+    return table_rows(BeautifulSoup(page_source, 'html.parser')), legacy_pagination(page_source)
+
+
+def cached_page(page_source, polls, parser):
+    """Page cache flow: regex for every pager check, one table-only parse"""
+    for _ in range(polls + 1):
+        parse_page_info(page_source)
+    soup = BeautifulSoup(page_source, parser, parse_only=SoupStrainer('table'))
+    return table_rows(soup), parse_page_info(page_source)
+
+
+def measure(label, function, sources):
+    start = time.process_time()
+    results = [function(source) for source in sources]
+    elapsed = time.process_time() - start
+    print(f"  {label:<34} {elapsed * 1000 / len(sources):7.2f} ms CPU/page")
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=30)
+    parser.add_argument("--rows", type=int, default=70, help="rows per page")
+    parser.add_argument("--polls", type=int, default=2, help="navigation polls per page in the old flow")
+    args = parser.parse_args()
+
+    site = StandinSite(pages=args.pages, rows_per_page=args.rows)
+    sources = [site.render(page) for page in range(1, args.pages + 1)]
+    print(f"📄 {args.pages} stand-in pages, {args.rows} rows each, {len(sources[0]) // 1024} KB per page")
+
+    legacy, legacy_time = measure("Legacy (html.parser, re-parsing)", lambda s: legacy_page(s, args.polls), sources)
+    for name in dict.fromkeys(["html.parser", HTML_PARSER]):
+        cached, cached_time = measure(f"Page cache ({name})", lambda s: cached_page(s, args.polls, name), sources)
+        assert cached == legacy, f"Page cache with {name} parses differently"
+        print(f"  🚀 {legacy_time / cached_time:.1f}x less CPU per page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: record storage and output loading
+============================================
+
+Memory held by the extracted records as the old list of row lists versus the
+columnar record table, and how long it takes to load the full dataset back
+from each output format, on rows generated like the stand-in server's.
+
+    python benchmark_records.py                   # 191 pages x 70 rows
+    python benchmark_records.py --pages 500 --rows 100
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from records import RecordTable
+from standin_server import HEADER, make_rows
+
+
+def scraped_rows(pages, rows_per_page):
+    """Rows as the scraper produces them: a fresh str object per cell"""
+    for page in range(1, pages + 1):
+        for row in make_rows(page, rows_per_page):
+            yield [''.join(list(cell)) for cell in row]
+
+
+def measure_memory(label, build):
+    tracemalloc.start()
+    store = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<28} {size / 1024 / 1024:7.1f} MB ({size / len(store):.0f} bytes/record)")
+    return store, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=191)
+    parser.add_argument("--rows", type=int, default=70, help="rows per page")
+    args = parser.parse_args()
+
+    print(f"📄 {args.pages * args.rows} records ({args.pages} pages x {args.rows} rows)")
+    print("Memory held by the records:")
+    legacy, legacy_size = measure_memory("List of row lists", lambda: [HEADER] + list(scraped_rows(args.pages, args.rows)))
+
+    def build_table():
+        table = RecordTable(HEADER)
+        for row in scraped_rows(args.pages, args.rows):
+            table.append(row)
+        return table
+
+    table, table_size = measure_memory("Record table", build_table)
+    print(f"  🚀 {legacy_size / table_size:.1f}x less memory")
+    assert list(table) == legacy[1:], "Record table returns different rows"
+
+    print("Loading the full dataset back:")
+    with tempfile.TemporaryDirectory() as directory:
+        for extension, read in ((".xlsx", pd.read_excel), (".csv", pd.read_csv), (".parquet", pd.read_parquet)):
+            path = os.path.join(directory, "records" + extension)
+            try:
+                table.write(path)
+                start = time.perf_counter()
+                df = read(path)
+                elapsed = time.perf_counter() - start
+            except ImportError as e:
+                print(f"  {extension:<10} skipped ({str(e).splitlines()[0]})")
+                continue
+            print(f"  {extension:<10} {elapsed * 1000:9.1f} ms  {os.path.getsize(path) / 1024:8.0f} KB  {len(df)} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Page Checkpoint Store
+=====================
+
+Append-only SQLite checkpoint for PIB extraction. Each page's new rows are
+committed in one transaction together with the page number, so a checkpoint
+costs only the new rows, and a crash loses at most the page being processed.
+
+Rows are stored with their dedup digests, so resuming restores both the
+collected rows and the dedup index without re-hashing or re-reading Excel.
+The digests also give each page a fingerprint, which refresh runs compare
+against the snapshot kept from the previous run (same format, see refresh.py).
+Refresh leaves the positional serial number out of its fingerprints, so those
+are computed from the rows instead.
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+
+from row_index import row_digest
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    page INTEGER PRIMARY KEY,
+    row_count INTEGER NOT NULL,
+    committed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    page INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (page, position)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Rows imported from an older Excel snapshot checkpoint, whose pages are unknown
+IMPORTED_PAGE = 0
+
+
+def page_fingerprint(digests):
+    """Hash of a page's row digests in order"""
+    return hashlib.sha1("".join(digests).encode("ascii")).hexdigest()
+
+
+class PageCheckpoint:
+    """Committed pages and their rows, in page order"""
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    def commit_page(self, page, rows, digests):
+        """Atomically record `page` as done with its new rows (replacing an earlier commit of it)
+
+        A page with no new rows is recorded too, and gets the fingerprint of an empty page.
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM rows WHERE page = ?", (page,))
+            self.connection.executemany(
+                "INSERT INTO rows (page, position, digest, data) VALUES (?, ?, ?, ?)",
+                [(page, position, digest, json.dumps(row))
+                 for position, (row, digest) in enumerate(zip(rows, digests))],
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO pages (page, row_count, committed_at) VALUES (?, ?, ?)",
+                (page, len(rows), datetime.now().isoformat()),
+            )
+
+    def set_meta(self, **values):
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in values.items()],
+            )
+
+    def get_meta(self, key, default=None):
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def committed_pages(self):
+        """Page numbers committed so far (excluding imported rows)"""
+        return [page for (page,) in self.connection.execute(
+            "SELECT page FROM pages WHERE page != ? ORDER BY page", (IMPORTED_PAGE,)
+        )]
+
+    def last_page(self):
+        """Highest committed page number, or None"""
+        pages = self.committed_pages()
+        return pages[-1] if pages else None
+
+    def missing_pages(self, total_pages):
+        """Pages 1..total_pages not committed yet, in order
+
+        Pages before the resume page of an imported v2.0 checkpoint (meta
+        `imported_through`) count as done, since their rows were imported.
+        """
+        done = set(self.committed_pages())
+        done.update(range(1, self.get_meta("imported_through", 0) + 1))
+        return [page for page in range(1, total_pages + 1) if page not in done]
+
+    def load(self):
+        """(rows, digests) of every committed row in page order"""
+        rows, digests = [], []
+        for digest, data in self.connection.execute("SELECT digest, data FROM rows ORDER BY page, position"):
+            rows.append(json.loads(data))
+            digests.append(digest)
+        return rows, digests
+
+    def load_pages(self, pages):
+        """{page: (rows, digests)} of the given pages"""
+        loaded = {page: ([], []) for page in pages}
+        for page in loaded:
+            for digest, data in self.connection.execute(
+                "SELECT digest, data FROM rows WHERE page = ? ORDER BY position", (page,)
+            ):
+                loaded[page][0].append(json.loads(data))
+                loaded[page][1].append(digest)
+        return loaded
+
+    def fingerprints(self, skip_column=None):
+        """{page: fingerprint} of every committed page
+
+        With `skip_column` the fingerprints are built from row digests that leave
+        that cell out (rehashing the rows) instead of the stored digests.
+        """
+        digests = {page: [] for (page,) in self.connection.execute("SELECT page FROM pages")}
+        if skip_column is None:
+            for page, digest in self.connection.execute("SELECT page, digest FROM rows ORDER BY page, position"):
+                digests.setdefault(page, []).append(digest)
+        else:
+            for page, data in self.connection.execute("SELECT page, data FROM rows ORDER BY page, position"):
+                digests.setdefault(page, []).append(row_digest(json.loads(data), skip_column))
+        return {page: page_fingerprint(page_digests) for page, page_digests in digests.items()}
+
+    def delete_pages(self, pages):
+        with self.connection:
+            for page in pages:
+                self.connection.execute("DELETE FROM rows WHERE page = ?", (page,))
+                self.connection.execute("DELETE FROM pages WHERE page = ?", (page,))
+
+    def row_count(self):
+        return self.connection.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
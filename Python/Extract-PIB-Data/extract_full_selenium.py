@@ -26,31 +26,117 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from bs4 import BeautifulSoup
-import re
+from bs4 import BeautifulSoup, SoupStrainer
+import contextlib
 import json
 import os
+import sys
 from datetime import datetime
 
+# Driver provisioning, the browser daemon and resource blocking are shared with the v6 scraper
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "selenium_common"))
+
+from browser_daemon import attach_browser, devtools_version
+from checkpoint_store import IMPORTED_PAGE, PageCheckpoint
+from driver_provisioning import cold_start, driver_service
+from http_pager import (
+    HTML_PARSER, POSTBACK_PATTERN, AspNetPager, PagerError, RateLimiter, build_session, parse_page_info, seek_step,
+)
+from parallel_pages import ViewstateCache, extract_pages_parallel, seek_pager
+from records import RecordTable, is_header_row
+from refresh import compare, delta_table, update_snapshot
+from resource_policy import POLICIES, ResourceCounters, enable_performance_log
+from row_index import RowIndex
+
+# Current page number from the "Page X of Y" pager text of the loaded document
+PAGE_NUMBER_SCRIPT = """
+var match = document.body && document.body.innerText.match(/Page (\\d+) of (\\d+)/);
+return match ? parseInt(match[1], 10) : null;
+"""
+
+# [link text, href] of every postback link of the loaded document, in document order
+POSTBACK_LINKS_SCRIPT = """
+return Array.prototype.map.call(document.querySelectorAll("a[href*='__doPostBack']"), function (a) {
+    return [a.textContent.trim(), a.getAttribute('href')];
+});
+"""
+
+# Click the postback link at index arguments[0] of the list above
+CLICK_POSTBACK_LINK_SCRIPT = """
+document.querySelectorAll("a[href*='__doPostBack']")[arguments[0]].click();
+"""
+
+class PageAdvanced:
+    """WebDriverWait condition: the pager shows a page after `old_page`
+    
+    One script call per poll; true as soon as the postback's page is in the DOM,
+    whether the document was replaced or the table updated in place.
+    """
+    def __init__(self, old_page):
+        self.old_page = old_page or 0
+        
+    def __call__(self, driver):
+        page = driver.execute_script(PAGE_NUMBER_SCRIPT)
+        if page and page > self.old_page:
+            return page
+        return False
+
+class PageChanged(PageAdvanced):
+    """WebDriverWait condition: the pager shows any page other than `old_page` (seeking backwards too)"""
+    def __call__(self, driver):
+        page = driver.execute_script(PAGE_NUMBER_SCRIPT)
+        if page and page != self.old_page:
+            return page
+        return False
+
 class PIBFullExtractor:
-    def __init__(self, headless=True, resume_from_page=1):
-        """Initialize the PIB full data extractor"""
-        self.base_url = "https://accreditation.pib.gov.in/acridexsrch.aspx"
-        self.all_data = []
+    def __init__(self, headless=True, resume_from_page=1, use_http=True, base_url=None, workers=1, refresh=False):
+        """Initialize the PIB full data extractor
+        
+        With use_http the pager is driven by direct ASP.NET postbacks over HTTP and
+        Chrome is only started if that fails. base_url can point at a stand-in server.
+        workers > 1 splits the page range between that many HTTP pagers.
+        With refresh the run is compared with the previous run's snapshot and only a
+        delta file (added/removed/changed records) and the updated snapshot are written.
+        """
+        self.base_url = base_url or "https://accreditation.pib.gov.in/acridexsrch.aspx"
+        self.all_data = RecordTable()  # Header detected once, data rows stored by column
+        self.scraped_header = None  # Header row as parsed from a page, until it is saved
+        self.row_index = RowIndex()  # Digests of the rows in all_data, for O(1) dedup
         self.current_page = resume_from_page
         self.total_pages = 191
         self.headless = headless
+        self.use_http = use_http
+        self.workers = workers
+        self.refresh = refresh
         self.driver = None
+        self.browser_daemon_port = None  # e.g. 9222: attach to `python browser_daemon.py start` instead of launching Chrome
+        self._browser_session = None  # ExitStack holding the daemon attachment
+        self.rate_limiter = None  # Shared politeness limiter, built from navigation_delay on setup
+        self.pager = None  # AspNetPager when paging over HTTP
+        self.html_parser = HTML_PARSER  # lxml when installed
+        self._page_cache = None  # [page source, parsed tables] of the current browser page
         
         # Performance settings
         self.page_load_timeout = 30
         self.element_wait_timeout = 10
-        self.navigation_delay = 2
+        self.navigation_delay = 0.25  # Minimum seconds between page requests (politeness, 0 disables)
+        self.navigation_poll = 0.05  # How often the page-change condition is checked
+        self.driver_offline = False  # Never download a chromedriver (driver cache, PATH or Selenium Manager's cache)
+        self.resource_policy = "pib"  # Requests the Selenium fallback blocks through DevTools (resource_policy.py)
+        self.resources = ResourceCounters()  # Blocked/loaded requests, read from the performance log
         
         # Progress tracking
-        self.checkpoint_interval = 10  # Save progress every 10 pages
-        self.checkpoint_file = "pib_extraction_progress.json"
+        self.checkpoint_interval = 10  # Log progress and ETA every 10 pages
+        self.checkpoint_file = "pib_extraction_progress.sqlite"  # Every page is committed here
+        self.legacy_checkpoint_file = "pib_extraction_progress.json"  # Excel snapshot checkpoints of v2.0
+        self.checkpoint = None
+        self.viewstate_file = "pib_viewstates.json"  # Captured form fields per page, for parallel workers
         self.output_file = f"PIB_Accredited_Media_Persons_FULL_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        self.snapshot_file = "pib_snapshot.sqlite"  # Pages of the last refresh run, kept between runs
+        self.snapshot_output_file = "PIB_Accredited_Media_Persons_SNAPSHOT.xlsx"
+        self.delta_file = f"PIB_Accredited_Media_Persons_DELTA_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        self.output_formats = (".xlsx",)  # Add ".parquet" (needs pyarrow) and/or ".csv" for typed columnar copies
         
         # Setup logging
         self.setup_logging()
@@ -85,10 +171,8 @@ class PIBFullExtractor:
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")  # Don't load images for faster performance
-        chrome_options.add_argument("--disable-javascript")  # We don't need JS except for navigation
         chrome_options.add_argument("--window-size=1920,1080")
+        enable_performance_log(chrome_options)  # Images, fonts, CSS are blocked by resource_policy, counted from this log
         
         # User agent
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
@@ -101,143 +185,281 @@ class PIBFullExtractor:
         }
         chrome_options.add_experimental_option("prefs", prefs)
         
+        self.rate_limiter = RateLimiter(self.navigation_delay)
+        if self.browser_daemon_port and devtools_version(self.browser_daemon_port):
+            # A fresh context of the long-lived browser: no Chrome startup for this run
+            self._browser_session = contextlib.ExitStack()
+            self.driver = self._browser_session.enter_context(
+                attach_browser(self.browser_daemon_port, offline=self.driver_offline,
+                               options=enable_performance_log(Options()))
+            )
+            self.driver.set_page_load_timeout(self.page_load_timeout)
+            self.apply_resource_policy()
+            self.logger.info(f"Attached to browser daemon on port {self.browser_daemon_port}")
+            return
+        if self.browser_daemon_port:
+            self.logger.warning(f"No browser daemon on port {self.browser_daemon_port}; launching Chrome")
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = webdriver.Chrome(service=driver_service(offline=self.driver_offline), options=chrome_options)
+            cold_start.mark("browser started")
             self.driver.set_page_load_timeout(self.page_load_timeout)
+            self.apply_resource_policy()
             self.logger.info("Optimized Chrome WebDriver initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize Chrome WebDriver: {e}")
             raise
-            
+
+    def apply_resource_policy(self):
+        """Block the requests the table scrape does not need (images, fonts, CSS, analytics)"""
+        policy = POLICIES[self.resource_policy]
+        policy.apply(self.driver)
+        self.logger.info(f"Resource policy: {policy.describe()}")
+            
+    def setup_pager(self):
+        """Open the search page over HTTP for postback paging (no browser)"""
+        self.rate_limiter = RateLimiter(self.navigation_delay)
+        pager = AspNetPager(self.base_url, session=build_session(), timeout=self.page_load_timeout,
+                            parser=self.html_parser, rate_limiter=self.rate_limiter)
+        try:
+            pager.open()
+            current_page, total_pages = pager.page_info()
+            if current_page is None:
+                raise PagerError("No 'Page X of Y' pager text on the search page")
+        except Exception:
+            pager.close()
+            raise
+        self.pager = pager
+        cold_start.mark("first page loaded")
+        self.logger.info(f"HTTP postback pager ready: page {current_page} of {total_pages}")
+        self.logger.info(cold_start.summary())
+        
+    def get_page_source(self):
+        """HTML of the current page from the HTTP pager or the browser
+        
+        Browser pages are fetched once and cached until navigation replaces them.
+        """
+        if self.pager:
+            return self.pager.html
+        if self._page_cache is None:
+            self._page_cache = [self.driver.page_source, None]
+        return self._page_cache[0]
+        
+    def get_page_soup(self):
+        """Parsed tree of the current page, built at most once per page"""
+        if self.pager:
+            return self.pager.soup
+        page_source = self.get_page_source()
+        if self._page_cache[1] is None:
+            # Only the tables are needed from browser pages; pager info comes from a regex
+            self._page_cache[1] = BeautifulSoup(page_source, self.html_parser, parse_only=SoupStrainer('table'))
+        return self._page_cache[1]
+        
     def load_progress(self):
-        """Load existing extraction progress"""
-        if os.path.exists(self.checkpoint_file):
-            try:
-                with open(self.checkpoint_file, 'r') as f:
-                    progress = json.load(f)
-                    
-                self.current_page = progress.get('current_page', 1)
-                saved_data_file = progress.get('data_file')
-                
-                if saved_data_file and os.path.exists(saved_data_file):
-                    # Load existing data
-                    df = pd.read_excel(saved_data_file)
-                    self.all_data = df.values.tolist()
-                    self.logger.info(f"Resumed from page {self.current_page} with {len(self.all_data)} existing records")
-                else:
-                    self.logger.info(f"Starting fresh from page {self.current_page}")
-                    
-            except Exception as e:
-                self.logger.error(f"Error loading progress: {e}. Starting fresh.")
-                self.current_page = 1
-                
-    def save_progress(self):
-        """Save current extraction progress"""
+        """Load existing extraction progress from the page checkpoint"""
         try:
-            # Save current data to temp file
-            temp_file = f"temp_pib_data_{self.current_page}.xlsx"
-            if self.all_data:
-                df = pd.DataFrame(self.all_data)
-                df.to_excel(temp_file, index=False)
-                
-            # Save progress info
-            progress = {
-                'current_page': self.current_page,
-                'total_pages': self.total_pages,
-                'records_extracted': len(self.all_data),
-                'data_file': temp_file,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            with open(self.checkpoint_file, 'w') as f:
-                json.dump(progress, f, indent=2)
+            self.checkpoint = PageCheckpoint(self.checkpoint_file)
+            last_page = self.checkpoint.last_page()
+            if last_page is None and os.path.exists(self.legacy_checkpoint_file):
+                self.import_legacy_checkpoint()
+                return
+            if last_page is None:
+                return
                 
-            self.logger.info(f"Progress saved: Page {self.current_page}, {len(self.all_data)} records")
+            self.restore_from_checkpoint()
+            self.total_pages = self.checkpoint.get_meta('total_pages', self.total_pages)
+            # Resume at the first page without a commit, which may lie below the last committed one
+            missing = self.checkpoint.missing_pages(self.total_pages)
+            self.current_page = missing[0] if missing else self.total_pages
+            self.logger.info(f"Resuming at page {self.current_page} with {len(self.all_data)} existing records "
+                             f"({len(missing)} pages still missing)")
             
         except Exception as e:
-            self.logger.error(f"Error saving progress: {e}")
-            
-    def extract_data_from_page(self):
-        """Extract data from current page with enhanced error handling"""
+            self.logger.error(f"Error loading progress: {e}. Starting fresh.")
+            if self.checkpoint:
+                self.checkpoint.close()
+            if os.path.exists(self.checkpoint_file):
+                os.replace(self.checkpoint_file, self.checkpoint_file + ".bad")
+            self.checkpoint = PageCheckpoint(self.checkpoint_file)
+            self.all_data, self.row_index = RecordTable(), RowIndex()
+            self.current_page = 1
+            
+    def restore_from_checkpoint(self):
+        """Rebuild all_data and the dedup index from the committed rows, in page order"""
+        rows, digests = self.checkpoint.load()
+        self.all_data = RecordTable(self.checkpoint.get_meta('header'))
+        for row in rows:
+            self.all_data.add(row)  # Checkpoints before the record table hold the header row on page 1
+        self.row_index = RowIndex(digests)
+            
+    def import_legacy_checkpoint(self):
+        """Move a v2.0 checkpoint (JSON + temp Excel snapshot) into the page checkpoint"""
+        with open(self.legacy_checkpoint_file, 'r') as f:
+            progress = json.load(f)
+            
+        self.current_page = progress.get('current_page', 1)
+        saved_data_file = progress.get('data_file')
+        
+        if saved_data_file and os.path.exists(saved_data_file):
+            # Text cells, so IDs keep their leading zeros
+            df = pd.read_excel(saved_data_file, dtype=str, keep_default_na=False)
+            self.row_index, records, digests = RowIndex(), [], []
+            self.all_data = RecordTable()
+            rows = df.values.tolist()
+            # v2.0 wrote the raw row lists: the columns are 0..N and the header is the first row
+            if is_header_row(df.columns):
+                rows.insert(0, df.columns.tolist())
+            for record in rows:
+                if self.all_data.header is None and is_header_row(record):
+                    self.save_header(record)
+                    continue
+                digest = self.row_index.add(record)
+                if digest:
+                    self.all_data.append(record)
+                    records.append(record)
+                    digests.append(digest)
+            self.checkpoint.commit_page(IMPORTED_PAGE, records, digests)
+            self.checkpoint.set_meta(imported_through=self.current_page - 1)
+            self.logger.info(f"Imported {len(self.all_data)} records from {saved_data_file}; "
+                             f"resuming from page {self.current_page}")
+        else:
+            self.logger.info(f"Starting fresh from page {self.current_page}")
+            
+    def save_header(self, header):
+        """Take the table header (first one seen) and keep it in the checkpoint"""
+        if self.all_data.header is None:
+            self.all_data.set_header(header)
+            self.checkpoint.set_meta(header=self.all_data.header)
+        self.scraped_header = None
+            
+    def save_progress(self, page_number, new_records, new_digests):
+        """Commit one page's new rows together with its page number"""
         try:
-            # Wait for table to be present
-            WebDriverWait(self.driver, self.element_wait_timeout).until(
-                EC.presence_of_element_located((By.TAG_NAME, "table"))
-            )
-            
-            # Get page source and parse
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            self.checkpoint.commit_page(page_number, new_records, new_digests)
+        except Exception as e:
+            self.logger.error(f"Error saving progress for page {page_number}: {e}")
             
-            # Find data table
-            tables = soup.find_all('table')
-            if not tables:
-                self.logger.warning(f"No tables found on page {self.current_page}")
-                return []
+    def add_page_records(self, page_number, page_data):
+        """Add a page's unique rows to all_data and checkpoint them; returns how many were new
+
+        The page is committed even when it adds no rows, so a page that was scraped
+        and empty is told apart from one that was never scraped.
+        """
+        if self.scraped_header:
+            self.save_header(self.scraped_header)
+        new_records, new_digests = [], []
+        for record in page_data:
+            digest = self.row_index.add(record)  # Hashed lookup instead of scanning all_data
+            if digest:
+                self.all_data.append(record)
+                new_records.append(record)
+                new_digests.append(digest)
+        self.save_progress(page_number, new_records, new_digests)
+        return len(new_records)
+        
+    def parse_page_data(self, soup, page_number=None):
+        """Parse the data rows out of a parsed page (the header row is kept aside, not returned)
+
+        Returns None when the page has no table (it did not load), and [] when the table has no rows.
+        """
+        page_number = page_number or self.current_page
+        
+        # Find data table
+        tables = soup.find_all('table')
+        if not tables:
+            self.logger.warning(f"No tables found on page {page_number}")
+            return None
+            
+        main_table = tables[0]
+        rows = main_table.find_all('tr')
+        
+        page_data = []
+        headers_found = False
+        
+        for i, row in enumerate(rows):
+            cells = row.find_all(['td', 'th'])
+            if not cells:
+                continue
                 
-            main_table = tables[0]
-            rows = main_table.find_all('tr')
-            
-            page_data = []
-            headers_found = False
-            
-            for i, row in enumerate(rows):
-                cells = row.find_all(['td', 'th'])
-                if not cells:
-                    continue
-                    
-                row_data = []
-                for cell in cells:
-                    text = cell.get_text(strip=True)
-                    row_data.append(text)
+            row_data = []
+            for cell in cells:
+                text = cell.get_text(strip=True)
+                row_data.append(text)
+            
+            # Skip empty rows
+            if not any(row_data):
+                continue
                 
-                # Skip empty rows
-                if not any(row_data):
-                    continue
-                    
-                # Detect header row
-                if not headers_found and any('SL.No' in str(cell).upper() or 'NAME' in str(cell).upper() for cell in row_data):
-                    headers_found = True
-                    if self.current_page == 1:  # Only add headers from first page
-                        page_data.append(row_data)
-                    continue
-                    
-                # Add data rows
-                if headers_found and len(row_data) >= 2:
-                    page_data.append(row_data)
-                    
-            self.logger.info(f"Extracted {len(page_data)} records from page {self.current_page}")
+            # Detect header row
+            if not headers_found and is_header_row(row_data):
+                headers_found = True
+                if self.scraped_header is None:
+                    self.scraped_header = row_data
+                continue
+                
+            # Add data rows
+            if headers_found and len(row_data) >= 2:
+                page_data.append(row_data)
+                
+        return page_data
+        
+    def extract_data_from_page(self):
+        """Extract data from current page with enhanced error handling; None when the page failed"""
+        try:
+            if not self.pager:
+                # Wait for table to be present
+                WebDriverWait(self.driver, self.element_wait_timeout).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "table"))
+                )
+            
+            page_data = self.parse_page_data(self.get_page_soup())
+            if page_data is not None:
+                self.logger.info(f"Extracted {len(page_data)} records from page {self.current_page}")
             return page_data
             
         except TimeoutException:
             self.logger.error(f"Timeout waiting for page {self.current_page} to load")
-            return []
+            return None
         except Exception as e:
             self.logger.error(f"Error extracting data from page {self.current_page}: {e}")
-            return []
+            return None
             
     def get_pagination_info(self):
         """Get current pagination information"""
         try:
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            pagination_text = soup.find(string=re.compile(r'Page \d+ of \d+'))
-            if pagination_text:
-                match = re.search(r'Page (\d+) of (\d+)', pagination_text)
-                if match:
-                    current_page = int(match.group(1))
-                    total_pages = int(match.group(2))
-                    return current_page, total_pages
-                    
-            return None, None
+            # A targeted regex on the raw HTML; no parse tree is built for this check
+            return parse_page_info(self.get_page_source())
             
         except Exception as e:
             self.logger.error(f"Error getting pagination info: {e}")
             return None, None
             
+    def navigate_to_next_page_http(self):
+        """Post back the lbNext link button over HTTP with retry logic"""
+        max_retries = 3
+        
+        for attempt in range(max_retries):
+            try:
+                if not self.pager.next_page():
+                    self.logger.info("No next page link found - reached last page")
+                    return False
+                    
+                new_page, _ = self.pager.page_info()
+                self.current_page = new_page
+                self.logger.info(f"✅ Successfully navigated to page {new_page}")
+                return True
+                
+            except Exception as e:
+                self.logger.error(f"Attempt {attempt + 1}: Error posting back to next page: {e}")
+                time.sleep(2)
+                
+        self.logger.error("Failed to navigate to next page after all retries")
+        return False
+        
     def navigate_to_next_page(self):
         """Navigate to next page with retry logic"""
+        if self.pager:
+            return self.navigate_to_next_page_http()
+            
         max_retries = 3
         
         for attempt in range(max_retries):
@@ -257,21 +479,25 @@ class PIBFullExtractor:
                 old_page, _ = self.get_pagination_info()
                 
                 # Click next link
+                self.rate_limiter.wait()
                 next_element = next_elements[0]
                 self.driver.execute_script("arguments[0].click();", next_element)
                 
-                # Wait for navigation with timeout
-                start_time = time.time()
-                while time.time() - start_time < self.page_load_timeout:
-                    time.sleep(1)
-                    new_page, _ = self.get_pagination_info()
-                    if new_page and new_page > old_page:
-                        self.current_page = new_page
-                        self.logger.info(f"✅ Successfully navigated to page {new_page}")
-                        return True
-                        
-                self.logger.warning(f"Attempt {attempt + 1}: Page navigation failed")
-                time.sleep(2)  # Wait before retry
+                # Wait for the next page to be in the DOM (no fixed sleeps)
+                try:
+                    new_page = WebDriverWait(
+                        self.driver, self.page_load_timeout, poll_frequency=self.navigation_poll,
+                        ignored_exceptions=(WebDriverException,),
+                    ).until(PageAdvanced(old_page))
+                except TimeoutException:
+                    self.logger.warning(f"Attempt {attempt + 1}: Page navigation failed")
+                    time.sleep(2)  # Wait before retry
+                    continue
+                    
+                self._page_cache = None  # New page: fetched and parsed once, on extraction
+                self.current_page = new_page
+                self.logger.info(f"✅ Successfully navigated to page {new_page}")
+                return True
                 
             except Exception as e:
                 self.logger.error(f"Attempt {attempt + 1}: Error navigating to next page: {e}")
@@ -279,7 +505,66 @@ class PIBFullExtractor:
                 
         self.logger.error("Failed to navigate to next page after all retries")
         return False
-        
+
+    def seek_browser(self, page):
+        """Click pager links in the browser until it shows `page`; returns the number of clicks
+
+        Same link choice as the HTTP pager: numbered links closest to the target,
+        Next/Previous when none gets closer. Each click waits for the pager text to change.
+        """
+        current, total = self.get_pagination_info()
+        if current is None:
+            raise PagerError("No 'Page X of Y' pager text to seek from")
+        hops = 0
+        while current != page:
+            if total is not None and hops > total:
+                raise PagerError(f"Seek to page {page} did not converge after {hops} clicks")
+            links = []
+            for text, href in self.driver.execute_script(POSTBACK_LINKS_SCRIPT):
+                match = POSTBACK_PATTERN.search(href or "")
+                links.append((text, match.group(1), match.group(2)) if match else (text, "", ""))
+            step = seek_step(links, current, page)
+            if step is None:
+                raise PagerError(f"No pager link leads from page {current} towards page {page}")
+            self.rate_limiter.wait()
+            index = next(i for i, link in enumerate(links) if link[1:] == step)
+            self.driver.execute_script(CLICK_POSTBACK_LINK_SCRIPT, index)
+            current = WebDriverWait(
+                self.driver, self.page_load_timeout, poll_frequency=self.navigation_poll,
+                ignored_exceptions=(WebDriverException,),
+            ).until(PageChanged(current))
+            self._page_cache = None
+            hops += 1
+        return hops
+
+    def seek_to_page(self, page):
+        """Jump to `page` for a resume and verify the "Page X of Y" text before extracting"""
+        start_time = time.time()
+        try:
+            if self.pager:
+                hops = seek_pager(self.pager, page, ViewstateCache(self.viewstate_file))
+            else:
+                hops = self.seek_browser(page)
+        except Exception as e:
+            self.logger.error(f"Could not seek to resume page {page}: {e}")
+            return False
+
+        shown_page, _ = self.get_pagination_info()
+        if shown_page != page:
+            self.logger.error(f"Seek to resume page {page} landed on page {shown_page}")
+            return False
+        self.current_page = page
+        self.logger.info(f"✅ Resumed at page {page} after {hops} postbacks ({time.time() - start_time:.1f}s)")
+        return True
+
+    def confirm_total_pages(self):
+        """Take the page count from the pager text and remember it in the checkpoint"""
+        _, total_pages = self.get_pagination_info()
+        if total_pages:
+            self.total_pages = total_pages
+            self.checkpoint.set_meta(total_pages=total_pages)
+            self.logger.info(f"Confirmed total pages: {total_pages}")
+            
     def extract_all_data(self):
         """Extract data from all pages with progress tracking"""
         try:
@@ -290,110 +575,184 @@ class PIBFullExtractor:
             self.logger.info(f"Output file: {self.output_file}")
             self.logger.info("="*80)
             
-            # Load first page
-            if self.current_page == 1:
+            # Load first page (the HTTP pager has already opened it)
+            if not self.pager:
                 self.driver.get(self.base_url)
+                self._page_cache = None
                 WebDriverWait(self.driver, self.page_load_timeout).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
-                
-                # Verify total pages
-                _, total_pages = self.get_pagination_info()
-                if total_pages:
-                    self.total_pages = total_pages
-                    self.logger.info(f"Confirmed total pages: {total_pages}")
-            
-            page_count = self.current_page
+                cold_start.mark("first page loaded")
+                self.logger.info(cold_start.summary())
+
+            # Verify total pages
+            self.confirm_total_pages()
+            self.current_page = min(self.current_page, self.total_pages)
+            # Every page without a commit is fetched, including gaps left by failed pages
+            pages_to_fetch = [page for page in self.checkpoint.missing_pages(self.total_pages)
+                              if page >= self.current_page]
+            if not pages_to_fetch:
+                self.logger.info("All pages are already committed")
+                return len(self.all_data) > 0
+            if self.pager and self.workers > 1:
+                return self.extract_all_data_parallel(pages_to_fetch[0])
+
+            # Resume: jump straight to the page instead of clicking Next from page 1
+            if pages_to_fetch[0] > 1 and not self.seek_to_page(pages_to_fetch[0]):
+                return False
+
             start_time = time.time()
+            pages_processed = 0
             
-            while page_count <= self.total_pages:
+            for position, page_count in enumerate(pages_to_fetch):
                 page_start_time = time.time()
                 
                 self.logger.info(f"Processing page {page_count}/{self.total_pages}")
                 
                 # Extract data from current page
                 page_data = self.extract_data_from_page()
+                pages_processed += 1
                 
-                if page_data:
-                    # Add unique records only
-                    new_records = 0
-                    for record in page_data:
-                        if record not in self.all_data:
-                            self.all_data.append(record)
-                            new_records += 1
-                            
+                if page_data is not None:
+                    # Add unique records only; the page is committed to the checkpoint with them, even when empty
+                    new_records = self.add_page_records(page_count, page_data)
+                    if not page_data:
+                        self.logger.warning(f"Page {page_count} has no records")
                     self.logger.info(f"Added {new_records} new records from page {page_count}")
                     self.logger.info(f"Total records: {len(self.all_data)}")
                 else:
+                    # Not committed, so the next resume starts at this page again
                     self.logger.warning(f"No data extracted from page {page_count}")
                 
-                # Save progress at checkpoints
-                if page_count % self.checkpoint_interval == 0:
-                    self.save_progress()
+                # Report progress at intervals (every page is already checkpointed)
+                if pages_processed % self.checkpoint_interval == 0:
                     elapsed_time = time.time() - start_time
-                    pages_processed = page_count - (self.current_page - 1)
                     avg_time_per_page = elapsed_time / pages_processed
-                    remaining_pages = self.total_pages - page_count
+                    remaining_pages = len(pages_to_fetch) - pages_processed
                     estimated_remaining_time = remaining_pages * avg_time_per_page
                     
-                    self.logger.info(f"CHECKPOINT: {page_count}/{self.total_pages} pages completed")
+                    self.logger.info(f"PROGRESS: {page_count}/{self.total_pages} pages completed")
                     self.logger.info(f"Average time per page: {avg_time_per_page:.2f} seconds")
                     self.logger.info(f"Estimated time remaining: {estimated_remaining_time/60:.1f} minutes")
+                    if self.driver:
+                        self.resources.collect(self.driver)  # Drain the performance log before it grows
                 
-                # Navigate to next page
-                if page_count < self.total_pages:
-                    if not self.navigate_to_next_page():
-                        self.logger.error(f"Failed to navigate from page {page_count}")
+                # Navigate to the next page to fetch, skipping pages committed by an earlier run
+                if position + 1 < len(pages_to_fetch):
+                    next_page = pages_to_fetch[position + 1]
+                    if next_page == page_count + 1:
+                        moved = self.navigate_to_next_page()
+                    else:
+                        moved = self.seek_to_page(next_page)
+                    if not moved:
+                        self.logger.error(f"Failed to navigate from page {page_count} to page {next_page}")
                         break
-                        
-                page_count += 1
-                
-                # Small delay between pages
-                time.sleep(self.navigation_delay)
                 
                 # Page timing info
                 page_time = time.time() - page_start_time
-                self.logger.debug(f"Page {page_count-1} processed in {page_time:.2f} seconds")
-            
-            # Final save
-            self.save_progress()
+                self.logger.debug(f"Page {page_count} processed in {page_time:.2f} seconds")
             
             total_time = time.time() - start_time
+            if pages_to_fetch[0] < (self.checkpoint.last_page() or 0):
+                # Gaps were filled after later pages; reload so the records are in page order
+                self.restore_from_checkpoint()
+            missing = self.checkpoint.missing_pages(self.total_pages)
             self.logger.info("="*80)
-            self.logger.info("EXTRACTION COMPLETED!")
-            self.logger.info(f"Total pages processed: {page_count - 1}")
+            self.logger.info("EXTRACTION COMPLETED!" if not missing else
+                             f"EXTRACTION INCOMPLETE: {len(missing)} pages missing, resume from page {missing[0]}")
+            pages_processed = max(pages_processed, 1)
+            self.logger.info(f"Total pages processed: {pages_processed}")
             self.logger.info(f"Total records extracted: {len(self.all_data)}")
             self.logger.info(f"Total time: {total_time/60:.1f} minutes")
-            self.logger.info(f"Average time per page: {total_time/(page_count-1):.2f} seconds")
+            self.logger.info(f"Average time per page: {total_time/pages_processed:.2f} seconds")
+            self.logger.info(f"Politeness waits: {self.rate_limiter.waited:.1f} seconds")
+            if self.driver:
+                self.resources.collect(self.driver)
+                self.logger.info(self.resources.summary())
             self.logger.info("="*80)
             
-            return len(self.all_data) > 0
+            return not missing and len(self.all_data) > 0
             
         except Exception as e:
             self.logger.error(f"Error during full extraction: {e}")
             return False
             
+    def extract_all_data_parallel(self, first_page):
+        """Extract the pages from `first_page` on with several HTTP pagers
+
+        Each page is committed as it arrives, so a crash loses at most the pages in
+        flight. Pages committed by an earlier run are not committed again, and the
+        records are put back in page order at the end.
+        """
+        start_time = time.time()
+        self.logger.info(f"Parallel extraction: pages {first_page}-{self.total_pages} with {self.workers} workers")
+        
+        committed = set(self.checkpoint.committed_pages())
+        
+        def commit_arrived(page_number, rows):
+            # Failed pages (None) stay uncommitted; empty pages are committed too
+            if rows is not None and page_number not in committed:
+                self.add_page_records(page_number, rows)
+        
+        cache = ViewstateCache(self.viewstate_file)
+        cache.put(1, self.pager.fields, self.pager.action_url)
+        pages, errors = extract_pages_parallel(
+            self.base_url, first_page, self.total_pages,
+            lambda page_number, soup: self.parse_page_data(soup, page_number),
+            workers=self.workers, cache=cache, timeout=self.page_load_timeout, rate_limiter=self.rate_limiter,
+            on_page=commit_arrived,
+        )
+        try:
+            cache.save()
+        except OSError as e:
+            self.logger.warning(f"Could not save viewstate cache: {e}")
+        
+        for (range_start, range_end), error in sorted(errors.items()):
+            self.logger.error(f"Worker for pages {range_start}-{range_end} stopped: {error}")
+        
+        # Pages were committed in arrival order; reload them so the output matches a sequential run
+        self.restore_from_checkpoint()
+        missing = self.checkpoint.missing_pages(self.total_pages)
+        self.current_page = missing[0] if missing else self.total_pages
+        
+        total_time = time.time() - start_time
+        self.logger.info("="*80)
+        self.logger.info("PARALLEL EXTRACTION COMPLETED!" if not missing else
+                         f"PARALLEL EXTRACTION INCOMPLETE: {len(missing)} pages missing, resume from page {missing[0]}")
+        self.logger.info(f"Total pages processed: {len(pages)}")
+        self.logger.info(f"Total records extracted: {len(self.all_data)}")
+        self.logger.info(f"Total time: {total_time/60:.1f} minutes")
+        self.logger.info(f"Politeness waits: {self.rate_limiter.waited:.1f} seconds")
+        self.logger.info("="*80)
+        
+        return not missing and len(self.all_data) > 0
+        
     def save_to_excel(self):
-        """Save all extracted data to Excel with formatting"""
+        """Save all extracted data to Excel (and any other output_formats) from the typed record table"""
         try:
+            missing = self.checkpoint.missing_pages(self.total_pages)
+            if missing:
+                # An export with gaps would look complete; keep the checkpoint so the run can resume
+                self.logger.error(f"Not exporting: {len(missing)} pages missing, resume from page {missing[0]}")
+                return False
             if not self.all_data:
                 self.logger.warning("No data to save")
                 return False
                 
-            # Create DataFrame
-            df = pd.DataFrame(self.all_data)
-            
-            # If first row looks like headers, use it
-            if len(df) > 0:
-                first_row = df.iloc[0].tolist()
-                if any('SL.No' in str(cell).upper() or 'NAME' in str(cell).upper() for cell in first_row):
-                    df.columns = first_row
-                    df = df.drop(df.index[0]).reset_index(drop=True)
-            
-            # Save to Excel
-            df.to_excel(self.output_file, index=False, engine='openpyxl')
+            base_name, primary_format = os.path.splitext(self.output_file)
+            df, written = None, []
+            for output_format in dict.fromkeys((primary_format,) + tuple(self.output_formats)):
+                output_file = base_name + output_format
+                try:
+                    df = self.all_data.write(output_file)
+                    written.append(output_file)
+                    self.logger.info(f"✅ Data saved to: {output_file}")
+                except (ImportError, ValueError) as e:
+                    self.logger.warning(f"Skipped {output_file}: {str(e).splitlines()[0]}")
+            if self.output_file not in written:
+                self.logger.error(f"Could not write {self.output_file}")
+                return False
             
-            self.logger.info(f"✅ Data saved to: {self.output_file}")
             self.logger.info(f"📊 Final statistics:")
             self.logger.info(f"   Rows: {len(df)}")
             self.logger.info(f"   Columns: {len(df.columns)}")
@@ -401,6 +760,8 @@ class PIBFullExtractor:
             # Display column names
             if len(df.columns) > 0:
                 self.logger.info(f"   Columns: {list(df.columns)}")
+                self.logger.info(f"   Memory: {df.memory_usage(deep=True).sum() / 1024 / 1024:.1f} MB "
+                                 f"({', '.join(f'{name}: {dtype}' for name, dtype in df.dtypes.items())})")
             
             # Clean up temporary files
             self.cleanup_temp_files()
@@ -411,13 +772,54 @@ class PIBFullExtractor:
             self.logger.error(f"Error saving to Excel: {e}")
             return False
             
+    def save_refresh(self):
+        """Write the changes since the previous refresh run and update the snapshot"""
+        missing = sorted(set(range(1, self.total_pages + 1)) - set(self.checkpoint.committed_pages()))
+        if missing:
+            # Missing pages would show up as removed records; keep the checkpoint so the run can resume
+            self.logger.error(f"Refresh needs every page; {len(missing)} missing, resume from page {missing[0]}")
+            return False
+            
+        snapshot = PageCheckpoint(self.snapshot_file)
+        try:
+            header = self.all_data.header
+            baseline = snapshot.last_page() is None
+            pages, changes = compare(snapshot, self.checkpoint, header)
+            update_snapshot(snapshot, self.checkpoint, pages, header)
+        finally:
+            snapshot.close()
+            
+        if baseline:
+            self.logger.info(f"No previous snapshot; this run ({len(self.all_data)} records) is the baseline")
+        else:
+            counts = {change: sum(1 for c in changes if c[0] == change) for change in ("added", "removed", "changed")}
+            self.logger.info(f"Refresh: {len(pages)} of {self.total_pages} pages changed; "
+                             + ", ".join(f"{count} {change}" for change, count in counts.items()))
+            if changes:
+                delta_table(changes, header).write(self.delta_file)
+                self.logger.info(f"✅ Delta saved to: {self.delta_file}")
+                
+        if pages:
+            self.all_data.write(self.snapshot_output_file)
+            self.logger.info(f"✅ Snapshot saved to: {self.snapshot_output_file}")
+        else:
+            self.logger.info(f"No changes; {self.snapshot_output_file} is up to date")
+            
+        self.cleanup_temp_files()
+        return True
+        
     def cleanup_temp_files(self):
         """Clean up temporary checkpoint files"""
         try:
-            if os.path.exists(self.checkpoint_file):
-                os.remove(self.checkpoint_file)
+            if self.checkpoint:
+                self.checkpoint.close()
+                self.checkpoint = None
+            for file in (self.checkpoint_file, self.checkpoint_file + "-wal", self.checkpoint_file + "-shm",
+                         self.legacy_checkpoint_file):
+                if os.path.exists(file):
+                    os.remove(file)
                 
-            # Remove temp data files
+            # Remove temp data files (v2.0 checkpoints)
             for file in os.listdir('.'):
                 if file.startswith('temp_pib_data_') and file.endswith('.xlsx'):
                     os.remove(file)
@@ -429,9 +831,20 @@ class PIBFullExtractor:
             
     def cleanup(self):
         """Close WebDriver and cleanup"""
-        if self.driver:
+        if self.checkpoint:
+            self.checkpoint.close()
+            self.checkpoint = None
+        if self.pager:
+            self.pager.close()
+            self.pager = None
+        if self._browser_session:
+            self._browser_session.close()  # Detach and dispose this run's context; the daemon keeps running
+            self._browser_session = None
+            self.logger.info("Detached from browser daemon")
+        elif self.driver:
             self.driver.quit()
             self.logger.info("WebDriver closed")
+        self.driver = None
             
     def run(self):
         """Main execution method for full extraction"""
@@ -440,23 +853,32 @@ class PIBFullExtractor:
             print("PIB Accredited Media Persons - FULL DATA EXTRACTION v2.0")
             print("="*80)
             print("🎯 Target: ALL 191 pages from PIB India")
-            print("🌐 URL: https://accreditation.pib.gov.in/acridexsrch.aspx")
+            print(f"🌐 URL: {self.base_url}")
             print(f"📁 Output: {self.output_file}")
-            print("🤖 Method: Selenium WebDriver (Optimized)")
             print(f"🔄 Resume from page: {self.current_page}")
-            print("-"*80)
             
-            # Setup WebDriver
-            self.setup_driver()
+            # Page over HTTP postbacks; fall back to a browser if the page does not allow it
+            if self.use_http:
+                try:
+                    self.setup_pager()
+                except Exception as e:
+                    self.logger.warning(f"HTTP postback pager unavailable ({e}); falling back to Selenium")
+            if self.pager:
+                print("🤖 Method: HTTP postback pager (no browser)")
+            else:
+                print("🤖 Method: Selenium WebDriver (Optimized)")
+                self.setup_driver()
+            print("-"*80)
             
             # Extract all data
             if self.extract_all_data():
-                # Save final results
-                if self.save_to_excel():
+                # Save final results (or only what changed since the last refresh)
+                saved = self.save_refresh() if self.refresh else self.save_to_excel()
+                if saved:
                     print("\n" + "="*80)
                     print("🎉 FULL EXTRACTION COMPLETED SUCCESSFULLY!")
                     print(f"📊 Total records extracted: {len(self.all_data)}")
-                    print(f"💾 Data saved to: {self.output_file}")
+                    print(f"💾 Data saved to: {self.snapshot_output_file if self.refresh else self.output_file}")
                     print("📋 Check log file for detailed extraction info")
                     print("="*80)
                     return True
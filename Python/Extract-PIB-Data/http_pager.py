@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+ASP.NET Postback Pager (HTTP)
+=============================
+
+Pages through acridexsrch.aspx without a browser by replaying what the
+`__doPostBack` JavaScript does: POST the page's form fields (__VIEWSTATE,
+__EVENTVALIDATION, ...) with __EVENTTARGET set to the pager link button.
+
+Uses a pooled `requests` session that keeps the ASP.NET session cookie.
+Each response is parsed once; the "Page X of Y" check is a regex on the raw
+HTML and does not need the tree.
+"""
+
+import re
+import threading
+import time
+from urllib.parse import urljoin
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import lxml  # noqa: F401 - only checks availability of the faster parser
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+POSTBACK_PATTERN = re.compile(r"__doPostBack\(\s*'([^']*)'\s*,\s*'([^']*)'\s*\)")
+PAGE_INFO_PATTERN = re.compile(r"Page (\d+) of (\d+)")
+NEXT_LINK_TEXTS = ("next", ">", "next >", "next >>")
+PREV_LINK_TEXTS = ("previous", "prev", "<", "< previous", "<< previous")
+PAGE_ARGUMENT_PATTERN = re.compile(r"^Page\$(\d+)$")
+
+
+class PagerError(Exception):
+    """The server did not return the page a postback asked for"""
+
+
+class RateLimiter:
+    """Spaces page requests at least `interval` seconds apart, across threads (0 disables)
+
+    Only the part of the interval the previous request did not already take is
+    slept, so slow responses are not delayed further.
+    """
+
+    def __init__(self, interval=0.0):
+        self.interval = interval or 0.0
+        self.waited = 0.0  # Total seconds slept, for reporting
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            self.waited += slot - now
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def build_session(pool_size=4, retries=3, user_agent=USER_AGENT):
+    """Session with a connection pool and retries on transient server errors
+
+    POST is retried too: a postback carries the viewstate of the page being
+    left, so replaying it returns the same page.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=retries, backoff_factor=0.5, status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = user_agent
+    return session
+
+
+def parse_page_info(html):
+    """(current page, total pages) from the "Page X of Y" text of raw HTML, or (None, None)"""
+    match = PAGE_INFO_PATTERN.search(html or "")
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    return None, None
+
+
+def form_fields(form):
+    """Name -> value of the fields a browser would submit with the form"""
+    fields = {}
+    for element in form.find_all("input"):
+        name = element.get("name")
+        if not name or element.get("type", "text").lower() in ("submit", "image", "button", "file"):
+            continue
+        if element.get("type", "").lower() in ("checkbox", "radio") and not element.has_attr("checked"):
+            continue
+        fields[name] = element.get("value", "")
+    for select in form.find_all("select"):
+        if select.get("name"):
+            option = select.find("option", selected=True) or select.find("option")
+            fields[select["name"]] = option.get("value", option.get_text()) if option else ""
+    for textarea in form.find_all("textarea"):
+        if textarea.get("name"):
+            fields[textarea["name"]] = textarea.get_text()
+    return fields
+
+
+def postback_links(soup):
+    """[(link text, event target, event argument)] of every __doPostBack link"""
+    links = []
+    for anchor in soup.find_all("a", href=True):
+        match = POSTBACK_PATTERN.search(anchor["href"])
+        if match:
+            links.append((anchor.get_text(strip=True), match.group(1), match.group(2)))
+    return links
+
+
+def seek_step(links, current, page):
+    """(target, argument) of the pager link that gets from `current` closest to `page`
+
+    `links` are postback links as returned by postback_links(). Numbered links
+    are preferred (the target itself, else the one closest to it); Next or
+    Previous is used when no numbered link gets closer. None if nothing leads
+    towards `page`.
+    """
+    numbered = {}
+    for _, target, argument in links:
+        match = PAGE_ARGUMENT_PATTERN.match(argument)
+        if match:
+            numbered[int(match.group(1))] = (target, argument)
+    if page in numbered:
+        return numbered[page]
+    closer = [n for n in numbered if abs(page - n) < abs(page - current)]
+    if closer:
+        return numbered[min(closer, key=lambda n: abs(page - n))]
+    forward = page > current
+    for text, target, argument in links:
+        if forward and (target.endswith("lbNext") or text.lower() in NEXT_LINK_TEXTS):
+            return target, argument
+        if not forward and (target.endswith("lbPrev") or text.lower() in PREV_LINK_TEXTS):
+            return target, argument
+    return None
+
+
+class AspNetPager:
+    """Current page of an ASP.NET WebForms pager, advanced by HTTP postbacks"""
+
+    def __init__(self, url, session=None, timeout=30, parser=HTML_PARSER, rate_limiter=None):
+        self.url = url
+        self.session = session or build_session()
+        self.timeout = timeout
+        self.parser = parser
+        self.rate_limiter = rate_limiter
+        self.html = None
+        self.soup = None
+        self.action_url = url
+        self.fields = {}
+        self.links = []
+
+    def _load(self, response):
+        response.raise_for_status()
+        self.html = response.text
+        self.soup = BeautifulSoup(self.html, self.parser)
+        form = self.soup.find("form")
+        if form is None or "__VIEWSTATE" not in form_fields(form):
+            raise PagerError(f"No ASP.NET form with __VIEWSTATE at {response.url}")
+        self.action_url = urljoin(response.url, form.get("action") or response.url)
+        self.fields = form_fields(form)
+        self.links = postback_links(self.soup)
+
+    def open(self):
+        """Load the first page (GET); returns its HTML"""
+        if self.rate_limiter:
+            self.rate_limiter.wait()
+        self._load(self.session.get(self.url, timeout=self.timeout))
+        return self.html
+
+    def page_info(self):
+        """(current page, total pages) from the "Page X of Y" text, or (None, None)"""
+        return parse_page_info(self.html)
+
+    def postback(self, target, argument=""):
+        """Submit the form as __doPostBack(target, argument) would; returns the new page HTML"""
+        data = dict(self.fields)
+        data["__EVENTTARGET"] = target
+        data["__EVENTARGUMENT"] = argument
+        headers = {"Referer": self.action_url, "Origin": urljoin(self.action_url, "/")}
+        if self.rate_limiter:
+            self.rate_limiter.wait()
+        self._load(self.session.post(self.action_url, data=data, headers=headers, timeout=self.timeout))
+        return self.html
+
+    def next_target(self):
+        """(target, argument) of the Next link button, or None on the last page"""
+        for text, target, argument in self.links:
+            if target.endswith("lbNext") or text.lower() in NEXT_LINK_TEXTS:
+                return target, argument
+        return None
+
+    def prev_target(self):
+        """(target, argument) of the Previous link button, or None on the first page"""
+        for text, target, argument in self.links:
+            if target.endswith("lbPrev") or text.lower() in PREV_LINK_TEXTS:
+                return target, argument
+        return None
+
+    def page_links(self):
+        """{page number: (target, argument)} of the numbered (GridView Page$N) pager links"""
+        numbered = {}
+        for _, target, argument in self.links:
+            match = PAGE_ARGUMENT_PATTERN.match(argument)
+            if match:
+                numbered[int(match.group(1))] = (target, argument)
+        return numbered
+
+    def restore(self, fields, action_url=None):
+        """Make a captured page's form fields the current ones, to post back from that page"""
+        self.fields = dict(fields)
+        if action_url:
+            self.action_url = action_url
+
+    def seek(self, page):
+        """Post back until the pager shows `page`; returns the number of postbacks
+
+        Jumps through numbered links (closest to the target first) and falls back
+        to Next/Previous. Each step is verified against the "Page X of Y" text.
+        """
+        current, total = self.page_info()
+        if current is None:
+            raise PagerError("No 'Page X of Y' pager text to seek from")
+        if total is not None and not 1 <= page <= total:
+            raise PagerError(f"Page {page} is outside 1..{total}")
+        hops = 0
+        while current != page:
+            if total is not None and hops > total:
+                raise PagerError(f"Seek to page {page} did not converge after {hops} postbacks")
+            step = seek_step(self.links, current, page)
+            if step is None:
+                raise PagerError(f"No pager link leads from page {current} towards page {page}")
+            self.postback(*step)
+            hops += 1
+            new_page, _ = self.page_info()
+            if new_page is None or new_page == current:
+                raise PagerError(f"Postback from page {current} did not move the pager")
+            current = new_page
+        return hops
+
+    def next_page(self):
+        """Post back to the next page; returns False on the last page
+
+        Raises PagerError if the response is not the following page.
+        """
+        next_link = self.next_target()
+        if next_link is None:
+            return False
+        old_page, _ = self.page_info()
+        self.postback(*next_link)
+        new_page, _ = self.page_info()
+        if old_page is not None and (new_page is None or new_page <= old_page):
+            raise PagerError(f"Postback from page {old_page} returned page {new_page}")
+        return True
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Parallel Page-Range Extraction
+==============================
+
+Splits the PIB page range into contiguous chunks and lets one HTTP postback
+pager per worker (each with its own ASP.NET session) extract a chunk.
+
+A worker reaches the start of its chunk by replaying the captured form fields
+of the page before it (viewstate fan-out) when a previous run saved them, and
+otherwise seeks through the numbered pager links. Each page is handed to the
+caller's thread as soon as a worker has parsed it, so the caller can
+checkpoint it right away, and results are also returned per page.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from http_pager import AspNetPager, build_session
+
+logger = logging.getLogger(__name__)
+
+
+def split_ranges(first, last, workers):
+    """Split pages first..last into at most `workers` contiguous (start, end) ranges"""
+    total = last - first + 1
+    if total <= 0:
+        return []
+    workers = max(1, min(workers, total))
+    size, extra = divmod(total, workers)
+    ranges, start = [], first
+    for worker in range(workers):
+        end = start + size - 1 + (1 if worker < extra else 0)
+        ranges.append((start, end))
+        start = end + 1
+    return ranges
+
+
+class ViewstateCache:
+    """Form fields (viewstate etc.) captured per page, shared by workers and saved between runs"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.pages = {}
+        self.action_url = None
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    saved = json.load(f)
+                self.action_url = saved.get('action_url')
+                self.pages = {int(page): fields for page, fields in saved.get('pages', {}).items()}
+            except (ValueError, OSError) as e:
+                logger.warning(f"Ignoring unreadable viewstate cache {path}: {e}")
+
+    def put(self, page, fields, action_url=None):
+        with self._lock:
+            self.pages[page] = dict(fields)
+            if action_url:
+                self.action_url = action_url
+
+    def get(self, page):
+        with self._lock:
+            return self.pages.get(page)
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = {'action_url': self.action_url, 'pages': self.pages}
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.path)
+
+
+def seek_pager(pager, page, cache=None):
+    """Move an opened pager to `page`; returns the number of postbacks it took
+
+    Replays Next from the captured viewstate of the page before when `cache`
+    has it (one postback), otherwise seeks through the numbered pager links.
+    """
+    previous = cache.get(page - 1) if cache and page > 1 else None
+    if previous and pager.page_info()[0] != page:
+        next_link = pager.next_target()
+        pager.restore(previous, cache.action_url)
+        try:
+            if next_link:
+                pager.postback(*next_link)
+                if pager.page_info()[0] == page:
+                    return 1
+        except Exception as e:
+            logger.info(f"Captured viewstate for page {page - 1} rejected ({e}); seeking instead")
+        pager.open()
+    return pager.seek(page)
+
+
+def open_at(url, page, cache=None, timeout=30, rate_limiter=None):
+    """Return an AspNetPager showing `page`, using a captured viewstate when possible"""
+    pager = AspNetPager(url, session=build_session(pool_size=2), timeout=timeout, rate_limiter=rate_limiter)
+    try:
+        pager.open()
+        seek_pager(pager, page, cache)
+        return pager
+    except Exception:
+        pager.close()
+        raise
+
+
+def extract_range(url, start, end, parse_page, cache=None, timeout=30, rate_limiter=None, on_page=None):
+    """Extract pages start..end with one pager
+
+    `parse_page(page_number, soup)` returns the rows of a page, and
+    `on_page(page_number, rows)` is called with each page as it is parsed. Returns
+    ({page number: rows}, error); on error the pages extracted so far are kept.
+    """
+    pages = {}
+    try:
+        pager = open_at(url, start, cache, timeout, rate_limiter)
+    except Exception as e:
+        return pages, e
+    try:
+        while True:
+            page, _ = pager.page_info()
+            pages[page] = parse_page(page, pager.soup)
+            if on_page:
+                on_page(page, pages[page])
+            if cache:
+                cache.put(page, pager.fields, pager.action_url)
+            if page >= end:
+                return pages, None
+            if not pager.next_page():
+                return pages, None
+    except Exception as e:
+        return pages, e
+    finally:
+        pager.close()
+
+
+def extract_pages_parallel(url, first, last, parse_page, workers=4, cache=None, timeout=30, rate_limiter=None,
+                           on_page=None):
+    """Extract pages first..last with `workers` concurrent pagers
+
+    A shared `rate_limiter` caps the combined request rate of all workers.
+    `on_page(page_number, rows)` is called in the calling thread as each page
+    arrives (in arrival order), so it can write to a connection owned by that thread.
+
+    Returns ({page number: rows}, {(start, end): error}) for the ranges that failed.
+    """
+    ranges = split_ranges(first, last, workers)
+    pages, errors = {}, {}
+    arrived = queue.Queue()
+    with ThreadPoolExecutor(max_workers=len(ranges) or 1) as executor:
+        futures = {
+            executor.submit(extract_range, url, start, end, parse_page, cache, timeout, rate_limiter,
+                            lambda page, rows: arrived.put((page, rows))): (start, end)
+            for start, end in ranges
+        }
+        # Workers queue a page before their future completes, so the queue is drained last
+        while not all(future.done() for future in futures) or not arrived.empty():
+            try:
+                page, rows = arrived.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if on_page:
+                on_page(page, rows)
+        for future, page_range in futures.items():
+            range_pages, error = future.result()
+            pages.update(range_pages)
+            if error is not None:
+                errors[page_range] = error
+    return pages, errors
+
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+PIB Record Table
+================
+
+Columnar store for extracted PIB rows. The header row is detected once and
+kept apart from the data. Each column is stored as its own list, and the
+low-cardinality columns (organisation, state, designation) are stored as
+integer codes into a list of distinct values, so a repeated organisation
+name is held once instead of once per record.
+
+`to_frame()` builds a typed pandas DataFrame (categorical columns, integer
+serial numbers), which `write()` saves as Excel, CSV or Parquet. Parquet
+needs pyarrow (or fastparquet) and loads the full dataset back in a fraction
+of the time an Excel file takes.
+"""
+
+import os
+from array import array
+
+import pandas as pd
+
+from row_index import normalize_cell
+
+# Lower-cased fragments of the header names stored as categoricals
+CATEGORY_KEYWORDS = ("organi", "state", "designation")
+
+# Output formats by file extension
+OUTPUT_FORMATS = {".xlsx": "excel", ".csv": "csv", ".parquet": "parquet"}
+
+
+def is_header_row(row):
+    """True for the results table header ("SL.No", "Name", ...)"""
+    return any('SL.NO' in str(cell).upper() or 'NAME' in str(cell).upper() for cell in row)
+
+
+def is_category_column(name):
+    name = str(name).lower()
+    return any(keyword in name for keyword in CATEGORY_KEYWORDS)
+
+
+class CategoryColumn:
+    """Column of repeated values stored as codes into `categories`"""
+
+    def __init__(self):
+        self.codes = array('i')
+        self.categories = []
+        self._lookup = {}
+
+    def append(self, value):
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, index):
+        return self.categories[self.codes[index]]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def to_series(self, name):
+        return pd.Series(pd.Categorical.from_codes(self.codes, self.categories), name=name)
+
+
+class TextColumn(list):
+    """Column of (mostly distinct) cell texts"""
+
+    def to_series(self, name):
+        series = pd.Series(self, name=name, dtype=object)
+        # Serial numbers become integers; numbers with leading zeros (IDs) stay text
+        if len(series) and series.str.fullmatch(r"0|[1-9]\d{0,17}").all():
+            return series.astype('int64').astype('Int64')
+        return series
+
+
+class RecordTable:
+    """Header plus columnar data rows"""
+
+    def __init__(self, header=None):
+        self.header = None
+        self.columns = []
+        self._length = 0
+        if header is not None:
+            self.set_header(header)
+
+    def set_header(self, header):
+        """Set the column names (once); cells beyond the header get generic names"""
+        if self.header is not None:
+            return
+        self.header = []
+        for name in header:
+            self._add_column(normalize_cell(name))
+
+    def _add_column(self, name):
+        name = name or f"Column {len(self.header) + 1}"
+        column = CategoryColumn() if is_category_column(name) else TextColumn()
+        for _ in range(self._length):
+            column.append("")
+        self.header.append(name)
+        self.columns.append(column)
+
+    def append(self, row):
+        """Add one data row (cells normalized to text, padded to the header width)"""
+        if self.header is None:
+            self.header = []
+        cells = [normalize_cell(cell) for cell in row]
+        while len(cells) > len(self.columns):
+            self._add_column("")
+        cells.extend([""] * (len(self.columns) - len(cells)))
+        for column, cell in zip(self.columns, cells):
+            column.append(cell)
+        self._length += 1
+
+    def add(self, row):
+        """Add a scraped row, taking the first header row as the header; returns True for data rows"""
+        if self.header is None and is_header_row(row):
+            self.set_header(row)
+            return False
+        self.append(row)
+        return True
+
+    def row(self, index):
+        return [column[index] for column in self.columns]
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self.row(index)
+
+    def __len__(self):
+        return self._length
+
+    def to_frame(self):
+        """Typed DataFrame of the data rows"""
+        if not self.columns:
+            return pd.DataFrame()
+        return pd.concat(
+            [column.to_series(name) for name, column in zip(self.header, self.columns)], axis=1
+        )
+
+    def write(self, path):
+        """Write the table to `path`, in the format given by its extension; returns the DataFrame"""
+        kind = OUTPUT_FORMATS.get(os.path.splitext(path)[1].lower())
+        if kind is None:
+            raise ValueError(f"Unsupported output format: {path} (use one of {', '.join(OUTPUT_FORMATS)})")
+        df = self.to_frame()
+        if kind == "excel":
+            df.to_excel(path, index=False, engine='openpyxl')
+        elif kind == "csv":
+            df.to_csv(path, index=False)
+        else:
+            df.to_parquet(path, index=False)  # ImportError without pyarrow/fastparquet
+        return df
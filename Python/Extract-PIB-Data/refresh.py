@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Incremental Refresh
+===================
+
+Change detection between the previous run's snapshot and a finished
+extraction. Both are PageCheckpoint stores, so every page has a fingerprint
+(hash of its row digests). Only pages whose fingerprint differs are loaded
+and compared record by record, keyed by the accreditation number (or the
+whole row when there is no such column).
+
+The SL.No column is a running number, so one record inserted or removed
+upstream renumbers every later row. It is left out of the digests that
+fingerprints and comparisons use, and out of the changed fields.
+
+The result is a delta of added, removed and changed records; the snapshot
+is then updated in place so the next refresh compares against this run.
+"""
+
+from datetime import datetime
+
+from records import RecordTable
+from row_index import normalize_row, row_digest
+
+# Lower-cased fragment of the header name identifying a record
+KEY_KEYWORD = "accreditation"
+# Lower-cased header names of the positional serial number column
+SERIAL_NAMES = ("sl.no", "sl. no", "s.no", "s. no", "sr.no", "sr. no", "serial no")
+
+CHANGE_COLUMNS = ["Change", "Changed Fields"]
+
+
+def key_column(header):
+    """Index of the record key column in `header`, or None"""
+    for index, name in enumerate(header or []):
+        if KEY_KEYWORD in str(name).lower():
+            return index
+    return None
+
+
+def serial_column(header):
+    """Index of the serial number column in `header`, or None"""
+    for index, name in enumerate(header or []):
+        if str(name).strip().lower() in SERIAL_NAMES:
+            return index
+    return None
+
+
+def changed_pages(snapshot, checkpoint, skip_column=None):
+    """Sorted page numbers whose fingerprints differ (including pages only one side has)"""
+    old, new = snapshot.fingerprints(skip_column), checkpoint.fingerprints(skip_column)
+    return sorted(page for page in old.keys() | new.keys() if old.get(page) != new.get(page))
+
+
+def keyed_records(pages, key_index, skip_column=None):
+    """{key: (digest, row)} of the rows of loaded pages, in page order; digests leave out `skip_column`"""
+    records = {}
+    for page in sorted(pages):
+        rows, _ = pages[page]
+        for row in rows:
+            digest = row_digest(row, skip_column)
+            cells = normalize_row(row)
+            key = cells[key_index] if key_index is not None and key_index < len(cells) else ""
+            records.setdefault(key or digest, (digest, row))
+    return records
+
+
+def compare(snapshot, checkpoint, header):
+    """([changed page numbers], [(change, changed fields, row)]) between a snapshot and a new run
+
+    `change` is "added", "removed" or "changed"; removed records carry their old
+    values, changed records their new values and the names of the fields that differ.
+    """
+    skip_column = serial_column(header)
+    pages = changed_pages(snapshot, checkpoint, skip_column)
+    if not pages:
+        return pages, []
+    key_index = key_column(header)
+    old = keyed_records(snapshot.load_pages(pages), key_index, skip_column)
+    new = keyed_records(checkpoint.load_pages(pages), key_index, skip_column)
+
+    changes = []
+    for key, (digest, row) in new.items():
+        if key not in old:
+            changes.append(("added", "", row))
+        elif old[key][0] != digest:
+            old_cells, new_cells = normalize_row(old[key][1]), normalize_row(row)
+            width = max(len(old_cells), len(new_cells))
+            old_cells += ("",) * (width - len(old_cells))
+            new_cells += ("",) * (width - len(new_cells))
+            fields = [
+                header[index] if header and index < len(header) else f"Column {index + 1}"
+                for index in range(width) if index != skip_column and old_cells[index] != new_cells[index]
+            ]
+            changes.append(("changed", ", ".join(fields), row))
+    for key, (_, row) in old.items():
+        if key not in new:
+            changes.append(("removed", "", row))
+    return pages, changes
+
+
+def update_snapshot(snapshot, checkpoint, pages, header):
+    """Copy the given pages from the finished run into the snapshot"""
+    current = checkpoint.load_pages(pages)
+    committed = set(checkpoint.committed_pages())
+    snapshot.delete_pages([page for page in pages if page not in committed])
+    for page in pages:
+        if page in committed:
+            snapshot.commit_page(page, *current[page])
+    snapshot.set_meta(header=header, refreshed_at=datetime.now().isoformat())
+
+
+def delta_table(changes, header):
+    """RecordTable of the changes, with the change type and changed fields in front"""
+    table = RecordTable(CHANGE_COLUMNS + list(header or []))
+    for change, fields, row in changes:
+        table.append([change, fields] + list(row))
+    return table
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Row Dedup Index
+===============
+
+Constant-time duplicate detection for extracted table rows.
+
+Rows are normalized (cell text stripped, NaN/None as empty, whole-number
+floats written as integers, trailing empty cells dropped) so a row scraped
+from the page and the same row read back from a checkpoint Excel file produce
+the same SHA-1 digest.
+"""
+
+import hashlib
+import math
+
+
+def normalize_cell(cell):
+    """Return the comparable text of one cell"""
+    if cell is None:
+        return ""
+    if isinstance(cell, float):
+        if math.isnan(cell):
+            return ""
+        if cell.is_integer():
+            return str(int(cell))
+    return str(cell).strip()
+
+
+def normalize_row(row):
+    """Return the row as a tuple of cell texts without trailing empty cells"""
+    cells = [normalize_cell(cell) for cell in row]
+    while cells and not cells[-1]:
+        cells.pop()
+    return tuple(cells)
+
+
+def row_digest(row, skip_column=None):
+    """Content hash of a normalized row, optionally leaving out the cell at `skip_column`"""
+    cells = normalize_row(row)
+    if skip_column is not None:
+        cells = cells[:skip_column] + cells[skip_column + 1:]
+    return hashlib.sha1("\x1f".join(cells).encode("utf-8")).hexdigest()
+
+
+class RowIndex:
+    """Set of row digests kept alongside the extracted rows"""
+
+    def __init__(self, digests=()):
+        self.digests = set(digests)
+
+    @classmethod
+    def from_rows(cls, rows):
+        return cls(row_digest(row) for row in rows)
+
+    def add(self, row):
+        """Add a row; returns its digest, or None if an identical row was already indexed"""
+        digest = row_digest(row)
+        if digest in self.digests:
+            return None
+        self.digests.add(digest)
+        return digest
+
+    def __contains__(self, row):
+        return row_digest(row) in self.digests
+
+    def __len__(self):
+        return len(self.digests)
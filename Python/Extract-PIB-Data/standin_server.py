@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+PIB Stand-in Server
+===================
+
+Local stand-in for https://accreditation.pib.gov.in/acridexsrch.aspx that
+emulates its ASP.NET postback pager, so the HTTP pager and the extractor can
+be checked without hitting PIB.
+
+Behaves like a WebForms page:
+- GET returns page 1 and sets an ASP.NET_SessionId cookie
+- paging is a form POST of __EVENTTARGET/__EVENTARGUMENT together with the
+  __VIEWSTATE and __EVENTVALIDATION fields of the page being left
+- lbNext/lbPrev link buttons and GridView-style numbered links (Page$N)
+  around the current page, plus First/Last
+- tampered or mismatched viewstate/event validation and postbacks without a
+  session are rejected with HTTP 500, like ASP.NET does
+
+Usage:
+    python standin_server.py --pages 191 --rows 70 --port 8766 --latency 0.2
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+PAGE_PATH = "/acridexsrch.aspx"
+CONTROL_PREFIX = "ctl00$ContentPlaceHolder1$"
+NEXT_TARGET = CONTROL_PREFIX + "lbNext"
+PREV_TARGET = CONTROL_PREFIX + "lbPrev"
+GRID_TARGET = CONTROL_PREFIX + "gvSearch"
+PAGER_WINDOW = 5  # Numbered links shown on each side of the current page
+
+HEADER = ["SL.No", "Name", "Organisation", "Designation", "Accreditation No", "State", "Valid Upto"]
+STATES = ["Delhi", "Maharashtra", "West Bengal", "Tamil Nadu", "Karnataka", "Uttar Pradesh"]
+DESIGNATIONS = ["Correspondent", "Editor", "Chief of Bureau", "Cameraman", "Photographer"]
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>PIB Accreditation Search (stand-in)</title></head>
+<body>
+<form method="post" action="./acridexsrch.aspx" id="form1">
+<input type="hidden" name="__EVENTTARGET" id="__EVENTTARGET" value="" />
+<input type="hidden" name="__EVENTARGUMENT" id="__EVENTARGUMENT" value="" />
+<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{viewstate}" />
+<input type="hidden" name="__VIEWSTATEGENERATOR" id="__VIEWSTATEGENERATOR" value="5B6503FA" />
+<input type="hidden" name="__EVENTVALIDATION" id="__EVENTVALIDATION" value="{eventvalidation}" />
+<script type="text/javascript">
+function __doPostBack(eventTarget, eventArgument) {{
+    var form = document.getElementById('form1');
+    form.__EVENTTARGET.value = eventTarget;
+    form.__EVENTARGUMENT.value = eventArgument;
+    form.submit();
+}}
+</script>
+<table id="ctl00_ContentPlaceHolder1_gvSearch" border="1">
+{rows}
+</table>
+<div class="pager">
+<span id="ctl00_ContentPlaceHolder1_lblPage">Page {page} of {total}</span>
+{links}
+</div>
+</form>
+</body></html>
+"""
+
+
+def make_rows(page, rows_per_page, revision=0):
+    """Deterministic rows of a page; each `revision` edits a few of them"""
+    rng = random.Random(page * 7919)
+    rows = []
+    for offset in range(rows_per_page):
+        number = (page - 1) * rows_per_page + offset + 1
+        rows.append([
+            str(number),
+            f"Media Person {number}",
+            f"Organisation {rng.randint(1, 900)}",
+            rng.choice(DESIGNATIONS),
+            f"PIB/{number:06d}",
+            rng.choice(STATES),
+            f"31/12/{2025 + rng.randint(0, 1)}",
+        ])
+    if revision:
+        changes = random.Random(page * 104729 + revision)
+        for _ in range(changes.randint(0, 2)):
+            rows[changes.randrange(len(rows))][2] = f"Organisation {changes.randint(901, 999)}"
+    return rows
+
+
+INSERTED_ROW = ["", "Media Person New", "Organisation 1", DESIGNATIONS[0], "PIB/999999", STATES[0], "31/12/2026"]
+
+
+def shifted_listing(pages, rows_per_page, revision=0, insert_before=None, delete=None):
+    """Rows of every page after one record is inserted before record `insert_before`
+    and/or record `delete` is removed
+
+    SL.No is renumbered like the site's running number, so the rows after the
+    change are renumbered and shift across page boundaries. The last page takes
+    the extra or missing row.
+    """
+    rows = [row for page in range(1, pages + 1) for row in make_rows(page, rows_per_page, revision)]
+    if delete:
+        rows = [row for row in rows if row[4] != f"PIB/{delete:06d}"]
+    if insert_before:
+        rows.insert(insert_before - 1, list(INSERTED_ROW))
+    for number, row in enumerate(rows, 1):
+        row[0] = str(number)
+    listing = [rows[(page - 1) * rows_per_page:page * rows_per_page] for page in range(1, pages)]
+    return listing + [rows[(pages - 1) * rows_per_page:]]
+
+
+class StandinSite:
+    """Paging state machine and signed viewstate of the stand-in"""
+
+    def __init__(self, pages=191, rows_per_page=70, revision=0, secret=None, insert_before=None, delete=None):
+        self.pages = pages
+        self.rows_per_page = rows_per_page
+        self.revision = revision
+        self.secret = secret or os.urandom(16)
+        self.sessions = set()
+        self.lock = threading.Lock()
+        self.listing = None  # Rows per page when a record was inserted or deleted
+        if insert_before or delete:
+            self.listing = shifted_listing(pages, rows_per_page, revision, insert_before, delete)
+
+    def page_rows(self, page):
+        if self.listing:
+            return self.listing[page - 1]
+        return make_rows(page, self.rows_per_page, self.revision)
+
+    def _sign(self, payload):
+        return hmac.new(self.secret, payload, hashlib.sha256).hexdigest()[:32]
+
+    def viewstate(self, page):
+        payload = base64.b64encode(json.dumps({"page": page, "nonce": uuid.uuid4().hex[:8]}).encode())
+        return payload.decode() + "." + self._sign(payload)
+
+    def read_viewstate(self, viewstate):
+        """Return the page a viewstate was issued for, or None if it was tampered with"""
+        payload, _, signature = viewstate.encode().partition(b".")
+        if not hmac.compare_digest(self._sign(payload), signature.decode()):
+            return None
+        try:
+            return json.loads(base64.b64decode(payload))["page"]
+        except (ValueError, KeyError):
+            return None
+
+    def allowed_events(self, page):
+        """(target, argument) pairs rendered on a page, as ASP.NET event validation records them"""
+        events = []
+        if page > 1:
+            events.append((PREV_TARGET, ""))
+        if page < self.pages:
+            events.append((NEXT_TARGET, ""))
+        for number in self.numbered_pages(page):
+            events.append((GRID_TARGET, f"Page${number}"))
+        return events
+
+    def numbered_pages(self, page):
+        low, high = max(1, page - PAGER_WINDOW), min(self.pages, page + PAGER_WINDOW)
+        return sorted({1, self.pages, *range(low, high + 1)} - {page})
+
+    def eventvalidation(self, viewstate, page):
+        events = json.dumps(self.allowed_events(page)).encode()
+        return base64.b64encode(events).decode() + "." + self._sign(viewstate.encode() + events)
+
+    def validate_event(self, viewstate, eventvalidation, target, argument):
+        payload, _, signature = eventvalidation.encode().partition(b".")
+        try:
+            events = base64.b64decode(payload)
+        except ValueError:
+            return False
+        if not hmac.compare_digest(self._sign(viewstate.encode() + events), signature.decode()):
+            return False
+        return [target, argument] in json.loads(events)
+
+    def render(self, page):
+        viewstate = self.viewstate(page)
+        rows = [HEADER] + self.page_rows(page)
+        # Header cells are <th>, data cells <td>
+        row_html = "\n".join(
+            "<tr>" + "".join(f"<{tag}>{escape(cell)}</{tag}>" for cell in row) + "</tr>"
+            for row, tag in zip(rows, ["th"] + ["td"] * (len(rows) - 1))
+        )
+        links = []
+        if page > 1:
+            links.append(f"<a id=\"ctl00_ContentPlaceHolder1_lbPrev\" "
+                         f"href=\"javascript:__doPostBack('{PREV_TARGET}','')\">&lt; Previous</a>")
+        for number in self.numbered_pages(page):
+            links.append(f"<a href=\"javascript:__doPostBack('{GRID_TARGET}','Page${number}')\">{number}</a>")
+        if page < self.pages:
+            links.append(f"<a id=\"ctl00_ContentPlaceHolder1_lbNext\" "
+                         f"href=\"javascript:__doPostBack('{NEXT_TARGET}','')\">Next &gt;</a>")
+        return PAGE_TEMPLATE.format(
+            viewstate=viewstate, eventvalidation=self.eventvalidation(viewstate, page),
+            rows=row_html, page=page, total=self.pages, links="\n".join(links),
+        )
+
+    def postback(self, form):
+        """Return the page a postback navigates to, or None if ASP.NET would reject it"""
+        viewstate = form.get("__VIEWSTATE", "")
+        target, argument = form.get("__EVENTTARGET", ""), form.get("__EVENTARGUMENT", "")
+        page = self.read_viewstate(viewstate) if viewstate else None
+        if page is None or not self.validate_event(viewstate, form.get("__EVENTVALIDATION", ""), target, argument):
+            return None
+        if target == NEXT_TARGET:
+            return page + 1
+        if target == PREV_TARGET:
+            return page - 1
+        return int(argument.split("$", 1)[1])
+
+
+def make_handler(site, latency, jitter):
+
+    class StandinHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _delay(self):
+            if latency or jitter:
+                time.sleep(latency + random.uniform(0, jitter))
+
+        def _send(self, status, body, cookie=None):
+            body = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            if cookie:
+                self.send_header("Set-Cookie", f"ASP.NET_SessionId={cookie}; path=/; HttpOnly")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _session(self):
+            for part in self.headers.get("Cookie", "").split(";"):
+                name, _, value = part.strip().partition("=")
+                if name == "ASP.NET_SessionId" and value in site.sessions:
+                    return value
+            return None
+
+        def do_GET(self):
+            if self.path.split("?")[0] != PAGE_PATH:
+                self._send(404, "Not found")
+                return
+            self._delay()
+            session = self._session()
+            cookie = None
+            if session is None:
+                cookie = uuid.uuid4().hex
+                with site.lock:
+                    site.sessions.add(cookie)
+            self._send(200, site.render(1), cookie)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            form = {key: values[0] for key, values in parse_qs(self.rfile.read(length).decode("utf-8"),
+                                                                keep_blank_values=True).items()}
+            if self.path.split("?")[0] != PAGE_PATH:
+                self._send(404, "Not found")
+                return
+            self._delay()
+            if self._session() is None:
+                self._send(500, "Session expired")
+                return
+            page = site.postback(form)
+            if page is None or not 1 <= page <= site.pages:
+                self._send(500, "Invalid postback or callback argument")
+                return
+            self._send(200, site.render(page))
+
+        def log_message(self, format, *args):
+            pass
+
+    return StandinHandler
+
+
+class StandinServer:
+    """Stand-in server running in a background thread"""
+
+    def __init__(self, pages=191, rows_per_page=70, host="127.0.0.1", port=0, latency=0.0, jitter=0.0,
+                 revision=0, insert_before=None, delete=None):
+        self.site = StandinSite(pages, rows_per_page, revision, insert_before=insert_before, delete=delete)
+        self.httpd = ThreadingHTTPServer((host, port), make_handler(self.site, latency, jitter))
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{PAGE_PATH}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the PIB accreditation search pager")
+    parser.add_argument("--pages", type=int, default=191)
+    parser.add_argument("--rows", type=int, default=70, help="rows per page")
+    parser.add_argument("--revision", type=int, default=0, help="data revision (changes some rows)")
+    parser.add_argument("--insert-before", type=int, help="insert a new record before this record number")
+    parser.add_argument("--delete", type=int, help="remove this record number (later rows are renumbered)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency (0..jitter seconds)")
+    args = parser.parse_args()
+
+    server = StandinServer(args.pages, args.rows, args.host, args.port, args.latency, args.jitter, args.revision,
+                           args.insert_before, args.delete)
+    print(f"🌐 PIB stand-in: {server.url} ({args.pages} pages x {args.rows} rows, latency {args.latency}s)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
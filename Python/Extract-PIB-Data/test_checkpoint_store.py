@@ -0,0 +1,124 @@
+"""Checks for checkpoint_store and refresh (python -m pytest)"""
+import pytest
+
+from checkpoint_store import IMPORTED_PAGE, PageCheckpoint, page_fingerprint
+from refresh import changed_pages, compare
+from row_index import row_digest
+from standin_server import HEADER as SITE_HEADER
+from standin_server import INSERTED_ROW, StandinSite
+
+HEADER = ["SL.No", "Name", "Accreditation No"]
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    store = PageCheckpoint(str(tmp_path / "progress.sqlite"))
+    yield store
+    store.close()
+
+
+def test_commit_and_load_in_page_order(checkpoint):
+    checkpoint.commit_page(2, [["2", "B", "002"]], ["b"])
+    checkpoint.commit_page(1, [["1", "A", "001"]], ["a"])
+
+    assert checkpoint.committed_pages() == [1, 2]
+    assert checkpoint.last_page() == 2
+    assert checkpoint.load() == ([["1", "A", "001"], ["2", "B", "002"]], ["a", "b"])
+
+
+def test_recommit_replaces_the_page(checkpoint):
+    checkpoint.commit_page(1, [["1", "A", "001"], ["2", "B", "002"]], ["a", "b"])
+    checkpoint.commit_page(1, [["3", "C", "003"]], ["c"])
+
+    assert checkpoint.load() == ([["3", "C", "003"]], ["c"])
+    assert checkpoint.row_count() == 1
+
+
+def test_empty_page_is_committed_with_a_fingerprint(checkpoint):
+    checkpoint.commit_page(1, [["1", "A", "001"]], ["a"])
+    checkpoint.commit_page(2, [], [])
+
+    assert checkpoint.committed_pages() == [1, 2]
+    assert checkpoint.fingerprints() == {1: page_fingerprint(["a"]), 2: page_fingerprint([])}
+
+
+def test_imported_rows_are_not_a_committed_page(checkpoint):
+    checkpoint.commit_page(IMPORTED_PAGE, [["1", "A", "001"]], ["a"])
+
+    assert checkpoint.committed_pages() == []
+    assert checkpoint.last_page() is None
+    assert checkpoint.row_count() == 1
+
+
+def test_meta_round_trip(checkpoint):
+    checkpoint.set_meta(header=HEADER, total_pages=3)
+
+    assert checkpoint.get_meta("header") == HEADER
+    assert checkpoint.get_meta("total_pages") == 3
+    assert checkpoint.get_meta("missing", "default") == "default"
+
+
+def test_refresh_tells_an_emptied_page_from_an_unchanged_one(tmp_path, checkpoint):
+    snapshot = PageCheckpoint(str(tmp_path / "snapshot.sqlite"))
+    try:
+        for store in (snapshot, checkpoint):
+            store.commit_page(1, [["1", "A", "001"]], ["a"])
+            store.commit_page(2, [], [])
+        snapshot.commit_page(3, [["2", "B", "002"]], ["b"])
+        checkpoint.commit_page(3, [], [])
+
+        assert changed_pages(snapshot, checkpoint) == [3]
+        assert compare(snapshot, checkpoint, HEADER) == ([3], [("removed", "", ["2", "B", "002"])])
+    finally:
+        snapshot.close()
+
+
+def test_missing_pages_include_gaps_below_the_last_page(checkpoint):
+    for page in (1, 2, 4):
+        checkpoint.commit_page(page, [], [])
+
+    assert checkpoint.missing_pages(5) == [3, 5]
+
+
+def test_pages_covered_by_an_imported_checkpoint_are_not_missing(checkpoint):
+    checkpoint.commit_page(IMPORTED_PAGE, [["1", "A", "001"]], ["a"])
+    checkpoint.set_meta(imported_through=3)
+
+    assert checkpoint.missing_pages(5) == [4, 5]
+
+
+def commit_site(store, site):
+    for page in range(1, site.pages + 1):
+        rows = site.page_rows(page)
+        store.commit_page(page, rows, [row_digest(row) for row in rows])
+
+
+@pytest.mark.parametrize("change, expected", [
+    ({"insert_before": 7}, [("added", "", "PIB/999999")]),
+    ({"delete": 7}, [("removed", "", "PIB/000007")]),
+])
+def test_renumbered_rows_are_not_reported_as_changed(tmp_path, checkpoint, change, expected):
+    snapshot = PageCheckpoint(str(tmp_path / "snapshot.sqlite"))
+    try:
+        commit_site(snapshot, StandinSite(pages=4, rows_per_page=5))
+        commit_site(checkpoint, StandinSite(pages=4, rows_per_page=5, **change))
+
+        pages, changes = compare(snapshot, checkpoint, SITE_HEADER)
+
+        assert pages == [2, 3, 4]  # Rows after the change shift across page boundaries
+        assert [(kind, fields, row[4]) for kind, fields, row in changes] == expected
+    finally:
+        snapshot.close()
+
+
+def test_serial_number_is_not_a_changed_field(tmp_path, checkpoint):
+    snapshot = PageCheckpoint(str(tmp_path / "snapshot.sqlite"))
+    try:
+        old_row = ["1"] + INSERTED_ROW[1:]
+        new_row = ["2", INSERTED_ROW[1], "Organisation 2"] + INSERTED_ROW[3:]
+        snapshot.commit_page(1, [old_row], [row_digest(old_row)])
+        checkpoint.commit_page(1, [new_row], [row_digest(new_row)])
+
+        assert compare(snapshot, checkpoint, SITE_HEADER)[1] == [("changed", "Organisation", new_row)]
+    finally:
+        snapshot.close()
@@ -0,0 +1,132 @@
+"""Resume checks for PIBFullExtractor that need no browser (python -m pytest)"""
+import json
+
+import pandas as pd
+import pytest
+
+from checkpoint_store import PageCheckpoint
+from extract_full_selenium import PIBFullExtractor
+from http_pager import RateLimiter
+from standin_server import StandinServer
+
+HEADER = ["SL.No", "Name", "Organisation", "Designation", "Accreditation No", "State", "Valid Upto"]
+ROWS = [
+    ["1", "Asha Rao", "Daily News", "Reporter", "001", "Delhi", "31/12/2026"],
+    ["2", "Vikram Sen", "Daily News", "Editor", "0042", "Delhi", "31/12/2026"],
+]
+PAGE_3_ROW = ["3", "Meera Das", "Daily News", "Editor", "0043", "Goa", "31/12/2026"]
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def write_v2_checkpoint(rows, current_page=4):
+    """Checkpoint as v2.0 wrote it: the raw row lists (header row included) in a temp Excel file"""
+    data_file = f"temp_pib_data_{current_page - 1}.xlsx"
+    pd.DataFrame(rows).to_excel(data_file, index=False, engine="openpyxl")
+    with open("pib_extraction_progress.json", "w") as f:
+        json.dump({"current_page": current_page, "data_file": data_file}, f)
+
+
+def test_legacy_checkpoint_takes_header_from_the_header_row(workdir):
+    write_v2_checkpoint([HEADER] + ROWS)
+
+    extractor = PIBFullExtractor()
+    try:
+        assert extractor.current_page == 4
+        assert extractor.all_data.header == HEADER
+        assert list(extractor.all_data) == ROWS  # Header row is not a record; IDs keep leading zeros
+        assert extractor.checkpoint.get_meta("header") == HEADER
+        assert extractor.checkpoint.load()[0] == ROWS
+    finally:
+        extractor.checkpoint.close()
+
+
+def test_legacy_checkpoint_without_header_row_leaves_header_to_the_scrape(workdir):
+    write_v2_checkpoint(ROWS)
+
+    extractor = PIBFullExtractor()
+    try:
+        assert extractor.checkpoint.get_meta("header") is None
+        assert list(extractor.all_data) == ROWS
+    finally:
+        extractor.checkpoint.close()
+
+
+def test_resume_from_page_checkpoint(workdir):
+    checkpoint = PageCheckpoint("pib_extraction_progress.sqlite")
+    checkpoint.set_meta(header=HEADER, total_pages=5)
+    checkpoint.commit_page(1, ROWS[:1], ["a"])
+    checkpoint.commit_page(2, ROWS[1:], ["b"])
+    checkpoint.close()
+
+    extractor = PIBFullExtractor()
+    try:
+        assert extractor.current_page == 3
+        assert extractor.total_pages == 5
+        assert list(extractor.all_data) == ROWS
+    finally:
+        extractor.checkpoint.close()
+
+
+def test_page_without_new_rows_is_committed(workdir):
+    extractor = PIBFullExtractor()
+    try:
+        extractor.add_page_records(1, ROWS)
+        extractor.add_page_records(2, ROWS)  # Only duplicates
+        extractor.add_page_records(3, [])
+
+        assert extractor.checkpoint.committed_pages() == [1, 2, 3]
+        assert list(extractor.all_data) == ROWS
+    finally:
+        extractor.checkpoint.close()
+
+
+def test_resume_fetches_a_page_missing_below_the_last_committed_page(workdir, monkeypatch):
+    checkpoint = PageCheckpoint("pib_extraction_progress.sqlite")
+    checkpoint.set_meta(header=HEADER, total_pages=4)
+    checkpoint.commit_page(1, ROWS[:1], ["a"])
+    checkpoint.commit_page(2, [], [])
+    checkpoint.commit_page(4, ROWS[1:], ["b"])
+    checkpoint.close()
+
+    extractor = PIBFullExtractor()
+    fetched = []
+    monkeypatch.setattr(extractor, "confirm_total_pages", lambda: None)
+    monkeypatch.setattr(extractor, "seek_to_page", lambda page: fetched.append(page) or True)
+    monkeypatch.setattr(extractor, "extract_data_from_page", lambda: [PAGE_3_ROW])
+    extractor.pager = object()  # Pages over HTTP, so no browser is opened
+    extractor.rate_limiter = RateLimiter(0)
+    try:
+        assert extractor.current_page == 3
+        assert extractor.extract_all_data()
+        assert fetched == [3]
+        assert extractor.checkpoint.missing_pages(4) == []
+        assert [row[0] for row in extractor.all_data] == ["1", "3", "2"]  # Page order: 1, 3, 4
+    finally:
+        extractor.checkpoint.close()
+
+
+def test_parallel_resume_fills_the_gap_from_the_standin_server(workdir):
+    with StandinServer(pages=6, rows_per_page=5) as server:
+        reference = PIBFullExtractor(base_url=server.url)
+        reference.navigation_delay = 0
+        reference.setup_pager()
+        assert reference.extract_all_data()
+        expected = list(reference.all_data)
+        reference.checkpoint.delete_pages([3])
+        reference.cleanup()
+
+        extractor = PIBFullExtractor(base_url=server.url, workers=2)
+        extractor.navigation_delay = 0
+        try:
+            assert extractor.current_page == 3
+            extractor.setup_pager()
+            assert extractor.extract_all_data()
+            assert extractor.checkpoint.missing_pages(6) == []
+            assert list(extractor.all_data) == expected
+        finally:
+            extractor.cleanup()
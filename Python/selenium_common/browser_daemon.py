@@ -0,0 +1,294 @@
+"""
+Persistent Browser Daemon
+=========================
+Keeps one Chrome running with remote debugging so extraction runs attach to it
+instead of paying browser startup on every run. A small supervisor checks the
+DevTools endpoint and restarts Chrome when it stops answering.
+
+Each run gets its own browser context (separate cookies, cache and storage,
+like an incognito window), which is disposed when the run detaches, so runs
+do not see each other's sessions and nothing piles up in the long-lived browser.
+
+    python browser_daemon.py start [--port 9222]   # supervise Chrome (foreground; use systemd/nohup)
+    python browser_daemon.py status
+    python browser_daemon.py stop
+
+Runs attach with `attach_browser(port)`, a context manager yielding a WebDriver.
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+
+import requests
+import websocket  # websocket-client, installed with selenium
+from selenium import webdriver
+
+from driver_provisioning import CHROME_CANDIDATES, cold_start, driver_service
+
+DEFAULT_PORT = 9222
+STATE_DIR = os.environ.get("BROWSER_DAEMON_DIR", os.path.join(os.path.expanduser("~"), ".cache", "browser-daemon"))
+HEALTH_INTERVAL = 5.0  # Seconds between health checks
+FAILURES_BEFORE_RESTART = 2  # Consecutive failed checks before Chrome is restarted
+CHROME_ARGS = [
+    "--headless=new",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--window-size=1920,1080",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions",
+    "--no-first-run",
+    "--no-default-browser-check",
+]
+WINDOWS_CHROME = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
+
+
+def find_chrome():
+    for candidate in CHROME_CANDIDATES + [WINDOWS_CHROME]:
+        path = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def devtools_version(port, timeout=2.0):
+    """/json/version of the browser on `port` (health check), or None if it does not answer"""
+    try:
+        response = requests.get(f"http://127.0.0.1:{port}/json/version", timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+
+def state_path(port):
+    return os.path.join(STATE_DIR, f"daemon-{port}.json")
+
+
+def read_state(port):
+    try:
+        with open(state_path(port), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_state(port, state):
+    os.makedirs(STATE_DIR, exist_ok=True)
+    temp_path = state_path(port) + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(temp_path, state_path(port))
+
+
+class DevToolsBrowser:
+    """Browser-level DevTools connection (Target domain calls need it, not a page session)"""
+
+    def __init__(self, websocket_url, timeout=10):
+        self.connection = websocket.create_connection(websocket_url, timeout=timeout, suppress_origin=True)
+        self._ids = itertools.count(1)
+
+    def call(self, method, **params):
+        message_id = next(self._ids)
+        self.connection.send(json.dumps({"id": message_id, "method": method, "params": params}))
+        while True:
+            message = json.loads(self.connection.recv())
+            if message.get("id") != message_id:
+                continue  # Events and replies to other calls
+            if "error" in message:
+                raise RuntimeError(f"{method}: {message['error'].get('message')}")
+            return message.get("result", {})
+
+    def close(self):
+        self.connection.close()
+
+
+class BrowserDaemon:
+    """One Chrome process with remote debugging on `port` and a persistent profile"""
+
+    def __init__(self, port=DEFAULT_PORT, chrome_binary=None, profile_dir=None, args=None):
+        self.port = port
+        self.chrome_binary = chrome_binary or find_chrome()
+        self.profile_dir = profile_dir or os.path.join(STATE_DIR, f"profile-{port}")
+        self.args = CHROME_ARGS if args is None else args
+        self.process = None
+
+    def start(self, timeout=30):
+        if not self.chrome_binary:
+            raise RuntimeError("Chrome not found; pass --chrome")
+        os.makedirs(self.profile_dir, exist_ok=True)
+        self.process = subprocess.Popen(
+            [self.chrome_binary, f"--remote-debugging-port={self.port}", f"--user-data-dir={self.profile_dir}",
+             *self.args, "about:blank"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True,
+        )
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Chrome exited with code {self.process.returncode} during startup")
+            if devtools_version(self.port):
+                return
+            time.sleep(0.1)
+        self.stop()
+        raise RuntimeError(f"Chrome did not open DevTools on port {self.port} within {timeout}s")
+
+    def healthy(self):
+        return self.process is not None and self.process.poll() is None and devtools_version(self.port) is not None
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.process = None
+
+
+def supervise(daemon, interval=HEALTH_INTERVAL):
+    """Run Chrome and restart it whenever health checks fail, until SIGTERM/SIGINT"""
+    stopping = []
+    for signal_number in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signal_number, lambda *_: stopping.append(True))
+
+    state = {"supervisor_pid": os.getpid(), "port": daemon.port, "restarts": 0,
+             "started_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+    failures, backoff = 0, 1.0
+    try:
+        daemon.start()
+        print(f"🌐 Browser daemon on port {daemon.port} (Chrome pid {daemon.process.pid})")
+        while not stopping:
+            state.update(chrome_pid=daemon.process.pid if daemon.process else None,
+                         checked_at=time.strftime("%Y-%m-%d %H:%M:%S"))
+            write_state(daemon.port, state)
+            time.sleep(interval)
+            if stopping or daemon.healthy():
+                failures, backoff = 0, 1.0
+                continue
+            failures += 1
+            if failures < FAILURES_BEFORE_RESTART:
+                continue
+            print(f"⚠️ Browser on port {daemon.port} is not answering; restarting")
+            daemon.stop()
+            try:
+                daemon.start()
+                state["restarts"] += 1
+                failures = 0
+            except RuntimeError as e:
+                print(f"❌ Restart failed: {e}; retrying in {backoff:.0f}s")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+    finally:
+        daemon.stop()
+        with contextlib.suppress(OSError):
+            os.remove(state_path(daemon.port))
+        print("🛑 Browser daemon stopped")
+
+
+def window_for_target(driver, target_id):
+    """WebDriver window handle of a DevTools target (ChromeDriver uses target ids as handles)"""
+    for handle in driver.window_handles:
+        if handle == target_id or handle.endswith(target_id):
+            return handle
+    raise RuntimeError(f"Target {target_id} has no WebDriver window")
+
+
+@contextlib.contextmanager
+def attach_browser(port=DEFAULT_PORT, isolated=True, offline=False, options=None):
+    """WebDriver attached to the daemon's browser, in a new browser context for this run
+
+    The context (with its cookies and storage) is disposed on exit; the browser keeps running.
+    `options` may carry capabilities (e.g. logging prefs); browser flags belong to the daemon.
+    """
+    info = devtools_version(port)
+    if not info:
+        raise RuntimeError(f"No browser daemon answering on port {port}")
+    devtools = DevToolsBrowser(info["webSocketDebuggerUrl"])
+    context_id = target_id = driver = None
+    try:
+        if isolated:
+            context_id = devtools.call("Target.createBrowserContext", disposeOnDetach=False)["browserContextId"]
+            target_id = devtools.call("Target.createTarget", url="about:blank", browserContextId=context_id)["targetId"]
+        else:
+            target_id = devtools.call("Target.createTarget", url="about:blank")["targetId"]
+
+        options = options or webdriver.ChromeOptions()
+        options.debugger_address = f"127.0.0.1:{port}"
+        driver = webdriver.Chrome(service=driver_service(offline=offline), options=options)
+        driver.switch_to.window(window_for_target(driver, target_id))
+        cold_start.mark("browser attached")
+        yield driver
+    finally:
+        if driver:
+            driver.quit()  # Ends the ChromeDriver session only; an attached browser is left running
+        with contextlib.suppress(Exception):
+            if context_id:
+                devtools.call("Target.disposeBrowserContext", browserContextId=context_id)
+            elif target_id:
+                devtools.call("Target.closeTarget", targetId=target_id)
+        devtools.close()
+
+
+def print_status(port):
+    info = devtools_version(port)
+    state = read_state(port)
+    if state:
+        print(f"🧭 Supervisor pid {state['supervisor_pid']}, Chrome pid {state.get('chrome_pid')}, "
+              f"started {state['started_at']}, {state['restarts']} restarts, last check {state.get('checked_at')}")
+    if not info:
+        print(f"❌ No browser answering on port {port}")
+        return False
+    devtools = DevToolsBrowser(info["webSocketDebuggerUrl"])
+    try:
+        contexts = devtools.call("Target.getBrowserContexts").get("browserContextIds", [])
+        targets = devtools.call("Target.getTargets").get("targetInfos", [])
+    finally:
+        devtools.close()
+    print(f"✅ {info.get('Browser')} on port {port}: {len(contexts)} run contexts, "
+          f"{sum(1 for target in targets if target.get('type') == 'page')} pages")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["start", "status", "stop"])
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--chrome", help="Chrome binary (default: found on PATH)")
+    parser.add_argument("--profile", help="profile directory (default: under the daemon state directory)")
+    parser.add_argument("--interval", type=float, default=HEALTH_INTERVAL, help="seconds between health checks")
+    args = parser.parse_args()
+
+    if args.command == "start":
+        if devtools_version(args.port):
+            print(f"❌ Something is already answering on port {args.port}")
+            return 1
+        supervise(BrowserDaemon(args.port, args.chrome, args.profile), args.interval)
+    elif args.command == "status":
+        return 0 if print_status(args.port) else 1
+    else:
+        state = read_state(args.port)
+        if not state:
+            print(f"❌ No supervisor recorded for port {args.port}")
+            return 1
+        try:
+            os.kill(state["supervisor_pid"], signal.SIGTERM)
+        except ProcessLookupError:
+            # The supervisor died without cleaning up (crash, reboot); its state is stale
+            print(f"⚠️ Supervisor pid {state['supervisor_pid']} is not running; removing stale {state_path(args.port)}")
+            with contextlib.suppress(OSError):
+                os.remove(state_path(args.port))
+            return 1
+        print(f"🛑 Stop requested (supervisor pid {state['supervisor_pid']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""
+WebDriver Provisioning
+======================
+Resolves the chromedriver binary once per installed Chrome major version and
+keeps it in a local cache, so a run does not have to reach the network for a
+driver before scraping starts, and keeps working offline.
+
+Resolution order:
+1. the cached driver for the installed Chrome major version
+2. $CHROMEDRIVER or a chromedriver on PATH whose major version matches Chrome
+3. a webdriver-manager download (skipped offline), copied into the cache
+4. Selenium Manager (selenium >= 4.6), which keeps its own cache
+
+`cold_start` records the time from process launch to the first page loaded,
+split into the steps in between:
+
+    python driver_provisioning.py             # resolve and cache the driver, print timings
+    python driver_provisioning.py --offline   # never download
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+
+from selenium.webdriver.chrome.service import Service
+
+CACHE_DIR = os.environ.get(
+    "CHROMEDRIVER_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "chromedriver-cache")
+)
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+\.\d+")
+CHROME_CANDIDATES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+WINDOWS_VERSION_KEYS = [
+    r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon",
+    r"HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon",
+]
+DRIVER_NAME = "chromedriver.exe" if sys.platform == "win32" else "chromedriver"
+
+
+def process_start_time():
+    """Epoch time this process was launched, or None when it cannot be told"""
+    try:
+        import psutil
+        return psutil.Process().create_time()
+    except Exception:
+        pass
+    try:
+        # Linux: field 22 of /proc/self/stat is the start time in clock ticks after boot
+        with open("/proc/self/stat") as f:
+            ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/stat") as f:
+            boot_time = next(int(line.split()[1]) for line in f if line.startswith("btime"))
+        return boot_time + ticks / os.sysconf("SC_CLK_TCK")
+    except Exception:
+        return None
+
+
+class ColdStart:
+    """Timestamps of the steps from process launch to the first page loaded"""
+
+    def __init__(self):
+        self.launched = process_start_time() or time.time()
+        self.marks = {}
+
+    def mark(self, label):
+        """Record a step the first time it happens"""
+        self.marks.setdefault(label, time.time())
+
+    def elapsed(self, label):
+        return self.marks[label] - self.launched if label in self.marks else None
+
+    def summary(self):
+        """e.g. 'Cold start 3.1s: driver resolved +0.9s, browser started +1.8s, first page loaded +0.4s'"""
+        steps, previous = [], self.launched
+        for label, timestamp in sorted(self.marks.items(), key=lambda item: item[1]):
+            steps.append(f"{label} +{timestamp - previous:.1f}s")
+            previous = timestamp
+        return f"Cold start {previous - self.launched:.1f}s: " + ", ".join(steps)
+
+    def as_dict(self):
+        return {label: round(self.elapsed(label), 3) for label in self.marks}
+
+
+cold_start = ColdStart()
+
+
+def binary_version(path):
+    """Full version string printed by `path --version`, or None"""
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=15).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+def chrome_version(binary=None):
+    """Installed Chrome version (e.g. '128.0.6613.84'), or None"""
+    if sys.platform == "win32" and not binary:
+        for key in WINDOWS_VERSION_KEYS:
+            try:
+                output = subprocess.run(["reg", "query", key, "/v", "version"],
+                                        capture_output=True, text=True, timeout=15).stdout
+            except (OSError, subprocess.SubprocessError):
+                continue
+            match = VERSION_PATTERN.search(output)
+            if match:
+                return match.group(0)
+        return None
+    for candidate in [binary] if binary else CHROME_CANDIDATES:
+        path = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+        if path and os.path.exists(path):
+            version = binary_version(path)
+            if version:
+                return version
+    return None
+
+
+def major_version(version):
+    return version.split(".")[0] if version else None
+
+
+class DriverCache:
+    """chromedriver binaries by Chrome major version: <cache>/<major>/chromedriver + manifest.json"""
+
+    def __init__(self, path=CACHE_DIR):
+        self.path = path
+        self.manifest_path = os.path.join(path, "manifest.json")
+
+    def manifest(self):
+        try:
+            with open(self.manifest_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, major):
+        entry = self.manifest().get(str(major))
+        if entry and os.path.isfile(entry["path"]) and os.access(entry["path"], os.X_OK):
+            return entry["path"]
+        return None
+
+    def put(self, major, driver_path, source):
+        """Copy a driver into the cache (atomically, so parallel runs can share it); returns the cached path"""
+        directory = os.path.join(self.path, str(major))
+        os.makedirs(directory, exist_ok=True)
+        target = os.path.join(directory, DRIVER_NAME)
+        temp_target = f"{target}.{os.getpid()}.tmp"
+        shutil.copy2(driver_path, temp_target)
+        os.chmod(temp_target, 0o755)
+        os.replace(temp_target, target)
+
+        manifest = self.manifest()
+        manifest[str(major)] = {"path": target, "version": binary_version(target), "source": source,
+                                "cached_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+        temp_manifest = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(temp_manifest, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_manifest, self.manifest_path)
+        return target
+
+
+def resolve_driver(offline=False, chrome_binary=None, cache=None):
+    """(chromedriver path or None, where it came from); None leaves it to Selenium Manager"""
+    cache = cache or DriverCache()
+    major = major_version(chrome_version(chrome_binary))
+
+    if major:
+        cached = cache.get(major)
+        if cached:
+            return cached, "cache"
+
+    for local in (os.environ.get("CHROMEDRIVER"), shutil.which("chromedriver")):
+        if local and os.path.isfile(local) and major_version(binary_version(local)) == major:
+            return (cache.put(major, local, "local") if major else local), "local"
+
+    if not offline and major:
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            downloaded = ChromeDriverManager().install()
+            return cache.put(major, downloaded, "webdriver-manager"), "webdriver-manager"
+        except Exception as e:
+            print(f"⚠️ webdriver-manager could not provide a driver ({e}); using Selenium Manager")
+
+    return None, "selenium-manager"
+
+
+def driver_service(offline=False, chrome_binary=None):
+    """Chrome Service for the resolved driver (Selenium Manager picks one when none is found)"""
+    path, source = resolve_driver(offline, chrome_binary)
+    cold_start.mark("driver resolved")
+    print(f"🧰 ChromeDriver: {path or 'resolved by Selenium Manager'} ({source})")
+    return Service(path) if path else Service()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--offline", action="store_true", help="never download a driver")
+    parser.add_argument("--chrome", help="Chrome binary (default: found on PATH)")
+    parser.add_argument("--launch", action="store_true", help="also start headless Chrome and load about:blank")
+    args = parser.parse_args()
+
+    version = chrome_version(args.chrome)
+    print(f"🌐 Chrome: {version or 'not found'}")
+    print(f"📦 Cache: {CACHE_DIR}")
+    service = driver_service(offline=args.offline, chrome_binary=args.chrome)
+    if args.launch:
+        from selenium import webdriver
+        options = webdriver.ChromeOptions()
+        options.add_argument("--headless")
+        driver = webdriver.Chrome(service=service, options=options)
+        cold_start.mark("browser started")
+        driver.get("about:blank")
+        cold_start.mark("first page loaded")
+        driver.quit()
+    print(f"⏱️ {cold_start.summary()}")
+
+
+if __name__ == "__main__":
+    main()
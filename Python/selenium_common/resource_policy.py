@@ -0,0 +1,125 @@
+"""
+Resource Blocking Policy
+========================
+Blocks page resources the scrapers do not need (images, fonts, media,
+analytics, and for some sites stylesheets) through the Chrome DevTools
+Protocol (`Network.setBlockedURLs`) instead of Chrome flags, several of which
+(`--disable-images`, `--disable-plugins`) are not real switches.
+
+Resource types are blocked by URL pattern (file extensions), so a policy is a
+list of URL patterns per site. `ResourceCounters` reads Chrome's performance
+log to count blocked and loaded requests per resource type and the bytes that
+were actually transferred. Blocked requests never reach the network, so the
+bytes they would have cost are not known; only their number is.
+"""
+import json
+from collections import Counter
+
+TYPE_EXTENSIONS = {
+    "Image": ["png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "bmp"],
+    "Font": ["woff", "woff2", "ttf", "otf", "eot"],
+    "Media": ["mp4", "webm", "ogg", "mp3", "wav"],
+    "Stylesheet": ["css"],
+}
+ANALYTICS_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+]
+PERFORMANCE_LOG_PREFS = {"performance": "ALL"}
+
+
+class ResourcePolicy:
+    """Named set of blocked resource types and URL patterns"""
+
+    def __init__(self, name, block_types=(), block_urls=()):
+        unknown = set(block_types) - set(TYPE_EXTENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown resource types: {', '.join(sorted(unknown))}")
+        self.name = name
+        self.block_types = tuple(block_types)
+        self.block_urls = tuple(block_urls)
+
+    def url_patterns(self):
+        """Patterns for Network.setBlockedURLs (with and without a query string)"""
+        patterns = []
+        for resource_type in self.block_types:
+            for extension in TYPE_EXTENSIONS[resource_type]:
+                patterns += [f"*.{extension}", f"*.{extension}?*"]
+        return patterns + list(self.block_urls)
+
+    def apply(self, driver):
+        """Start blocking in the driver's current page target"""
+        patterns = self.url_patterns()
+        if not patterns:
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+    def describe(self):
+        parts = list(self.block_types) + (["analytics"] if set(ANALYTICS_PATTERNS) <= set(self.block_urls) else [])
+        return f"{self.name} (blocking {', '.join(parts) or 'nothing'})"
+
+
+POLICIES = {
+    "none": ResourcePolicy("none"),
+    # Stylesheets stay on: facebox visibility waits depend on computed styles
+    "mphc": ResourcePolicy("mphc", ["Image", "Font", "Media"], ANALYTICS_PATTERNS),
+    # Only the results table and the pager text are read
+    "pib": ResourcePolicy("pib", ["Image", "Font", "Media", "Stylesheet"], ANALYTICS_PATTERNS),
+}
+
+
+def enable_performance_log(options):
+    """Ask ChromeDriver for the performance log the counters are read from"""
+    options.set_capability("goog:loggingPrefs", PERFORMANCE_LOG_PREFS)
+    return options
+
+
+class ResourceCounters:
+    """Blocked and loaded requests per resource type, from drained performance log entries"""
+
+    def __init__(self):
+        self.blocked = Counter()
+        self.loaded = Counter()
+        self.loaded_bytes = Counter()
+        self._types = {}
+
+    def collect(self, driver):
+        """Drain the driver's performance log into the counters (no-op when it is not enabled)"""
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            return
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method, params = message.get("method"), message.get("params", {})
+            request_id = params.get("requestId")
+            if method == "Network.requestWillBeSent":
+                self._types[request_id] = params.get("type", "Other")
+            elif method == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+                self.blocked[self._types.pop(request_id, params.get("type", "Other"))] += 1
+            elif method == "Network.loadingFailed":
+                self._types.pop(request_id, None)
+            elif method == "Network.loadingFinished":
+                resource_type = self._types.pop(request_id, "Other")
+                self.loaded[resource_type] += 1
+                self.loaded_bytes[resource_type] += int(params.get("encodedDataLength", 0))
+
+    def as_dict(self):
+        return {
+            "blocked_requests": sum(self.blocked.values()),
+            "loaded_requests": sum(self.loaded.values()),
+            "loaded_bytes": sum(self.loaded_bytes.values()),
+            "blocked_by_type": dict(self.blocked),
+        }
+
+    def summary(self):
+        blocked = ", ".join(f"{resource_type} {count}" for resource_type, count in self.blocked.most_common())
+        return (f"Blocked {sum(self.blocked.values())} requests ({blocked or 'none'}); "
+                f"loaded {sum(self.loaded.values())} requests, "
+                f"{sum(self.loaded_bytes.values()) / 1024 / 1024:.1f} MB transferred")